@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Input backends
+Interfață comună pentru injectarea de input (mouse/tastatură) și
+implementările disponibile: pyautogui, pynput, XTest (X11) și null.
+
+Fiecare backend își rezolvă singur tastele și butoanele (resolve_key /
+resolve_button), astfel încât ExecutionPlan conține deja obiectele native
+ale backend-ului și redarea nu mai face conversii per eveniment.
+"""
+
+import os
+import sys
+
+
+DEFAULT_BACKEND = 'pyautogui'
+BACKEND_ENV_VAR = 'BEBE_INPUT_BACKEND'
+
+
+class InputBackend:
+    """Interfața unui backend de injectare"""
+
+    name = 'base'
+
+    def resolve_key(self, key_name):
+        """Nume canonic ('enter', 'a', 'f4') -> obiect nativ al backend-ului"""
+        raise NotImplementedError
+
+    def resolve_button(self, button_name):
+        """'left' / 'right' / 'middle' -> obiect nativ al backend-ului"""
+        raise NotImplementedError
+
+    def move(self, x, y):
+        raise NotImplementedError
+
+    def button(self, button, pressed):
+        raise NotImplementedError
+
+    def scroll(self, dy):
+        """dy = pași de scroll înregistrați (pozitiv = sus)"""
+        raise NotImplementedError
+
+    def key(self, key, pressed):
+        raise NotImplementedError
+
+    def flush(self):
+        """Trimite cererile acumulate (apelat o dată per tick de redare)"""
+
+    def close(self):
+        pass
+
+
+class _PynputKeyboardMixin:
+    """Tastatură prin pynput.keyboard.Controller (comună pyautogui/pynput)"""
+
+    def _init_keyboard(self):
+        from pynput.keyboard import Key, Controller as KeyboardController
+        self.keyboard_controller = KeyboardController()
+        self._special_keys = {
+            'space': Key.space, 'enter': Key.enter,
+            'tab': Key.tab, 'backspace': Key.backspace,
+            'esc': Key.esc,
+            'shift': Key.shift, 'ctrl': Key.ctrl,
+            'alt': Key.alt, 'up': Key.up,
+            'down': Key.down, 'left': Key.left,
+            'right': Key.right, 'delete': Key.delete,
+            'home': Key.home, 'end': Key.end,
+            'page_up': Key.page_up, 'page_down': Key.page_down,
+            'insert': Key.insert, 'caps_lock': Key.caps_lock,
+            'num_lock': Key.num_lock, 'scroll_lock': Key.scroll_lock,
+            'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
+            'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
+            'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
+        }
+
+    def resolve_key(self, key_name):
+        # Caracter simplu sau nume necunoscut: pynput acceptă string-ul direct
+        return self._special_keys.get(key_name, key_name)
+
+    def key(self, key, pressed):
+        if pressed:
+            self.keyboard_controller.press(key)
+        else:
+            self.keyboard_controller.release(key)
+
+
+class PyAutoGUIBackend(_PynputKeyboardMixin, InputBackend):
+    """
+    Mouse prin pyautogui, tastatură prin pynput (comportamentul clasic).
+
+    Apelurile folosesc _pause=False: pyautogui.PAUSE adăuga implicit o pauză
+    după fiecare apel de mouse, limitând redarea la ~100 evenimente/s.
+    """
+
+    name = 'pyautogui'
+
+    def __init__(self):
+        import pyautogui
+        pyautogui.FAILSAFE = True
+        self._pyautogui = pyautogui
+        self._init_keyboard()
+
+    def resolve_button(self, button_name):
+        return button_name
+
+    def move(self, x, y):
+        self._pyautogui.moveTo(x, y, duration=0, _pause=False)
+
+    def button(self, button, pressed):
+        if pressed:
+            self._pyautogui.mouseDown(button=button, _pause=False)
+        else:
+            self._pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, dy):
+        self._pyautogui.scroll(int(dy * 100), _pause=False)
+
+
+class PynputBackend(_PynputKeyboardMixin, InputBackend):
+    """Mouse și tastatură prin pynput (fără overhead-ul pyautogui)"""
+
+    name = 'pynput'
+
+    def __init__(self):
+        from pynput.mouse import Button, Controller as MouseController
+        self.mouse_controller = MouseController()
+        self._buttons = {'left': Button.left, 'right': Button.right, 'middle': Button.middle}
+        self._init_keyboard()
+
+    def resolve_button(self, button_name):
+        return self._buttons.get(button_name, self._buttons['middle'])
+
+    def move(self, x, y):
+        self.mouse_controller.position = (x, y)
+
+    def button(self, button, pressed):
+        if pressed:
+            self.mouse_controller.press(button)
+        else:
+            self.mouse_controller.release(button)
+
+    def scroll(self, dy):
+        self.mouse_controller.scroll(0, dy)
+
+
+# Nume canonice BEBE -> nume keysym X11
+X11_KEYSYM_NAMES = {
+    'space': 'space', 'enter': 'Return', 'tab': 'Tab', 'backspace': 'BackSpace',
+    'esc': 'Escape', 'shift': 'Shift_L', 'ctrl': 'Control_L', 'alt': 'Alt_L',
+    'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+    'delete': 'Delete', 'home': 'Home', 'end': 'End',
+    'page_up': 'Prior', 'page_down': 'Next', 'insert': 'Insert',
+    'caps_lock': 'Caps_Lock', 'num_lock': 'Num_Lock', 'scroll_lock': 'Scroll_Lock',
+    'f1': 'F1', 'f2': 'F2', 'f3': 'F3', 'f4': 'F4', 'f5': 'F5', 'f6': 'F6',
+    'f7': 'F7', 'f8': 'F8', 'f9': 'F9', 'f10': 'F10', 'f11': 'F11', 'f12': 'F12',
+}
+
+
+class XTestBackend(InputBackend):
+    """
+    Injectare directă prin extensia XTest (python-xlib).
+
+    Cererile se acumulează în bufferul conexiunii X și sunt trimise o singură
+    dată per tick, la flush(), fără round-trip către server per eveniment.
+    """
+
+    name = 'xtest'
+
+    def __init__(self, display_name=None):
+        from Xlib import X, XK, display as xdisplay
+        from Xlib.ext import xtest
+        self._X = X
+        self._XK = XK
+        self._fake_input = xtest.fake_input
+        self.display = xdisplay.Display(display_name)
+        if not self.display.has_extension('XTEST'):
+            self.display.close()
+            raise RuntimeError("Serverul X nu are extensia XTEST")
+        self._shift_keycode = self.display.keysym_to_keycode(XK.string_to_keysym('Shift_L'))
+
+    def _keysym(self, key_name):
+        keysym = self._XK.string_to_keysym(X11_KEYSYM_NAMES.get(key_name, key_name))
+        if keysym == 0 and len(key_name) == 1:
+            # Keysym-urile Latin-1 coincid cu codepoint-ul, restul Unicode au prefix 0x01000000
+            code = ord(key_name)
+            keysym = code if code < 0x100 else 0x01000000 + code
+        return keysym
+
+    def resolve_key(self, key_name):
+        """-> (keycode, necesită_shift); keycode 0 = tastă inexistentă pe layout"""
+        keysym = self._keysym(key_name)
+        keycode = self.display.keysym_to_keycode(keysym) if keysym else 0
+        needs_shift = bool(keycode) and self.display.keycode_to_keysym(keycode, 0) != keysym
+        return (keycode, needs_shift)
+
+    def resolve_button(self, button_name):
+        return {'left': 1, 'middle': 2, 'right': 3}.get(button_name, 2)
+
+    def move(self, x, y):
+        self._fake_input(self.display, self._X.MotionNotify, x=x, y=y)
+
+    def button(self, button, pressed):
+        event_type = self._X.ButtonPress if pressed else self._X.ButtonRelease
+        self._fake_input(self.display, event_type, button)
+
+    def scroll(self, dy):
+        button = 4 if dy > 0 else 5
+        for _ in range(abs(int(dy))):
+            self._fake_input(self.display, self._X.ButtonPress, button)
+            self._fake_input(self.display, self._X.ButtonRelease, button)
+
+    def key(self, key, pressed):
+        keycode, needs_shift = key
+        if not keycode:
+            return
+        X = self._X
+        if pressed:
+            if needs_shift:
+                self._fake_input(self.display, X.KeyPress, self._shift_keycode)
+            self._fake_input(self.display, X.KeyPress, keycode)
+        else:
+            self._fake_input(self.display, X.KeyRelease, keycode)
+            if needs_shift:
+                self._fake_input(self.display, X.KeyRelease, self._shift_keycode)
+
+    def flush(self):
+        self.display.flush()
+
+    def close(self):
+        self.display.close()
+
+
+class NullBackend(InputBackend):
+    """Backend fără efect - pentru teste/benchmark; opțional păstrează apelurile"""
+
+    name = 'null'
+
+    def __init__(self, record=False):
+        self.record = record
+        self.calls = []
+        self.count = 0
+        self.flushes = 0
+
+    def resolve_key(self, key_name):
+        return key_name
+
+    def resolve_button(self, button_name):
+        return button_name
+
+    def _call(self, *call):
+        self.count += 1
+        if self.record:
+            self.calls.append(call)
+
+    def move(self, x, y):
+        self._call('move', x, y)
+
+    def button(self, button, pressed):
+        self._call('button', button, pressed)
+
+    def scroll(self, dy):
+        self._call('scroll', dy)
+
+    def key(self, key, pressed):
+        self._call('key', key, pressed)
+
+    def flush(self):
+        self.flushes += 1
+
+
+BACKENDS = {
+    'pyautogui': PyAutoGUIBackend,
+    'pynput': PynputBackend,
+    'xtest': XTestBackend,
+    'null': NullBackend,
+}
+
+
+def default_backend_name():
+    """Backend-ul configurat prin BEBE_INPUT_BACKEND (implicit pyautogui)"""
+    name = os.environ.get(BACKEND_ENV_VAR, DEFAULT_BACKEND).strip().lower()
+    if name == 'xtest' and sys.platform == 'win32':
+        return DEFAULT_BACKEND
+    return name if name in BACKENDS else DEFAULT_BACKEND
+
+
+def create_backend(name=None, **kwargs):
+    """Creează backend-ul cerut (sau cel implicit)"""
+    name = name or default_backend_name()
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Backend de input necunoscut: {name} (disponibile: {', '.join(BACKENDS)})")
+    return backend_class(**kwargs)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Launcher
+Fără argumente pornește interfața grafică; cu argumente rulează CLI-ul
+(list/info nu încarcă Tk, pyautogui sau pynput).
+
+Exemple:  python bebe.py
+          python bebe.py list
+          python bebe.py info tasks/demo.json
+          python bebe.py play tasks/demo.json --speed 1.0
+          python bebe.py daemon          (programările fără GUI)
+          python bebe.py ctl status
+"""
+
+import sys
+
+
+def main():
+    if len(sys.argv) > 1:
+        from bebe_cli import main as cli_main
+        cli_main()
+        return
+    import bebe_gui
+    bebe_gui.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - CLI
+Comenzi în linie de comandă. `list` și `info` folosesc doar task_io și
+indexul task_library (fără Tk, pyautogui, pynput), deci pornesc rapid și
+pe un sistem fără display;
+modulele de redare sunt importate abia la `play` / `daemon`
+(`ctl` vorbește doar HTTP cu daemon-ul).
+"""
+
+import sys
+import argparse
+import itertools
+from pathlib import Path
+
+import task_io
+
+try:
+    from i18n import get_string
+except ImportError:
+    def get_string(key, **kwargs):
+        return key
+
+
+def _fix_console_encoding():
+    """Emoji în consola Windows (doar dacă nu e executabil PyInstaller)"""
+    if sys.platform == 'win32' and not getattr(sys, 'frozen', False):
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.reconfigure(encoding='utf-8')
+            except (AttributeError, ValueError):
+                pass
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="bebe",
+        description="BEBE Task Recorder - CLI Mode",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    # Play command
+    play_parser = subparsers.add_parser('play', help='Play a task file')
+    play_parser.add_argument('file', help='Task file path (.json / .bebt / .jsonl / .bebz)')
+    play_parser.add_argument('--speed', type=float, default=2.0,
+                             help='Playback speed (0.1-10.0)')
+    play_parser.add_argument('--loop', type=int, default=1,
+                             help='Number of repetitions')
+
+    # List command
+    list_parser = subparsers.add_parser('list', help='List saved tasks')
+    list_parser.add_argument('--dir', default=str(task_io.DEFAULT_TASKS_DIR),
+                             help='Tasks directory')
+
+    # Info command
+    info_parser = subparsers.add_parser('info', help='Show task info')
+    info_parser.add_argument('file', help='Task file path (.json / .bebt / .jsonl / .bebz)')
+    info_parser.add_argument('--dir', default=str(task_io.DEFAULT_TASKS_DIR),
+                             help='Tasks directory (its index is used for files inside it)')
+
+    # Export BAT command
+    export_parser = subparsers.add_parser('export-bat',
+                                          help='Export task as BAT file')
+    export_parser.add_argument('file', help='Task file path (.json / .bebt / .jsonl / .bebz)')
+    export_parser.add_argument('--output', help='Output BAT file path')
+    export_parser.add_argument('--schedule', action='store_true',
+                               help='Include scheduling commands')
+
+    # Export EXE: runner-ul comun din cache + task-ul alături (<nume>.bebetask)
+    export_exe_parser = subparsers.add_parser('export-exe',
+                                              help='Export task as executable (+ .bebetask next to it)')
+    export_exe_parser.add_argument('file', help='Task file path (.json / .bebt / .jsonl / .bebz)')
+    export_exe_parser.add_argument('--output', help='Output executable path')
+
+    # Convert command (JSON / binar / JSON-Lines, după extensie)
+    convert_parser = subparsers.add_parser('convert',
+                                           help='Convert a task between .json, .bebt, .jsonl and .bebz')
+    convert_parser.add_argument('source', help='Source task file')
+    convert_parser.add_argument('target', help='Target file (.json, .bebt, .jsonl or .bebz)')
+
+    # Daemon: scheduler + player fără GUI, controlat prin `ctl`
+    daemon_parser = subparsers.add_parser('daemon',
+                                          help='Run scheduled tasks headless (control with `ctl`)')
+    daemon_parser.add_argument('--dir', default=str(task_io.DEFAULT_TASKS_DIR),
+                               help='Tasks directory')
+    daemon_parser.add_argument('--port', type=int, default=None,
+                               help='Control API port on 127.0.0.1 (0 = any free port)')
+
+    ctl_parser = subparsers.add_parser('ctl', help='Control a running daemon')
+    ctl_parser.add_argument('action',
+                            choices=['status', 'tasks', 'history', 'enqueue', 'pause', 'resume',
+                                     'stop', 'reload', 'shutdown'])
+    ctl_parser.add_argument('task', nargs='?', help='Task name (for enqueue)')
+    ctl_parser.add_argument('--clear-queue', action='store_true',
+                            help='With stop: also drop queued tasks')
+    ctl_parser.add_argument('--dir', default=str(task_io.DEFAULT_TASKS_DIR),
+                            help='Tasks directory of the daemon')
+    return parser
+
+
+def main(argv=None):
+    """Punctul de intrare CLI (argv implicit: sys.argv[1:])"""
+    _fix_console_encoding()
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'play':
+        play_task_cli(args.file, args.speed, args.loop)
+    elif args.command == 'list':
+        list_tasks_cli(args.dir)
+    elif args.command == 'info':
+        show_task_info_cli(args.file, args.dir)
+    elif args.command == 'export-bat':
+        export_bat_cli(args.file, args.output, args.schedule)
+    elif args.command == 'export-exe':
+        export_exe_cli(args.file, args.output)
+    elif args.command == 'convert':
+        convert_task_cli(args.source, args.target)
+    elif args.command == 'daemon':
+        daemon_cli(args.dir, args.port)
+    elif args.command == 'ctl':
+        ctl_cli(args.dir, args.action, args.task, args.clear_queue)
+
+
+def _print_progress(progress):
+    """Linie de progres pentru CLI (apelată din ProgressSampler)"""
+    if progress.error:
+        print(f"  {progress.error}")
+    else:
+        print(f"  {get_string('progress_playing', current=progress.index, total=progress.total, percent=progress.percent())}")
+
+
+def play_task_cli(filepath, speed, loop_count):
+    """Play task from CLI"""
+    try:
+        # Import întârziat: player-ul încarcă backend-ul de input (pyautogui/pynput)
+        from player import TaskPlayer
+        from progress import ProgressSampler
+
+        from task_jsonl import open_task_stream
+
+        # Evenimentele sunt citite în flux: redarea începe imediat, iar
+        # memoria nu depinde de mărimea task-ului (fișierul e recitit la fiecare loop)
+        meta, events = open_task_stream(filepath)
+        first = next(events, None)
+        if first is None:
+            print(f"❌ No events in {filepath}")
+            return
+        total = meta.get('event_count', 0)
+
+        print(f"▶️  Playing {total or 'streamed'} events at {speed}x speed, {loop_count} time(s)")
+
+        # Primul loop continuă fluxul deja deschis, următoarele redeschid fișierul
+        pending = [itertools.chain((first,), events)]
+
+        def open_stream():
+            return pending.pop() if pending else open_task_stream(filepath)[1]
+
+        player = TaskPlayer()
+        # Progresul e tipărit de un thread separat, la cel mult 10 linii/s
+        sampler = ProgressSampler(player.progress, _print_progress)
+        sampler.start()
+        try:
+            player.play_stream(open_stream, total=total, speed=speed, loop_count=loop_count)
+        finally:
+            sampler.stop()
+
+        print("✅ Playback complete!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+def list_tasks_cli(tasks_dir=task_io.DEFAULT_TASKS_DIR):
+    """List all saved tasks"""
+    tasks_dir = Path(tasks_dir)
+    if not tasks_dir.exists():
+        print("📁 No tasks directory found")
+        return
+
+    # Indexul SQLite evită citirea fișierelor nemodificate de la ultima listare
+    from task_library import TaskLibrary
+    with TaskLibrary(tasks_dir) as library:
+        library.refresh()
+        tasks = library.list_tasks()
+    if not tasks:
+        print("📝 No saved tasks")
+        return
+
+    print(f"\n📋 Found {len(tasks)} task(s):\n")
+
+    for task in tasks:
+        if task['error']:
+            print(f"  • {task['path'].name}  (⚠️ {task['error']})")
+        else:
+            print(f"  • {task['path'].name}  ({task['event_count']} events, {task['duration']:.1f}s)")
+    print()
+
+
+def show_task_info_cli(filepath, tasks_dir=task_io.DEFAULT_TASKS_DIR):
+    """Show task information"""
+    try:
+        from task_library import task_info
+        stats = task_info(filepath, tasks_dir)
+
+        print(f"\n📊 Task Info: {Path(filepath).stem}")
+        print("=" * 50)
+        print(f"Events: {stats['event_count']}")
+        print(f"Duration: {stats['duration']:.2f}s")
+        print(f"Created: {stats['created'] or 'Unknown'}")
+        if stats['type_counts']:
+            types = ', '.join(f"{name}={count}" for name, count in sorted(stats['type_counts'].items()))
+            print(f"Types: {types}")
+        if stats['bbox']:
+            print(f"Screen area: ({stats['bbox'][0]}, {stats['bbox'][1]}) - ({stats['bbox'][2]}, {stats['bbox'][3]})")
+
+        if stats['schedule']:
+            print(f"Schedule: {stats['schedule']}")
+
+        if stats['playback']:
+            pb = stats['playback']
+            print(f"Playback: Speed={pb.get('speed', 1.0)}x, "
+                  f"Loop={pb.get('loop', False)}")
+        print()
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+def convert_task_cli(source, target):
+    """Convert task format (JSON / .bebt / .jsonl / .bebz)"""
+    try:
+        if Path(target).suffix.lower() == '.jsonl':
+            # Conversie în flux, fără a încărca task-ul în memorie
+            from task_jsonl import convert_json_to_jsonl
+            count = convert_json_to_jsonl(source, target)
+            print(f"✅ Converted {source} -> {target} ({count} events)")
+            return
+        data = task_io.load_task(source)
+        task_io.save_task(target, data)
+        print(f"✅ Converted {source} -> {target} ({len(data['events'])} events)")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+def daemon_cli(tasks_dir, port):
+    """Run the headless scheduler daemon (blocks until `ctl shutdown` / Ctrl+C)"""
+    from bebe_daemon import run_daemon, DEFAULT_PORT
+    try:
+        run_daemon(tasks_dir, port=DEFAULT_PORT if port is None else port)
+    except OSError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+def ctl_cli(tasks_dir, action, task=None, clear_queue=False):
+    """Send a command to a running daemon"""
+    from bebe_daemon import DaemonClient, DaemonError
+    params = {}
+    if action == 'enqueue':
+        if not task:
+            print("❌ Error: enqueue needs a task name")
+            sys.exit(1)
+        params['task'] = task
+    elif action == 'stop':
+        params['clear_queue'] = clear_queue
+    try:
+        result = DaemonClient(tasks_dir).call(action, **params)
+    except DaemonError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if action == 'status':
+        state = "paused" if result['paused'] else ("playing" if result['playing'] else "idle")
+        print(f"\n🤖 BEBE daemon (pid {result['pid']}, up {result['uptime']:.0f}s): {state}")
+        if result['task']:
+            progress = result['progress']
+            print(f"  Task: {result['task']} - {progress['index']}/{progress['total']} ({progress['percent']}%)")
+        print(f"  Scheduled: {result['scheduled']}, queued: {', '.join(result['pending']) or '-'}")
+        latency = result['trigger_latency_ms']
+        if latency['count']:
+            print(f"  Trigger latency: mean {latency['mean']:.1f}ms, max {latency['max']:.1f}ms")
+        print()
+    elif action == 'tasks':
+        if not result:
+            print("📝 No scheduled tasks")
+            return
+        print(f"\n📅 {len(result)} scheduled task(s):\n")
+        for entry in result:
+            print(f"  • {entry['name']}  (next: {entry['next_run'] or 'never'}, "
+                  f"priority {entry['priority']}, {entry['overlap']})")
+        print()
+    elif action == 'history':
+        if not result:
+            print("📝 No runs recorded")
+            return
+        print(f"\n🕑 Last {len(result)} run(s):\n")
+        for run in result:
+            latency = f"{run['latency_ms']:.1f}ms late" if run['latency_ms'] is not None else "manual"
+            catch_up = ", catch-up" if run['catch_up'] else ""
+            print(f"  • {run['started'][:19]}  {run['name']}  {run['outcome']} ({latency}{catch_up})")
+        print()
+    else:
+        print(f"✅ {action}: {result}")
+
+
+def export_exe_cli(filepath, output=None):
+    """Export task as executable (the runner is built with PyInstaller only when its sources change)"""
+    try:
+        import time
+        from runner_build import export_task_executable, runner_suffix
+        data = task_io.load_task(filepath)
+        data.setdefault('name', Path(filepath).stem)
+        exe_path = Path(output) if output else Path(filepath).with_suffix(runner_suffix())
+        started = time.perf_counter()
+        payload = export_task_executable(exe_path, data)
+        print(f"✅ Exported to {exe_path} + {payload.name} in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+def export_bat_cli(filepath, output, include_schedule):
+    """Export task as BAT file"""
+    try:
+        # Implementation here
+        print(f"✅ Exported to {output or filepath.replace('.json', '.bat')}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
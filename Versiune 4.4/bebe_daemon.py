@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Headless daemon
+Scheduler-ul și player-ul fără Tk: task-urile din folderul tasks care au
+'schedule' rulează la fel ca din GUI (TaskScheduler, politici de overlap),
+iar daemon-ul e controlat printr-un API HTTP JSON pe 127.0.0.1.
+
+Serverul HTTP rulează pe thread-ul principal (o cerere odată, deci și
+indexul SQLite al bibliotecii rămâne pe un singur thread); între cereri
+biblioteca e rescanată la LIBRARY_RESCAN_INTERVAL. Portul și un token
+aleator sunt scrise în tasks/.bebe_daemon.json; cererile fără token sunt
+refuzate (o pagină web nu poate trimite comenzi la localhost).
+
+    GET  /status            redarea curentă, coada, latența scheduler-ului
+    GET  /tasks             task-urile programate și următoarea rulare
+    GET  /history           ultimele rulări (ScheduleStore): întârziere, rezultat
+    POST /enqueue {"task": nume}    rulează acum sau după redarea curentă
+    POST /pause, /resume
+    POST /stop {"clear_queue": bool}
+    POST /reload            rescanează biblioteca
+    POST /shutdown
+
+Exemple:  python bebe.py daemon
+          python bebe.py ctl status
+          python bebe.py ctl enqueue demo
+"""
+
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib import request as urlrequest
+from urllib.error import HTTPError, URLError
+
+import task_io
+from task_library import TaskLibrary
+from schedule_store import ScheduleStore, process_alive
+from task_scheduler import TaskScheduler, ScheduledTask, playback_loop_count
+from timing import TIMER_PRECISIONS, DEFAULT_TIMER_PRECISION
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 47821            # 0 = port liber ales de sistem
+STATE_FILENAME = '.bebe_daemon.json'
+TOKEN_HEADER = 'X-Bebe-Token'
+LIBRARY_RESCAN_INTERVAL = 30.0  # Secunde între rescanările bibliotecii
+POLL_INTERVAL = 0.5             # serve_forever: latența lui shutdown()
+DEFAULT_SPEED = 2.0             # Ca în GUI / CLI
+MAX_BODY = 64 * 1024
+HISTORY_LIMIT = 20
+PROBE_TIMEOUT = 1.0             # find_daemon: răspunsul la /status al unui daemon viu
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonError(Exception):
+    """Comandă invalidă sau daemon inaccesibil"""
+
+
+class BebeDaemon:
+    """
+    Executorul headless.
+
+    Args:
+        tasks_dir: Folderul cu task-uri (biblioteca)
+        host, port: Adresa API-ului de control
+        player: TaskPlayer existent (implicit unul nou, cu backend-ul implicit)
+    """
+
+    def __init__(self, tasks_dir=task_io.DEFAULT_TASKS_DIR, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 player=None):
+        if player is None:
+            # Import întârziat: player-ul încarcă backend-ul de input
+            from player import TaskPlayer
+            player = TaskPlayer()
+        self.tasks_dir = Path(tasks_dir)
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+        self.host = host
+        self.port = port
+        self.player = player
+        self.token = secrets.token_hex(16)
+        self.library = None
+        # Starea programărilor și istoricul, comune cu GUI-ul (același folder tasks)
+        self.store = ScheduleStore(self.tasks_dir)
+        self.task_scheduler = TaskScheduler(player, self._start_playback, store=self.store)
+        self.server = None
+        self._next_rescan = 0.0
+        self._playback_hotkeys = []
+        self.started = time.time()
+
+    # === Redare (fără Tk) ===
+
+    def _start_playback(self, task, plan, playback):
+        """Apelat de TaskScheduler: redarea rulează într-un thread, la final pornește coada"""
+        loop_count, run_until_stop = playback_loop_count(playback)
+        try:
+            speed = float(playback.get('speed', DEFAULT_SPEED))
+        except (TypeError, ValueError):
+            speed = DEFAULT_SPEED
+        timer_precision = playback.get('timer_precision', DEFAULT_TIMER_PRECISION)
+        if timer_precision not in TIMER_PRECISIONS:
+            timer_precision = DEFAULT_TIMER_PRECISION
+
+        def play_thread():
+            self._register_stop_keys()
+            try:
+                self.player.play_events(plan, speed=speed, loop_count=loop_count,
+                                        run_until_stop=run_until_stop,
+                                        timer_precision=timer_precision)
+            except Exception:
+                logger.exception(f"Playback of {task.name!r} failed")
+            finally:
+                self._unregister_stop_keys()
+                logger.info(f"Playback of {task.name!r} finished")
+                self.task_scheduler.playback_finished()
+
+        threading.Thread(target=play_thread, name="bebe-daemon-play", daemon=True).start()
+
+    def _register_stop_keys(self):
+        """ESC/F9 opresc redarea și fără GUI (ca în GUI, doar pe durata redării)"""
+        try:
+            from pynput.keyboard import Key
+            from hotkeys import get_hotkey_service
+            hotkeys = get_hotkey_service()
+            self._playback_hotkeys = [hotkeys.register(key, self.player.stop) for key in (Key.f9, Key.esc)]
+        except Exception as e:
+            logger.warning(f"Stop hotkeys unavailable: {e}")
+
+    def _unregister_stop_keys(self):
+        if self._playback_hotkeys:
+            from hotkeys import get_hotkey_service
+            hotkeys = get_hotkey_service()
+            for token in self._playback_hotkeys:
+                hotkeys.unregister(token)
+            self._playback_hotkeys = []
+
+    # === Biblioteca ===
+
+    def reload(self):
+        """Rescanează folderul tasks și actualizează programările; returnează numărul lor"""
+        self.library.refresh()
+        count = self.task_scheduler.sync_library(self.library)
+        self._next_rescan = time.monotonic() + LIBRARY_RESCAN_INTERVAL
+        return count
+
+    def _library_entry(self, name):
+        path = task_io.find_task_file(self.tasks_dir, name)
+        entry = self.library.get(path)
+        if entry is None:
+            raise DaemonError(f"Task not found: {name}")
+        if entry.get('error'):
+            raise DaemonError(f"Task {name!r} cannot be loaded: {entry['error']}")
+        return entry
+
+    # === Comenzi (thread-ul serverului) ===
+
+    def status(self):
+        progress = self.player.progress
+        running = self.task_scheduler.running_task
+        return {
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self.started, 1),
+            'playing': self.player.playing,
+            'paused': self.player.paused,
+            'task': running.name if running is not None else None,
+            'progress': {'index': progress.index, 'total': progress.total,
+                         'loop': progress.loop, 'percent': progress.percent(),
+                         'error': progress.error},
+            'pending': [task.name for task in self.task_scheduler.pending()],
+            'scheduled': len(self.task_scheduler.tasks()),
+            'trigger_latency_ms': self.task_scheduler.scheduler.latency_stats(),
+        }
+
+    def list_tasks(self):
+        result = []
+        for task, next_fire in self.task_scheduler.tasks():
+            result.append({'key': task.key, 'name': task.name, 'priority': task.priority,
+                           'overlap': task.overlap,
+                           'next_run': next_fire.isoformat(timespec='seconds') if next_fire else None})
+        return result
+
+    def history(self, limit=HISTORY_LIMIT):
+        return self.task_scheduler.history(limit)
+
+    def enqueue(self, name):
+        task = ScheduledTask.from_library_entry(self._library_entry(name))
+        return {'task': task.name, 'result': self.task_scheduler.enqueue(task)}
+
+    def pause(self):
+        self.player.pause()
+        return {'paused': self.player.paused}
+
+    def resume(self):
+        self.player.resume()
+        return {'paused': self.player.paused}
+
+    def stop(self, clear_queue=False):
+        if clear_queue:
+            self.task_scheduler.clear_pending()
+        was_playing = self.player.playing
+        self.player.stop()
+        return {'stopped': was_playing, 'pending': len(self.task_scheduler.pending())}
+
+    def handle(self, method, command, params):
+        """Execută o comandă API; returnează un obiect serializabil JSON"""
+        if method == 'GET':
+            if command == 'status':
+                return self.status()
+            if command in ('tasks', 'list'):
+                return self.list_tasks()
+            if command == 'history':
+                return self.history()
+        elif method == 'POST':
+            if command == 'enqueue':
+                name = params.get('task')
+                if not name:
+                    raise DaemonError("Missing 'task'")
+                return self.enqueue(name)
+            if command == 'pause':
+                return self.pause()
+            if command == 'resume':
+                return self.resume()
+            if command == 'stop':
+                return self.stop(bool(params.get('clear_queue', False)))
+            if command == 'reload':
+                return {'scheduled': self.reload()}
+            if command == 'shutdown':
+                # shutdown() așteaptă serve_forever: apelat din alt thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return {'shutdown': True}
+        raise DaemonError(f"Unknown command: {method} /{command}")
+
+    # === Server ===
+
+    @property
+    def state_path(self):
+        return self.tasks_dir / STATE_FILENAME
+
+    def serve_forever(self):
+        """Pornește scheduler-ul și API-ul; blochează până la /shutdown sau Ctrl+C"""
+        self.library = TaskLibrary(self.tasks_dir)
+        self.server = _DaemonServer((self.host, self.port), _DaemonHandler, self)
+        self.port = self.server.server_address[1]
+        self._write_state()
+        count = self.reload()
+        self.task_scheduler.start()
+        logger.info(f"BEBE daemon listening on http://{self.host}:{self.port} "
+                    f"({count} scheduled task(s) in {self.tasks_dir})")
+        try:
+            self.server.serve_forever(poll_interval=POLL_INTERVAL)
+        except KeyboardInterrupt:
+            logger.info("Interrupted")
+        finally:
+            self.close()
+
+    def close(self):
+        self.task_scheduler.stop()
+        self.player.stop()
+        if self.server is not None:
+            self.server.server_close()
+        if self.library is not None:
+            self.library.close()
+        self.store.close()
+        try:
+            self.state_path.unlink()
+        except OSError:
+            pass
+        logger.info("BEBE daemon stopped")
+
+    def _write_state(self):
+        state = {'host': self.host, 'port': self.port, 'pid': os.getpid(), 'token': self.token}
+        tmp_path = self.state_path.with_suffix('.tmp')
+        # Token-ul e citit doar de utilizatorul curent
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _service_actions(self):
+        """Între cereri (thread-ul serverului): rescanarea periodică a bibliotecii"""
+        if time.monotonic() >= self._next_rescan:
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"Library rescan failed: {e}")
+                self._next_rescan = time.monotonic() + LIBRARY_RESCAN_INTERVAL
+
+
+class _DaemonServer(HTTPServer):
+
+    def __init__(self, address, handler, daemon):
+        self.app = daemon
+        super().__init__(address, handler)
+
+    def service_actions(self):
+        self.app._service_actions()
+
+
+class _DaemonHandler(BaseHTTPRequestHandler):
+
+    server_version = "BebeDaemon"
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method):
+        daemon = self.server.app
+        if not secrets.compare_digest(self.headers.get(TOKEN_HEADER, ''), daemon.token):
+            self._reply(403, {'error': 'Invalid token'})
+            return
+        try:
+            params = {}
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY:
+                raise DaemonError("Request too large")
+            if length:
+                params = json.loads(self.rfile.read(length).decode('utf-8'))
+                if not isinstance(params, dict):
+                    raise DaemonError("Request body must be a JSON object")
+            result = daemon.handle(method, self.path.strip('/'), params)
+        except (DaemonError, ValueError) as e:
+            self._reply(400, {'error': str(e)})
+        except Exception as e:
+            logger.exception(f"Command {self.path} failed")
+            self._reply(500, {'error': str(e)})
+        else:
+            self._reply(200, result)
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class DaemonClient:
+    """Client pentru API-ul daemon-ului (portul și token-ul din tasks/.bebe_daemon.json)"""
+
+    def __init__(self, tasks_dir=task_io.DEFAULT_TASKS_DIR, timeout=5.0):
+        state_path = Path(tasks_dir) / STATE_FILENAME
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            raise DaemonError(f"BEBE daemon is not running (no {state_path})")
+        self.url = f"http://{state['host']}:{state['port']}"
+        self.token = state['token']
+        self.pid = state.get('pid')
+        self.timeout = timeout
+
+    def call(self, command, **params):
+        """GET pentru status/tasks, POST pentru restul; returnează răspunsul JSON"""
+        if command in ('status', 'tasks', 'list', 'history'):
+            data = None
+        else:
+            data = json.dumps(params).encode('utf-8')
+        req = urlrequest.Request(f"{self.url}/{command}", data=data,
+                                 headers={TOKEN_HEADER: self.token,
+                                          'Content-Type': 'application/json'})
+        try:
+            with urlrequest.urlopen(req, timeout=self.timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except HTTPError as e:
+            try:
+                message = json.loads(e.read().decode('utf-8')).get('error', str(e))
+            except ValueError:
+                message = str(e)
+            raise DaemonError(message)
+        except URLError as e:
+            raise DaemonError(f"BEBE daemon not reachable at {self.url}: {e.reason}")
+
+
+def find_daemon(tasks_dir=task_io.DEFAULT_TASKS_DIR, timeout=PROBE_TIMEOUT):
+    """
+    DaemonClient pentru daemon-ul care rulează pe folderul tasks, sau None.
+    Un fișier de stare rămas de la un daemon oprit brusc (pid mort sau API
+    care nu răspunde) e ignorat.
+    """
+    try:
+        client = DaemonClient(tasks_dir, timeout=timeout)
+    except (DaemonError, KeyError, TypeError):
+        return None  # Fără fișier de stare sau fișier invalid
+    if client.pid is not None and not process_alive(client.pid):
+        return None
+    try:
+        client.call('status')
+    except DaemonError:
+        return None
+    return client
+
+
+def run_daemon(tasks_dir=task_io.DEFAULT_TASKS_DIR, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Punctul de intrare pentru `bebe daemon`"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    BebeDaemon(tasks_dir, host, port).serve_forever()
@@ -16,13 +16,29 @@ import logging
 from datetime import datetime, time as dt_time
 from pathlib import Path
 import pyautogui
-from pynput import mouse, keyboard
-from pynput.keyboard import Key, Controller as KeyboardController
+from pynput.keyboard import Key
 import ctypes
-import subprocess
-import tempfile
-import shutil
-import textwrap
+from collections import deque
+
+from timing import calibrate_in_background, TIMER_PRECISIONS, DEFAULT_TIMER_PRECISION
+from event_store import as_event_dicts
+from progress import PROGRESS_SAMPLE_INTERVAL
+from plan import compile_events
+from recorder import TaskRecorder
+from player import TaskPlayer
+import task_io
+from task_library import TaskLibrary
+from event_table import VirtualEventTable
+from event_history import EventRope, EditHistory
+from hotkeys import get_hotkey_service
+from scheduler import Scheduler
+from task_scheduler import (TaskScheduler, ScheduledTask, OVERLAP_POLICIES, DEFAULT_OVERLAP,
+                            CATCH_UP_POLICIES, DEFAULT_CATCH_UP, schedule_priority,
+                            schedule_overlap, schedule_catch_up)
+from schedule_store import ScheduleStore
+from bebe_daemon import DaemonError, find_daemon
+from runner_build import export_task_executable
+from task_loader import TaskLoadJob, STAGE_DONE, STAGE_ERROR, STAGE_CANCELLED
 
 # System tray imports
 try:
@@ -35,6 +51,22 @@ except ImportError:
 APP_VERSION = "4.4"
 TASK_DATA_VERSION = "4.4"
 
+# Interval (ms) la care rândurile capturate în timpul înregistrării sunt adăugate în tabel
+EVENT_PUMP_INTERVAL_MS = 50
+
+# Numărul de editări din tabel care pot fi anulate (Ctrl+Z)
+EDIT_HISTORY_DEPTH = 50
+
+# Interval (ms) la care GUI-ul citește progresul încărcării unui task în fundal
+LOAD_POLL_INTERVAL_MS = 50
+
+# Cheia programării task-ului curent în Scheduler când nu e salvat într-un fișier
+# (altfel numele fișierului, ca să-și păstreze starea/istoricul în ScheduleStore)
+CURRENT_TASK_SCHEDULE = 'current'
+
+# Interval (ms) la care GUI-ul verifică dacă daemon-ul (bebe_daemon.py) rulează pe folderul tasks
+DAEMON_CHECK_INTERVAL_MS = 10000
+
 # Import i18n
 try:
     from i18n import get_string, set_language, get_current_language
@@ -58,8 +90,7 @@ if sys.platform == 'win32' and not getattr(sys, 'frozen', False):
     except:
         pass  # Ignora erorile de encoding in executabil
 
-# Configurare PyAutoGUI
-pyautogui.PAUSE = 0.01
+# Configurare PyAutoGUI (pauza implicită per apel e evitată de backend-uri cu _pause=False)
 pyautogui.FAILSAFE = True
 
 
@@ -151,6 +182,11 @@ def run_as_admin():
         sys.exit()
 
 
+def format_event_row(event):
+    """Coloanele timp / tip / detalii ale unui eveniment - aceeași formatare în tot tabelul"""
+    return (f"{event['timestamp']:.3f}", event['type'], format_event_details(event))
+
+
 def format_event_details(event):
     """
     Formatează detaliile unui eveniment pentru afișare
@@ -187,543 +223,6 @@ def format_event_details(event):
         return str(event)
 
 
-class TaskRecorder:
-    """Inregistreaza actiuni mouse si tastatura"""
-
-    def __init__(self, callback=None):
-        self.events = []
-        self.recording = False
-        self.start_time = None
-        self.mouse_listener = None
-        self.keyboard_listener = None
-        self.stop_requested = False
-        self.callback = callback  # Callback pentru update GUI
-
-        # Track taste modificatoare pentru combinatii
-        self.pressed_modifiers = set()  # Set de taste apasate (ctrl, alt, shift)
-
-    def start_recording(self):
-        """Incepe inregistrarea"""
-        self.events = []
-        self.recording = True
-        self.stop_requested = False
-        self.start_time = time.time()
-        self.pressed_modifiers = set()  # Reset modificatori
-
-        # Mouse listener
-        self.mouse_listener = mouse.Listener(
-            on_move=self.on_mouse_move,
-            on_click=self.on_mouse_click,
-            on_scroll=self.on_mouse_scroll
-        )
-
-        # Keyboard listener
-        self.keyboard_listener = keyboard.Listener(
-            on_press=self.on_key_press,
-            on_release=self.on_key_release
-        )
-
-        self.mouse_listener.start()
-        self.keyboard_listener.start()
-
-    def stop_recording(self):
-        """Opreste inregistrarea"""
-        if not self.recording:
-            return self.events
-
-        self.recording = False
-
-        if self.mouse_listener:
-            self.mouse_listener.stop()
-
-        if self.keyboard_listener:
-            self.keyboard_listener.stop()
-
-        return self.events
-
-    def get_timestamp(self):
-        """Timestamp relativ"""
-        if self.start_time:
-            return time.time() - self.start_time
-        return 0
-
-    def on_mouse_move(self, x, y):
-        """Inregistreaza miscare mouse"""
-        if self.recording:
-            timestamp = self.get_timestamp()
-            if not self.events or (timestamp - self.events[-1]['timestamp']) > 0.1:
-                event = {
-                    'type': 'mouse_move',
-                    'x': x,
-                    'y': y,
-                    'timestamp': timestamp
-                }
-                self.events.append(event)
-                if self.callback:
-                    self.callback(f"Mouse Move ({x}, {y})")
-
-    def on_mouse_click(self, x, y, button, pressed):
-        """Inregistreaza click-uri"""
-        if self.recording:
-            timestamp = self.get_timestamp()
-            button_name = str(button).replace('Button.', '')
-            action = "Press" if pressed else "Release"
-
-            event = {
-                'type': 'mouse_click',
-                'x': x,
-                'y': y,
-                'button': str(button),
-                'pressed': pressed,
-                'timestamp': timestamp
-            }
-            self.events.append(event)
-            if self.callback:
-                self.callback(f"Mouse {action} {button_name} @ ({x}, {y})")
-
-    def on_mouse_scroll(self, x, y, dx, dy):
-        """Inregistreaza scroll"""
-        if self.recording:
-            timestamp = self.get_timestamp()
-            event = {
-                'type': 'mouse_scroll',
-                'x': x,
-                'y': y,
-                'dx': dx,
-                'dy': dy,
-                'timestamp': timestamp
-            }
-            self.events.append(event)
-            direction = "Sus" if dy > 0 else "Jos"
-            if self.callback:
-                self.callback(f"Scroll {direction}")
-
-    def convert_control_char(self, char):
-        """Convertește caractere de control în combinații de taste"""
-        if not char or len(char) != 1:
-            return None
-
-        code = ord(char)
-        # Caractere de control (0x01-0x1F) = Ctrl + literă
-        if 0x01 <= code <= 0x1A:  # Ctrl+A până la Ctrl+Z
-            letter = chr(code + ord('A') - 1)  # 0x01 -> 'A', 0x02 -> 'B', etc.
-            return letter.lower()
-        elif code == 0x1B:  # ESC
-            return 'esc'
-        return None
-
-    def get_key_name(self, key):
-        """Extrage numele tastei pentru salvare"""
-        try:
-            if hasattr(key, 'char') and key.char is not None:
-                return key.char
-            else:
-                # Tasta speciala (Enter, Tab, F4, etc.)
-                key_str = str(key).replace('Key.', '')
-                return key_str
-        except:
-            return str(key)
-
-    def on_key_press(self, key):
-        """Inregistreaza apasare tasta"""
-        if self.recording:
-            # Verifica ESC sau F9 pentru stop
-            if key == Key.f9 or key == Key.esc:
-                self.stop_requested = True
-                return False
-
-            timestamp = self.get_timestamp()
-
-            # PASUL 1: Detecteaza si marcheaza taste modificatoare (Ctrl, Alt, Shift)
-            # Nu salvam modificatorii separat, doar ii tinem minte
-            if key == Key.ctrl or key == Key.ctrl_l or key == Key.ctrl_r:
-                self.pressed_modifiers.add('ctrl')
-                return  # Nu salva event pentru modificator
-            elif key == Key.alt or key == Key.alt_l or key == Key.alt_r:
-                self.pressed_modifiers.add('alt')
-                return  # Nu salva event pentru modificator
-            elif key == Key.shift or key == Key.shift_l or key == Key.shift_r:
-                self.pressed_modifiers.add('shift')
-                return  # Nu salva event pentru modificator
-
-            # PASUL 2: Proceseaza tasta normala sau speciala
-            key_name = None
-            key_display = None
-
-            try:
-                if hasattr(key, 'char') and key.char is not None:
-                    char = key.char
-                    # Verifica daca e caracter de control (Ctrl+litera = \x01-\x1A)
-                    control_letter = self.convert_control_char(char)
-
-                    if control_letter and 'ctrl' in self.pressed_modifiers:
-                        # E o combinatie Ctrl+litera (ex: Ctrl+A = '\x01')
-                        # Verifica daca sunt si alti modificatori (ex: Ctrl+Shift+A)
-                        if 'shift' in self.pressed_modifiers:
-                            key_name = f"ctrl+shift+{control_letter}"
-                            key_display = f"Ctrl + Shift + {control_letter.upper()}"
-                        elif 'alt' in self.pressed_modifiers:
-                            key_name = f"ctrl+alt+{control_letter}"
-                            key_display = f"Ctrl + Alt + {control_letter.upper()}"
-                        else:
-                            key_name = f"ctrl+{control_letter}"
-                            key_display = f"Ctrl + {control_letter.upper()}"
-                    else:
-                        # Tasta normala (litera, cifra, caracter)
-                        # Verifica daca sunt modificatori apasati
-                        if self.pressed_modifiers:
-                            # Construieste combinatie cu modificatori
-                            mods = sorted(self.pressed_modifiers)
-                            key_name = '+'.join(mods) + '+' + char
-                            mods_display = ' + '.join(m.capitalize() for m in mods)
-                            key_display = f"{mods_display} + '{char}'"
-                        else:
-                            # Tasta normala fara modificatori
-                            key_name = char
-                            key_display = f"'{char}'"
-                else:
-                    # Tasta speciala (Enter, Tab, F4, Arrow keys, etc.)
-                    key_str = str(key).replace('Key.', '')
-
-                    if self.pressed_modifiers:
-                        # Construieste combinatie cu modificatori (ex: Alt+F4, Ctrl+Tab)
-                        mods = sorted(self.pressed_modifiers)
-                        key_name = '+'.join(mods) + '+' + key_str
-                        mods_display = ' + '.join(m.capitalize() for m in mods)
-                        key_display = f"{mods_display} + {key_str.upper()}"
-                    else:
-                        # Tasta speciala fara modificatori
-                        key_name = key_str
-                        key_display = key_str.upper()
-            except Exception as e:
-                # Fallback pentru erori
-                key_name = str(key)
-                key_display = str(key)
-
-            # PASUL 3: Salveaza event-ul
-            if key_name:
-                event = {
-                    'type': 'key_press',
-                    'key': key_name,
-                    'modifiers': list(self.pressed_modifiers),
-                    'timestamp': timestamp
-                }
-                self.events.append(event)
-                if self.callback:
-                    self.callback(f"Key Press {key_display}")
-
-    def on_key_release(self, key):
-        """Inregistreaza eliberare tasta"""
-        if self.recording:
-            # Elimina modificator din set daca e eliberat
-            # Nu salvam eliberarea modificatorilor separat
-            if key == Key.ctrl or key == Key.ctrl_l or key == Key.ctrl_r:
-                self.pressed_modifiers.discard('ctrl')
-                return
-            elif key == Key.alt or key == Key.alt_l or key == Key.alt_r:
-                self.pressed_modifiers.discard('alt')
-                return
-            elif key == Key.shift or key == Key.shift_l or key == Key.shift_r:
-                self.pressed_modifiers.discard('shift')
-                return
-
-            # Pentru taste normale, salvam eliberarea
-            timestamp = self.get_timestamp()
-
-            try:
-                if hasattr(key, 'char') and key.char is not None:
-                    char = key.char
-                    # Verifica daca e caracter de control
-                    control_letter = self.convert_control_char(char)
-
-                    if control_letter and 'ctrl' in self.pressed_modifiers:
-                        # E o combinatie Ctrl+litera
-                        if 'shift' in self.pressed_modifiers:
-                            key_name = f"ctrl+shift+{control_letter}"
-                        elif 'alt' in self.pressed_modifiers:
-                            key_name = f"ctrl+alt+{control_letter}"
-                        else:
-                            key_name = f"ctrl+{control_letter}"
-                    elif self.pressed_modifiers:
-                        # Tasta normala cu modificatori
-                        mods = sorted(self.pressed_modifiers)
-                        key_name = '+'.join(mods) + '+' + char
-                    else:
-                        key_name = char
-                else:
-                    # Tasta speciala
-                    key_str = str(key).replace('Key.', '')
-                    if self.pressed_modifiers:
-                        mods = sorted(self.pressed_modifiers)
-                        key_name = '+'.join(mods) + '+' + key_str
-                    else:
-                        key_name = key_str
-            except:
-                key_name = str(key)
-
-            event = {
-                'type': 'key_release',
-                'key': key_name,
-                'timestamp': timestamp
-            }
-            self.events.append(event)
-
-
-class TaskPlayer:
-    """Reda task-uri cu suport pentru pauză"""
-
-    def __init__(self):
-        self.playing = False
-        self.paused = False
-        self.pause_event = threading.Event()
-        self.keyboard_controller = KeyboardController()
-        self.stop_requested = False
-
-    def play_events(self, events, speed=2.0, loop_count=1, callback=None, run_until_stop=False):
-        """
-        Reda evenimente
-
-        Args:
-            events: Lista de evenimente
-            speed: Viteza de redare
-            loop_count: Număr de repetări (ignorat dacă run_until_stop=True)
-            callback: Funcție callback pentru update GUI
-            run_until_stop: Dacă True, rulează continuu până la stop
-        """
-        self.playing = True
-        self.paused = False
-        self.stop_requested = False
-        self.pause_event.set()  # Setat = nu e pauzat
-
-        # Validare viteza
-        speed = max(0.1, min(10.0, speed))
-
-        # ✅ LOGGING ÎNAINTE DE WHILE
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"🔄 Starting playback loop: loop_count={loop_count}, run_until_stop={run_until_stop}")
-
-        loop = 0
-        while True:
-            loop += 1
-
-            # ✅ LOGGING LA FIECARE ITERAȚIE
-            logger.info(f"🔄 Loop iteration {loop}/{loop_count if not run_until_stop else '∞'}")
-
-            if not run_until_stop and loop > loop_count:
-                logger.info(f"✋ Breaking: loop ({loop}) > loop_count ({loop_count})")
-                break
-
-            logger.info(f"▶️ Playing {len(events)} events (iteration {loop})...")
-
-            for i, event in enumerate(events):
-                if not self.playing or self.stop_requested:
-                    logger.warning(f"⚠️ Breaking from event loop: playing={self.playing}, stop_requested={self.stop_requested}")
-                    break
-
-                # Verifică pauză
-                while self.paused and self.playing and not self.stop_requested:
-                    self.pause_event.clear()
-                    time.sleep(0.1)
-
-                if not self.playing or self.stop_requested:
-                    logger.warning(f"⚠️ Breaking after pause check: playing={self.playing}, stop_requested={self.stop_requested}")
-                    break
-
-                if i > 0:
-                    delay = (event['timestamp'] - events[i-1]['timestamp']) / speed
-                    if delay > 0:
-                        time.sleep(delay)
-
-                self.execute_event(event, i + 1, len(events), callback)
-
-            logger.info(f"✅ Finished playing events (iteration {loop})")
-
-            # Verifică dacă trebuie să oprească
-            if self.stop_requested:
-                logger.info(f"✋ Breaking: stop_requested={self.stop_requested}")
-                break
-
-            logger.info(f"🔄 End of iteration {loop}, continuing to next iteration...")
-
-        logger.info(f"🏁 Playback loop finished after {loop} iteration(s)")
-
-        self.playing = False
-        self.paused = False
-
-    def execute_event(self, event, current, total, callback=None):
-        """Executa eveniment"""
-        try:
-            event_type = event['type']
-
-            if event_type == 'mouse_move':
-                x, y = event['x'], event['y']
-                pyautogui.moveTo(x, y, duration=0)
-                if callback:
-                    percent = int((current / total) * 100)
-                    callback(get_string('progress_playing', current=current, total=total, percent=percent))
-
-            elif event_type == 'mouse_click':
-                x, y = event['x'], event['y']
-                button_str = event['button']
-                pressed = event['pressed']
-
-                if 'left' in button_str.lower():
-                    button = 'left'
-                elif 'right' in button_str.lower():
-                    button = 'right'
-                else:
-                    button = 'middle'
-
-                pyautogui.moveTo(x, y, duration=0)
-
-                if pressed:
-                    pyautogui.mouseDown(button=button)
-                    action = "Press"
-                else:
-                    pyautogui.mouseUp(button=button)
-                    action = "Release"
-
-                if callback:
-                    percent = int((current / total) * 100)
-                    callback(get_string('progress_playing', current=current, total=total, percent=percent))
-
-            elif event_type == 'mouse_scroll':
-                dy = event['dy']
-                pyautogui.scroll(int(dy * 100))
-                if callback:
-                    percent = int((current / total) * 100)
-                    callback(get_string('progress_playing', current=current, total=total, percent=percent))
-
-            elif event_type == 'key_press':
-                key_name = event['key']
-
-                # Verifica daca e combinatie (ex: ctrl+a sau ctrl+'a')
-                if '+' in key_name:
-                    parts = key_name.split('+')
-                    modifiers = parts[:-1]  # ctrl, alt, shift
-                    main_key_str = parts[-1]    # 'a' sau "'a'"
-
-                    # Curata tasta principala (elimina ghilimele daca exista)
-                    main_key_str = main_key_str.strip("'\"")
-
-                    # Apasa modificatorii
-                    for mod in modifiers:
-                        if mod.lower() == 'ctrl':
-                            self.keyboard_controller.press(Key.ctrl)
-                        elif mod.lower() == 'alt':
-                            self.keyboard_controller.press(Key.alt)
-                        elif mod.lower() == 'shift':
-                            self.keyboard_controller.press(Key.shift)
-
-                    # Apasa tasta principala
-                    key = self.parse_key(main_key_str)
-                    self.keyboard_controller.press(key)
-                    time.sleep(0.01)  # Mic delay
-                    self.keyboard_controller.release(key)
-
-                    # Elibereaza modificatorii
-                    for mod in modifiers:
-                        if mod.lower() == 'ctrl':
-                            self.keyboard_controller.release(Key.ctrl)
-                        elif mod.lower() == 'alt':
-                            self.keyboard_controller.release(Key.alt)
-                        elif mod.lower() == 'shift':
-                            self.keyboard_controller.release(Key.shift)
-                else:
-                    key = self.parse_key(key_name)
-                    self.keyboard_controller.press(key)
-
-                if callback:
-                    percent = int((current / total) * 100)
-                    callback(get_string('progress_playing', current=current, total=total, percent=percent))
-
-            elif event_type == 'key_release':
-                key_name = event['key']
-
-                # Verifica daca e combinatie (ex: ctrl+a)
-                if '+' in key_name:
-                    parts = key_name.split('+')
-                    modifiers = parts[:-1]  # ctrl, alt, shift
-                    main_key_str = parts[-1]    # 'a' sau "'a'"
-
-                    # Curata tasta principala (elimina ghilimele daca exista)
-                    main_key_str = main_key_str.strip("'\"")
-
-                    # Elibereaza tasta principala
-                    key = self.parse_key(main_key_str)
-                    self.keyboard_controller.release(key)
-
-                    # Elibereaza modificatorii
-                    for mod in modifiers:
-                        if mod.lower() == 'ctrl':
-                            self.keyboard_controller.release(Key.ctrl)
-                        elif mod.lower() == 'alt':
-                            self.keyboard_controller.release(Key.alt)
-                        elif mod.lower() == 'shift':
-                            self.keyboard_controller.release(Key.shift)
-                else:
-                    # Tasta simpla fara modificatori
-                    key = self.parse_key(key_name)
-                    self.keyboard_controller.release(key)
-
-        except Exception as e:
-            if callback:
-                callback(f"Eroare: {e}")
-
-    def parse_key(self, key_str):
-        """Converteste string in Key"""
-        # Mapeaza taste speciale
-        special_keys = {
-            'space': Key.space, 'enter': Key.enter,
-            'tab': Key.tab, 'backspace': Key.backspace,
-            'esc': Key.esc, 'escape': Key.esc,
-            'shift': Key.shift, 'ctrl': Key.ctrl,
-            'alt': Key.alt, 'up': Key.up,
-            'down': Key.down, 'left': Key.left,
-            'right': Key.right, 'delete': Key.delete,
-            'home': Key.home, 'end': Key.end,
-            'page_up': Key.page_up, 'page_down': Key.page_down,
-            'insert': Key.insert, 'caps_lock': Key.caps_lock,
-            'num_lock': Key.num_lock, 'scroll_lock': Key.scroll_lock,
-            'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
-            'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
-            'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
-        }
-
-        # Elimina "Key." daca exista
-        key_str_clean = key_str.replace('Key.', '').lower()
-
-        if key_str_clean in special_keys:
-            return special_keys[key_str_clean]
-
-        # Daca e un singur caracter (litera, cifra, simbol)
-        if len(key_str) == 1:
-            return key_str
-
-        # Fallback: returneaza string-ul original
-        return key_str
-
-    def pause(self):
-        """Pune redarea pe pauză"""
-        if self.playing:
-            self.paused = True
-            self.pause_event.clear()
-
-    def resume(self):
-        """Reia redarea"""
-        if self.playing and self.paused:
-            self.paused = False
-            self.pause_event.set()
-
-    def stop(self):
-        """Opreste redarea"""
-        self.playing = False
-        self.paused = False
-        self.stop_requested = True
-        self.pause_event.set()
-
-
 class ScheduleDialog:
     """Dialog pentru setarea programării task-ului"""
 
@@ -738,9 +237,9 @@ class ScheduleDialog:
         """Afișează dialogul și returnează rezultatul"""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title(get_string('schedule_title'))
-        self.dialog.geometry("600x680")
+        self.dialog.geometry("600x830")
         self.dialog.resizable(True, True)  # Permite resize
-        self.dialog.minsize(550, 600)  # Dimensiune minimă
+        self.dialog.minsize(550, 750)  # Dimensiune minimă
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
 
@@ -854,6 +353,36 @@ class ScheduleDialog:
                                foreground="blue", font=("Arial", 8))
         info_label.pack(anchor=tk.W, pady=(5, 0))
 
+        # Prioritate și comportament când alt task rulează deja (task_scheduler.py)
+        order_frame = ttk.LabelFrame(main_frame, text="Priority / Overlap", padding="10")
+        order_frame.pack(fill=tk.X, pady=10)
+
+        priority_row = ttk.Frame(order_frame)
+        priority_row.pack(fill=tk.X, pady=5)
+        ttk.Label(priority_row, text="Priority:", width=12).pack(side=tk.LEFT, padx=5)
+        self.priority_var = tk.IntVar(value=schedule_priority(self.existing_config))
+        ttk.Spinbox(priority_row, from_=-99, to=99, textvariable=self.priority_var,
+                    width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(priority_row, text="(higher runs first)", foreground="gray").pack(side=tk.LEFT, padx=5)
+
+        overlap_row = ttk.Frame(order_frame)
+        overlap_row.pack(fill=tk.X, pady=5)
+        ttk.Label(overlap_row, text="If busy:", width=12).pack(side=tk.LEFT, padx=5)
+        self.overlap_var = tk.StringVar(value=schedule_overlap(self.existing_config))
+        ttk.Combobox(overlap_row, textvariable=self.overlap_var, values=OVERLAP_POLICIES,
+                     width=10, state="readonly").pack(side=tk.LEFT, padx=5)
+        ttk.Label(overlap_row, text="(skip / queue / replace lower priority)",
+                  foreground="gray").pack(side=tk.LEFT, padx=5)
+
+        catch_up_row = ttk.Frame(order_frame)
+        catch_up_row.pack(fill=tk.X, pady=5)
+        ttk.Label(catch_up_row, text="Missed runs:", width=12).pack(side=tk.LEFT, padx=5)
+        self.catch_up_var = tk.StringVar(value=schedule_catch_up(self.existing_config))
+        ttk.Combobox(catch_up_row, textvariable=self.catch_up_var, values=CATCH_UP_POLICIES,
+                     width=10, state="readonly").pack(side=tk.LEFT, padx=5)
+        ttk.Label(catch_up_row, text="(after the app was closed: skip / run once / run all)",
+                  foreground="gray").pack(side=tk.LEFT, padx=5)
+
         # Butoane
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill=tk.X, pady=10)
@@ -891,10 +420,19 @@ class ScheduleDialog:
             return
 
         # Construiește rezultatul CU setările de playback din GUI
+        try:
+            priority = int(self.priority_var.get())
+        except (tk.TclError, ValueError):
+            messagebox.showerror(get_string('error'), "Priority must be a whole number")
+            return
+
         self.result = {
             'enabled': True,
             'days': selected_days,
-            'time_interval_enabled': self.time_interval_enabled.get()
+            'time_interval_enabled': self.time_interval_enabled.get(),
+            'priority': priority,
+            'overlap': self.overlap_var.get() or DEFAULT_OVERLAP,
+            'catch_up': self.catch_up_var.get() or DEFAULT_CATCH_UP
         }
 
         # Salvează setările Loop/Run Continuously din GUI principal
@@ -983,24 +521,56 @@ class BebeGUI:
         else:
             self.logger.info("Running as admin")
 
+        # Calibrare timer sleep/spin în fundal (nu blochează fereastra)
+        calibrate_in_background()
+
         self.logger.debug("Creating TaskRecorder and TaskPlayer...")
-        self.recorder = TaskRecorder(callback=self.add_event_to_list)
+        self.recorder = TaskRecorder(callback=self.add_event_to_list, hotkeys=get_hotkey_service())
         self.player = TaskPlayer()
-        self.current_events = []
+        self.current_events = EventRope()
+        self.current_plan = None  # ExecutionPlan compilat pentru current_events
+        self.edit_history = EditHistory(EDIT_HISTORY_DEPTH)  # Versiuni anterioare ale current_events
+
+        # Coadă de rânduri pentru tabel în timpul înregistrării (golită periodic de pump)
+        self._pending_rows = deque()
+        self._live_events = []  # Rândurile afișate în timpul înregistrării
+        self.last_edit_ms = 0.0  # Durata ultimei editări din tabel (vezi _log_edit_latency)
+        self._pump_after_id = None
+        self._live_row_count = 0
+        self.last_pump_rows = 0
+        self.pump_stats = {'flushes': 0, 'rows': 0, 'max_rows': 0}
+        self.load_job = None  # TaskLoadJob în curs (încărcare în fundal)
+        self._export_thread = None  # Exportul ca executabil în curs (poate rula PyInstaller)
+        self._load_after_id = None
+        self._load_preview_shown = False
+        self._file_label_before_load = None
         self.tasks_dir = Path("tasks")
         self.tasks_dir.mkdir(exist_ok=True)
+        self.task_library = TaskLibrary(self.tasks_dir)
 
         # Scheduling
         self.logger.debug("Initializing schedule variables...")
         self.schedule_config = None
-        self.schedule_thread = None
         self.schedule_running = False
-        self.last_schedule_trigger = None  # Timestamp ultimului trigger
-
-        # Keyboard listener pentru ESC/F9 în timpul redării
-        self.playback_keyboard_listener = None
-        # Keyboard listener pentru F10 (Pause)
-        self.f10_listener = None
+        self.scheduler = Scheduler()  # Doarme până la următoarea rulare (fără polling)
+        # Task-ul curent + (opțional) task-urile programate din bibliotecă, peste același Scheduler
+        # Ultima rulare și istoricul supraviețuiesc repornirii (rulările ratate, după 'catch_up')
+        self.schedule_store = ScheduleStore(self.tasks_dir)
+        self.task_scheduler = TaskScheduler(self.player, self._start_scheduled_playback,
+                                            scheduler=self.scheduler, store=self.schedule_store)
+        self.current_task_path = None  # Fișierul din care a fost încărcat task-ul curent
+        self._schedule_key = None  # Cheia sub care e programat task-ul curent
+        # Daemon-ul pe același folder tasks: cât rulează, el execută programările bibliotecii
+        self.daemon_client = None
+
+        # Hook global comun (hotkeys.py): F10 permanent, ESC/F9 doar în timpul redării
+        self.hotkeys = get_hotkey_service()
+        self._playback_hotkeys = []
+        # Eșantionare progres redare (root.after), în locul unui update Tk per eveniment
+        self._progress_after_id = None
+        self._progress_interval_ms = int(PROGRESS_SAMPLE_INTERVAL * 1000)
+        self._last_progress = None
+        self._f10_hotkey = None
 
         self.logger.debug("Calling setup_ui()...")
         self.setup_ui()
@@ -1009,6 +579,7 @@ class BebeGUI:
         # Refresh lista task-uri la startup
         self.logger.debug("Scheduling refresh_task_list()...")
         self.root.after(100, self.refresh_task_list)
+        self.root.after(200, self._check_daemon)
         self.logger.info("BebeGUI.__init__() completed")
 
     def _create_menu_bar(self):
@@ -1160,6 +731,9 @@ class BebeGUI:
         """Quit application"""
         if self.tray_icon:
             self.tray_icon.stop()
+        self.hotkeys.stop()
+        self.task_scheduler.stop()
+        self.schedule_store.close()
         self.root.quit()
 
     def setup_ui(self):
@@ -1281,6 +855,12 @@ class BebeGUI:
                        variable=self.run_until_stop_var, command=self.toggle_run_until_stop)
         self.run_until_stop_checkbox.pack(side=tk.LEFT, padx=20)
 
+        # Precizie timer (compromis CPU/precizie pentru pauzele dintre evenimente)
+        ttk.Label(settings_frame, text="Timer:").pack(side=tk.LEFT, padx=(5, 2))
+        self.timer_precision_var = tk.StringVar(value=DEFAULT_TIMER_PRECISION)
+        ttk.Combobox(settings_frame, textvariable=self.timer_precision_var,
+                     values=TIMER_PRECISIONS, width=9, state="readonly").pack(side=tk.LEFT, padx=2)
+
         # Buton pentru setări programare cu access key (Shift+ pentru a evita interferențe)
         schedule_text = get_string('schedule_settings')
         ttk.Button(settings_frame, text=f"{schedule_text} (Shift+C)",
@@ -1308,31 +888,31 @@ class BebeGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(2, weight=1)  # Evenimente frame sa se extinda
 
-        # Treeview cu font mai mare pentru accesibilitate - înălțime redusă la jumătate
+        # Tabel virtualizat (rânduri Treeview doar pentru fereastra vizibilă) - înălțime redusă la jumătate
         columns = ('#', get_string('col_time'), get_string('col_type'), get_string('col_details'))
-        self.tree = ttk.Treeview(events_frame, columns=columns, show='headings', height=7, selectmode='extended')
+        self.event_table = VirtualEventTable(events_frame, columns, format_event_row, height=7)
+        self.tree = self.event_table.tree
         # Configurare font pentru treeview
         style.configure('Treeview', font=default_font, rowheight=25)
         style.configure('Treeview.Heading', font=('Segoe UI', 10, 'bold'))
 
-        self.tree.heading('#', text='#')
-        self.tree.heading(get_string('col_time'), text=get_string('col_time'))
-        self.tree.heading(get_string('col_type'), text=get_string('col_type'))
-        self.tree.heading(get_string('col_details'), text=get_string('col_details'))
-
-        self.tree.column('#', width=50)
-        self.tree.column(get_string('col_time'), width=100)
-        self.tree.column(get_string('col_type'), width=150)
-        self.tree.column(get_string('col_details'), width=500)
+        self.event_table.heading('#', text='#')
+        self.event_table.heading(get_string('col_time'), text=get_string('col_time'))
+        self.event_table.heading(get_string('col_type'), text=get_string('col_type'))
+        self.event_table.heading(get_string('col_details'), text=get_string('col_details'))
 
-        scrollbar = ttk.Scrollbar(events_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.event_table.column('#', width=50)
+        self.event_table.column(get_string('col_time'), width=100)
+        self.event_table.column(get_string('col_type'), width=150)
+        self.event_table.column(get_string('col_details'), width=500)
 
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.event_table.pack(fill=tk.BOTH, expand=True)
 
         # Context menu pentru Treeview (right-click)
         self.tree_context_menu = tk.Menu(self.tree, tearoff=0)
+        self.tree_context_menu.add_command(label="Undo (Ctrl+Z)", command=self.undo_edit)
+        self.tree_context_menu.add_command(label="Redo (Ctrl+Y)", command=self.redo_edit)
+        self.tree_context_menu.add_separator()
         self.tree_context_menu.add_command(label="Delete Event (Del)", command=self.delete_selected_event)
         self.tree_context_menu.add_command(label="Delete Selected Group (Ctrl+Del)", command=self.delete_selected_group)
         self.tree_context_menu.add_separator()
@@ -1340,9 +920,11 @@ class BebeGUI:
         self.tree_context_menu.add_separator()
         self.tree_context_menu.add_command(label="Delete All Events", command=self.delete_all_events)
 
-        self.tree.bind("<Button-3>", self.show_tree_context_menu)  # Right-click
-        self.tree.bind("<Delete>", lambda e: self.delete_selected_event())  # Delete key
-        self.tree.bind("<Control-Delete>", lambda e: self.delete_selected_group())  # Ctrl+Del for group delete
+        self.event_table.bind("<Button-3>", self.show_tree_context_menu)  # Right-click
+        self.event_table.bind("<Delete>", lambda e: self.delete_selected_event())  # Delete key
+        self.event_table.bind("<Control-Delete>", lambda e: self.delete_selected_group())  # Ctrl+Del for group delete
+        self.root.bind('<Control-z>', lambda e: self.undo_edit())
+        self.root.bind('<Control-y>', lambda e: self.redo_edit())
 
         # TAB 2: TASK FILES
         tasks_tab = ttk.Frame(self.notebook)
@@ -1374,6 +956,18 @@ class BebeGUI:
         self.lbl_file = ttk.Label(btn_frame, text=get_string('no_file_loaded'), foreground="gray")
         self.lbl_file.pack(side=tk.LEFT, padx=20, pady=8)
 
+        # Progres încărcare în fundal (afișat doar cât timp se încarcă un task)
+        self.load_frame = ttk.Frame(file_frame)
+        self.load_progress = ttk.Progressbar(self.load_frame, orient=tk.HORIZONTAL,
+                                             length=300, mode='determinate', maximum=100)
+        self.load_progress.pack(side=tk.LEFT, padx=5)
+        self.lbl_load_status = ttk.Label(self.load_frame, text="", foreground="gray")
+        self.lbl_load_status.pack(side=tk.LEFT, padx=5)
+        self.btn_cancel_load = ttk.Button(self.load_frame, text="Cancel",
+                                          command=self.cancel_task_load, width=12)
+        self.btn_cancel_load.pack(side=tk.LEFT, padx=5)
+        self._file_btn_frame = btn_frame
+
         # Dropdown pentru task-uri salvate - A DOUA LINIE
         list_frame = ttk.Frame(file_frame)
         list_frame.pack(fill=tk.X, pady=(0, 0))
@@ -1392,6 +986,26 @@ class BebeGUI:
         btn_load_selected.pack(side=tk.LEFT, padx=5, pady=8)
         self.root.bind('<Return>', lambda e: self.load_selected_task())
 
+        # Programările salvate în celelalte task-uri din folderul tasks (opt-in)
+        self.library_schedule_var = tk.BooleanVar(value=False)
+        self.chk_library_schedule = ttk.Checkbutton(list_frame, text="Run scheduled tasks from library",
+                                                    variable=self.library_schedule_var,
+                                                    command=self._sync_library_schedules)
+        self.chk_library_schedule.pack(side=tk.LEFT, padx=10, pady=8)
+
+        # Daemon-ul headless: comenzile pentru task-urile din bibliotecă merg prin API-ul lui
+        daemon_frame = ttk.Frame(file_frame)
+        daemon_frame.pack(fill=tk.X)
+        self.lbl_daemon = ttk.Label(daemon_frame, text="Daemon: not running", foreground="gray")
+        self.lbl_daemon.pack(side=tk.LEFT, padx=5, pady=5)
+        self._daemon_buttons = []
+        for text, command in (("Run in daemon", self.daemon_enqueue_selected),
+                              ("Daemon status", self.daemon_show_status),
+                              ("Stop daemon playback", self.daemon_stop)):
+            button = ttk.Button(daemon_frame, text=text, command=command, state=tk.DISABLED)
+            button.pack(side=tk.LEFT, padx=5, pady=5)
+            self._daemon_buttons.append(button)
+
         # Actualizeaza lista de task-uri
         self.refresh_task_list()
 
@@ -1415,9 +1029,8 @@ class BebeGUI:
         self.root.bind('<KeyPress-space>', play_handler)
         self.logger.debug("Space binding registered for Play")
 
-        # Pause: F10 (folosim listener global pentru funcționare corectă)
-        self.logger.info("Setting up F10 listener for Pause...")
-        self._setup_f10_listener()
+        # Pause: F10 (tastă rapidă globală, funcționează și când fereastra nu are focus)
+        self._f10_hotkey = self.hotkeys.register(Key.f10, lambda: self.root.after(0, self._on_f10_hotkey))
 
         # Stop Playback: Esc
         def stop_handler(e):
@@ -1428,116 +1041,123 @@ class BebeGUI:
         self.root.bind('<Escape>', stop_handler)
         self.logger.info("Keyboard shortcuts setup complete")
 
-    def _setup_f10_listener(self):
-        """Configurează listener global pentru F10 (Pause/Resume)"""
-        self.logger.info("_setup_f10_listener() called")
-
-        def on_key_press(key):
-            try:
-                # Convertim key la string pentru debugging mai bun
-                key_str = str(key)
-                self.logger.debug(f"Key PRESSED: {key_str} (type: {type(key)})")
-
-                # Detectează F10
-                if key == Key.f10:
-                    self.logger.info(f"✓✓✓ F10 PRESSED - PAUSE/RESUME TRIGGERED! ✓✓✓")
-                    # Apelăm direct pause_playback în thread-safe callback
-                    # Verificarea se va face în pause_playback() care rulează în thread-ul principal
-                    def call_pause():
-                        try:
-                            # Verifică dacă player-ul rulează (mai important decât starea butonului)
-                            is_playing = self.player.playing
-                            current_state = self.btn_pause['state']
-                            self.logger.info(f"Player playing: {is_playing}, Button state: {current_state}")
-
-                            # Dacă player-ul rulează, apelăm pause_playback (chiar dacă butonul pare disabled)
-                            if is_playing:
-                                self.logger.info("✓ Player is playing, calling pause_playback()...")
-                                self.pause_playback()
-                            elif current_state == 'normal':
-                                # Dacă butonul este enabled dar player-ul nu rulează, încercăm totuși
-                                self.logger.info("✓ Button is enabled, calling pause_playback()...")
-                                self.pause_playback()
-                            else:
-                                self.logger.warning(f"✗ Cannot pause - player not playing and button state: '{current_state}'")
-                        except Exception as e:
-                            self.logger.error(f"Error in call_pause: {e}", exc_info=True)
-                            # Încearcă direct dacă verificarea eșuează
-                            try:
-                                self.pause_playback()
-                            except Exception as e2:
-                                self.logger.error(f"Error calling pause_playback directly: {e2}", exc_info=True)
-
-                    self.root.after(0, call_pause)
-                else:
-                    self.logger.debug(f"Other key pressed: {key_str}")
-            except Exception as e:
-                self.logger.error(f"✗✗✗ ERROR in on_key_press: {e}", exc_info=True)
-
-        def on_key_release(key):
-            try:
-                key_str = str(key)
-                self.logger.debug(f"Key RELEASED: {key_str}")
-            except Exception as e:
-                self.logger.error(f"✗✗✗ ERROR in on_key_release: {e}", exc_info=True)
-
-        # Pornește listener global pentru F10 în thread separat
-        # IMPORTANT: Listener-ul trebuie să fie global și să funcționează chiar și când alte aplicații sunt active
-        self.logger.info("Creating F10 listener object...")
+    def _on_f10_hotkey(self):
+        """F10 (thread-ul Tk): pauză/reluare dacă redarea rulează"""
         try:
-            # Folosim pynput.keyboard.Listener care funcționează global când aplicația rulează ca admin
-            self.f10_listener = keyboard.Listener(
-                on_press=on_key_press,
-                on_release=on_key_release,
-                suppress=False  # Nu suprima alte evenimente - permite altor aplicații să primească evenimentele
-            )
-            self.logger.info("✓ Listener object created successfully")
-            self.logger.info("Starting listener in separate thread...")
-            # Pornește listener-ul într-un thread separat pentru a nu bloca UI-ul
-            def start_listener():
-                self.logger.info("[THREAD] Starting F10 listener thread...")
-                try:
-                    # Listener-ul pornește și funcționează global (chiar și când alte aplicații sunt active)
-                    # dacă aplicația rulează cu privilegii de administrator
-                    self.f10_listener.start()
-                    self.logger.info("[THREAD] ✓✓✓ F10 listener STARTED successfully! ✓✓✓")
-                    self.logger.info("[THREAD] Listener is now active and listening for F10 GLOBALLY...")
-                    self.logger.info("[THREAD] IMPORTANT: Listener works even when other apps are active (requires admin)")
-                except Exception as e:
-                    self.logger.error(f"[THREAD] ✗✗✗ ERROR starting listener: {e}", exc_info=True)
-                    import traceback
-                    traceback.print_exc()
-
-            listener_thread = threading.Thread(target=start_listener, daemon=True)
-            listener_thread.start()
-            self.logger.info("✓ Listener start thread launched")
-            # Așteaptă puțin pentru a verifica dacă listener-ul pornește
-            import time
-            time.sleep(0.2)  # Mărit delay-ul pentru a permite listener-ului să pornească
-            if hasattr(self.f10_listener, 'running'):
-                if self.f10_listener.running:
-                    self.logger.info("✓✓✓ F10 Listener is RUNNING! ✓✓✓")
-                else:
-                    self.logger.warning("✗✗✗ F10 Listener is NOT running - may need admin privileges!")
-            else:
-                self.logger.warning("✗✗✗ Cannot check F10 listener status - may still be starting...")
+            # Verifică dacă player-ul rulează (mai important decât starea butonului)
+            is_playing = self.player.playing
+            current_state = self.btn_pause['state']
+            self.logger.info(f"F10 pressed - player playing: {is_playing}, button state: {current_state}")
+            if is_playing or current_state == 'normal':
+                self.pause_playback()
         except Exception as e:
-            self.logger.error(f"✗✗✗ ERROR creating F10 listener: {e}", exc_info=True)
-            import traceback
-            traceback.print_exc()
+            self.logger.error(f"Error handling F10: {e}", exc_info=True)
 
     def refresh_task_list(self):
         """Actualizeaza lista de task-uri din folderul tasks"""
         try:
-            task_files = sorted([f.stem for f in self.tasks_dir.glob("*.json")])
+            # Doar fișierele noi/modificate sunt recitite (index SQLite în folderul tasks)
+            self.task_library.refresh()
+            task_files = self.task_library.names()
             self.task_combo['values'] = task_files
             if task_files:
                 self.task_combo.set(get_string('select_task'))
             else:
                 self.task_combo.set(get_string('no_tasks_saved'))
+            self._sync_library_schedules(refresh=False)
         except Exception as e:
             print(f"Eroare la refresh lista: {e}")
 
+    def _sync_library_schedules(self, refresh=True):
+        """Programează task-urile din bibliotecă care au 'schedule' (dacă opțiunea e bifată)"""
+        # Cu daemon-ul pornit, GUI-ul nu le mai programează: ar rula de două ori
+        if self.library_schedule_var.get() and self.daemon_client is None:
+            if refresh:
+                self.task_library.refresh()
+            # Task-ul încărcat în GUI e programat ca task curent, nu și din bibliotecă
+            exclude = {self.current_task_path.name} if self.current_task_path else set()
+            count = self.task_scheduler.sync_library(self.task_library, exclude=exclude)
+            self.task_scheduler.start()
+            self.logger.info(f"Library scheduling: {count} scheduled task(s)")
+        else:
+            for task, _ in self.task_scheduler.tasks():
+                if task.from_library:
+                    self.task_scheduler.remove_task(task.key)
+
+    def _check_daemon(self):
+        """Periodic (root.after): detectează pornirea / oprirea daemon-ului"""
+        client = find_daemon(self.tasks_dir)
+        changed = (client is None) != (self.daemon_client is None)
+        self.daemon_client = client
+        if client is not None:
+            self.lbl_daemon.config(text=f"Daemon: running (pid {client.pid})", foreground="green")
+        else:
+            self.lbl_daemon.config(text="Daemon: not running", foreground="gray")
+        for button in self._daemon_buttons:
+            button.config(state=tk.NORMAL if client is not None else tk.DISABLED)
+        self.chk_library_schedule.config(state=tk.DISABLED if client is not None else tk.NORMAL)
+        if changed:
+            self.logger.info(f"BEBE daemon {'detected' if client is not None else 'gone'}: "
+                             f"library schedules run {'in the daemon' if client is not None else 'here'}")
+            self._sync_library_schedules(refresh=False)
+            if self.schedule_config:
+                self._start_schedule_thread()
+        self.root.after(DAEMON_CHECK_INTERVAL_MS, self._check_daemon)
+
+    def _daemon_schedules(self, key):
+        """True dacă daemon-ul programează deja fișierul `key` (din 'schedule'-ul salvat)"""
+        if self.daemon_client is None or key == CURRENT_TASK_SCHEDULE:
+            return False
+        if self.current_task_path.parent.resolve() != self.tasks_dir.resolve():
+            return False
+        try:
+            return any(task['key'] == key for task in self.daemon_client.call('tasks'))
+        except DaemonError as e:
+            self.logger.warning(f"BEBE daemon: {e}")
+            return False
+
+    def _daemon_call(self, command, **params):
+        """Comandă către daemon; None (după un mesaj de eroare) dacă nu reușește"""
+        if self.daemon_client is None:
+            messagebox.showwarning(get_string('error'), "BEBE daemon is not running.")
+            return None
+        try:
+            return self.daemon_client.call(command, **params)
+        except DaemonError as e:
+            messagebox.showerror(get_string('error'), f"BEBE daemon: {e}")
+            return None
+
+    def daemon_enqueue_selected(self):
+        """Rulează în daemon task-ul selectat din listă (acum sau după redarea curentă)"""
+        selected = self.task_var.get()
+        if not selected or selected == get_string('select_task') or selected == get_string('no_tasks_saved'):
+            messagebox.showwarning(get_string('error'), get_string('select_task_from_list'))
+            return
+        result = self._daemon_call('enqueue', task=selected)
+        if result is not None:
+            self.lbl_daemon.config(text=f"Daemon: {result['task']} {result['result']}")
+
+    def daemon_show_status(self):
+        """Starea daemon-ului, ca la `bebe ctl status`"""
+        status = self._daemon_call('status')
+        if status is None:
+            return
+        state = "paused" if status['paused'] else "playing" if status['playing'] else "idle"
+        lines = [f"Daemon (pid {status['pid']}): {state}"]
+        if status['task']:
+            progress = status['progress']
+            lines.append(f"Task: {status['task']} - event {progress['index']}/{progress['total']} "
+                         f"({progress['percent']}%)")
+        lines.append(f"Scheduled tasks: {status['scheduled']}")
+        lines.append(f"Queued: {', '.join(status['pending']) or '-'}")
+        messagebox.showinfo("BEBE daemon", "\n".join(lines))
+
+    def daemon_stop(self):
+        """Oprește redarea din daemon (coada rămâne)"""
+        result = self._daemon_call('stop')
+        if result is not None:
+            self.lbl_daemon.config(text=f"Daemon: {'playback stopped' if result['stopped'] else 'nothing playing'}")
+
     def on_task_selected(self, event=None):
         """Callback cand se selecteaza un task din dropdown"""
         pass  # Poate fi folosit pentru preview
@@ -1549,7 +1169,7 @@ class BebeGUI:
             messagebox.showwarning(get_string('error'), get_string('select_task_from_list'))
             return
 
-        filepath = self.tasks_dir / f"{selected}.json"
+        filepath = self.tasks_dir / selected
         if not filepath.exists():
             messagebox.showerror(get_string('error'), get_string('file_not_found', filename=filepath.name))
             self.refresh_task_list()
@@ -1558,31 +1178,106 @@ class BebeGUI:
         self._load_task_file(filepath)
 
     def _load_task_file(self, filepath):
-        """Încarcă un fișier task (metodă consolidată pentru error handling)"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            messagebox.showerror(get_string('error'), get_string('error_json_parse', error=str(e)))
+        """Pornește încărcarea unui task în fundal; fereastra rămâne responsivă"""
+        self._cancel_task_load()
+        if self._file_label_before_load is None:
+            self._file_label_before_load = (self.lbl_file.cget('text'), self.lbl_file.cget('foreground'))
+        self.load_job = TaskLoadJob(filepath, self.player.backend).start()
+        self._load_preview_shown = False
+        self.logger.info(f"Loading task in background: {filepath}")
+
+        # Play devine disponibil abia când planul de execuție e gata
+        if not self.player.playing:
+            self.btn_play.config(state=tk.DISABLED)
+        self.lbl_file.config(text=f"Loading {filepath.name}...", foreground="gray")
+        self.load_progress.config(mode='indeterminate', value=0)
+        self.lbl_load_status.config(text="")
+        self.load_frame.pack(fill=tk.X, pady=(0, 10), after=self._file_btn_frame)
+        self._load_after_id = self.root.after(LOAD_POLL_INTERVAL_MS, self._poll_task_load)
+
+    def _poll_task_load(self):
+        """Citește starea job-ului de încărcare (thread-ul Tk) și actualizează progresul"""
+        self._load_after_id = None
+        job = self.load_job
+        if job is None:
             return
-        except PermissionError:
-            messagebox.showerror(get_string('error'), get_string('error_permission'))
+        if job.preview is not None and not self._load_preview_shown:
+            # Primele rânduri, înainte de încărcarea completă (doar afișare)
+            self._load_preview_shown = True
+            self.event_table.set_source(job.preview)
+
+        if job.stage == STAGE_DONE:
+            self._finish_task_load(job)
             return
-        except IOError as e:
-            messagebox.showerror(get_string('error'), get_string('error_file_io'))
+        if job.stage == STAGE_ERROR:
+            self._task_load_failed(job)
             return
-        except Exception as e:
-            messagebox.showerror(get_string('error'), get_string('error_loading', error=str(e)))
+        if job.stage == STAGE_CANCELLED:
+            self._end_task_load(restore=True)
             return
 
-        # Validare format
-        if 'events' not in data:
+        if job.total:
+            self.load_progress.config(mode='determinate', value=job.percent())
+            self.lbl_load_status.config(text=f"{job.loaded:,} / {job.total:,} events ({job.stage})")
+        else:
+            self.load_progress.step(5)
+            self.lbl_load_status.config(text=f"{job.stage}...")
+        self._load_after_id = self.root.after(LOAD_POLL_INTERVAL_MS, self._poll_task_load)
+
+    def cancel_task_load(self):
+        """Anulează încărcarea în curs (ex: s-a ales fișierul greșit)"""
+        if self.load_job is not None:
+            self.logger.info(f"Task load cancelled: {self.load_job.path}")
+            self._cancel_task_load()
+
+    def _cancel_task_load(self):
+        if self.load_job is not None:
+            self.load_job.cancel()
+            self._end_task_load(restore=True)
+
+    def _end_task_load(self, restore=False):
+        """Oprește citirea progresului și ascunde bara; cu restore, tabelul revine la task-ul anterior"""
+        if self._load_after_id is not None:
+            self.root.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        self.load_job = None
+        self.load_frame.pack_forget()
+        if restore:
+            self.event_table.set_source(self.current_events)
+            if self._file_label_before_load is not None:
+                text, foreground = self._file_label_before_load
+                self.lbl_file.config(text=text, foreground=foreground)
+        self._file_label_before_load = None
+        if not self.player.playing and not self.recorder.recording:
+            self.btn_play.config(state=tk.NORMAL)
+
+    def _task_load_failed(self, job):
+        """Aceleași mesaje ca la încărcarea sincronă"""
+        self._end_task_load(restore=True)
+        e = job.error
+        self.logger.error(f"Task load failed: {job.path}: {e}")
+        if isinstance(e, json.JSONDecodeError):
+            messagebox.showerror(get_string('error'), get_string('error_json_parse', error=str(e)))
+        elif isinstance(e, PermissionError):
+            messagebox.showerror(get_string('error'), get_string('error_permission'))
+        elif isinstance(e, task_io.TaskFormatError):
             messagebox.showerror(get_string('error'), get_string('error_invalid_format'))
-            return None
+        elif isinstance(e, IOError):
+            messagebox.showerror(get_string('error'), get_string('error_file_io'))
+        else:
+            messagebox.showerror(get_string('error'), get_string('error_loading', error=str(e)))
 
+    def _finish_task_load(self, job):
+        """Task-ul e încărcat și planul compilat: devine task-ul curent"""
+        filepath = job.path
+        data = job.data
+        self._end_task_load()
         try:
-            self.current_events = data['events']
+            self._set_events(job.events)
+            # Planul a fost compilat în fundal
+            self.current_plan = job.plan
             self.lbl_file.config(text=filepath.name, foreground="blue")
+            self.current_task_path = filepath
             self.schedule_config = data.get('schedule') or None
 
             playback = data.get('playback')
@@ -1604,19 +1299,21 @@ class BebeGUI:
                 # Restaurează Run Until Stop
                 self.run_until_stop_var.set(bool(playback.get('run_until_stop', False)))
 
-            # Afiseaza in treeview
-            self.tree.delete(*self.tree.get_children())
-            for i, event in enumerate(self.current_events, 1):
-                details = format_event_details(event)
-                self.tree.insert('', tk.END, values=(
-                    i,
-                    f"{event['timestamp']:.3f}",
-                    event['type'],
-                    details
-                ))
-
-            if self.schedule_config and not self.schedule_running:
+                timer_precision = playback.get('timer_precision', DEFAULT_TIMER_PRECISION)
+                if timer_precision in TIMER_PRECISIONS:
+                    self.timer_precision_var.set(timer_precision)
+
+            # Afiseaza in tabel (doar rândurile vizibile sunt formatate)
+            self.event_table.set_source(self.current_events)
+
+            # Programarea task-ului încărcat o înlocuiește pe cea anterioară
+            if self.schedule_config:
                 self._start_schedule_thread()
+            elif self.schedule_running:
+                self.schedule_running = False
+                self.task_scheduler.remove_task(self._schedule_key)
+                self._schedule_key = None
+            self._sync_library_schedules()
 
             messagebox.showinfo(
                 get_string('success'),
@@ -1677,92 +1374,93 @@ class BebeGUI:
 
     def show_tree_context_menu(self, event):
         """Afișează context menu pentru Treeview"""
-        # Identifică item-ul sub cursor
-        item = self.tree.identify_row(event.y)
-        if item:
-            # NU schimba selecția dacă item-ul e deja în selecție (multi-select)
-            if item not in self.tree.selection():
-                self.tree.selection_set(item)
+        # Identifică rândul sub cursor
+        index = self.event_table.index_at(event.y)
+        if index is not None:
+            # NU schimba selecția dacă rândul e deja în selecție (multi-select)
+            if index not in self.event_table.selected:
+                self.event_table.selection_set([index])
             self.tree_context_menu.post(event.x_root, event.y_root)
 
+    def _editing_blocked(self):
+        """În timpul încărcării tabelul arată doar primele rânduri: editările așteaptă"""
+        if self.load_job is not None:
+            messagebox.showwarning("Warning", "Please wait until the task finishes loading!")
+            return True
+        return False
+
     def delete_selected_event(self):
         """Șterge evenimentul selectat"""
-        selection = self.tree.selection()
+        if self._editing_blocked():
+            return
+        selection = self.event_table.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select an event to delete!")
             return
 
-        # Obține indexul evenimentului selectat
-        item = selection[0]
-        item_values = self.tree.item(item)['values']
-        if not item_values:
-            return
-
-        event_index = int(item_values[0]) - 1  # Index 0-based
+        # Indexul evenimentului selectat (0-based)
+        event_index = selection[0]
 
         # Confirmă ștergerea
         if messagebox.askyesno("Confirm Delete", f"Delete event #{event_index + 1}?"):
             # Șterge din lista de evenimente
             if 0 <= event_index < len(self.current_events):
-                deleted_event = self.current_events.pop(event_index)
+                started = time.perf_counter()
+                deleted_event = self.current_events[event_index]
+                self._apply_edit(self.current_events.delete([event_index]), 'delete')
                 self.logger.info(f"Deleted event #{event_index + 1}: {deleted_event}")
 
-                # Reîmprospătează Treeview
-                self._refresh_event_list()
+                # Actualizează doar rândurile afectate
+                self.event_table.rows_removed([event_index])
+                self._log_edit_latency('delete', started, 1)
                 messagebox.showinfo("Success", f"Event #{event_index + 1} deleted!")
 
     def delete_all_events(self):
         """Șterge toate evenimentele"""
+        if self._editing_blocked():
+            return
         if not self.current_events:
             messagebox.showwarning("Warning", "No events to delete!")
             return
 
         if messagebox.askyesno("Confirm Delete All",
                               f"Delete all {len(self.current_events)} events?"):
-            self.current_events.clear()
-            self._refresh_event_list()
+            self._apply_edit(EventRope(), 'delete all')
+            self.event_table.set_source(self.current_events)
             self.logger.info("All events deleted")
             messagebox.showinfo("Success", "All events deleted!")
 
     def delete_selected_group(self):
         """Șterge grupul de evenimente selectate (multi-select)"""
-        selection = self.tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select events to delete!")
+        if self._editing_blocked():
             return
-
-        # Obține indexurile evenimentelor selectate
-        indices_to_delete = []
-        for item in selection:
-            item_values = self.tree.item(item)['values']
-            if item_values:
-                event_index = int(item_values[0]) - 1  # Index 0-based
-                indices_to_delete.append(event_index)
-
+        # Indexurile evenimentelor selectate (0-based)
+        indices_to_delete = self.event_table.selection()
         if not indices_to_delete:
+            messagebox.showwarning("Warning", "Please select events to delete!")
             return
 
-        # Sortează și elimină duplicate
-        indices_to_delete = sorted(set(indices_to_delete), reverse=True)
         count = len(indices_to_delete)
 
         # Confirmă ștergerea
         if messagebox.askyesno("Confirm Delete Group",
                               f"Delete {count} selected event(s)?"):
-            # Șterge în ordine inversă pentru a păstra indexurile corecte
-            deleted_count = 0
-            for index in indices_to_delete:
-                if 0 <= index < len(self.current_events):
-                    self.current_events.pop(index)
-                    deleted_count += 1
+            # O singură versiune nouă: sunt copiate doar bucățile atinse
+            started = time.perf_counter()
+            deleted = [index for index in indices_to_delete if 0 <= index < len(self.current_events)]
+            deleted_count = len(deleted)
+            self._apply_edit(self.current_events.delete(deleted), 'delete group')
 
             self.logger.info(f"Deleted {deleted_count} events from group")
-            self._refresh_event_list()
+            self.event_table.rows_removed(deleted)
+            self._log_edit_latency('delete group', started, deleted_count)
             messagebox.showinfo("Success", f"{deleted_count} event(s) deleted!")
 
     def scale_timestamps_dialog(self):
         """Dialog pentru scalarea timestamp-urilor evenimentelor selectate"""
-        selection = self.tree.selection()
+        if self._editing_blocked():
+            return
+        selection = self.event_table.selection()
         if not selection:
             messagebox.showwarning("Warning", "Please select events to scale!")
             return
@@ -1807,34 +1505,31 @@ class BebeGUI:
                 messagebox.showerror("Error", "Factor must be greater than 0!")
                 return
 
-            # Obține indexurile selectate
-            indices = []
-            for item in selection:
-                item_values = self.tree.item(item)['values']
-                if item_values:
-                    indices.append(int(item_values[0]) - 1)
-
-            indices.sort()
+            # Indexurile selectate (sortate)
+            indices = list(selection)
 
             if len(indices) < 2:
                 return
 
+            started = time.perf_counter()
             # Scalează timestamp-urile - păstrează primul timestamp și scalează delta-urile
-            first_timestamp = self.current_events[indices[0]]['timestamp']
-
-            for i in range(1, len(indices)):
-                idx = indices[i]
-                prev_idx = indices[i - 1]
+            events = self.current_events
+            previous = events[indices[0]]['timestamp']
+            changes = {}
 
-                # Calculează delta scalat
-                original_delta = self.current_events[idx]['timestamp'] - self.current_events[prev_idx]['timestamp']
+            for idx in indices[1:]:
+                # Calculează delta scalat (față de timestamp-ul deja scalat al evenimentului anterior)
+                original_delta = events[idx]['timestamp'] - previous
                 scaled_delta = original_delta / factor
 
-                # Aplică noul timestamp
-                self.current_events[idx]['timestamp'] = self.current_events[prev_idx]['timestamp'] + scaled_delta
+                # Noul timestamp
+                previous = previous + scaled_delta
+                changes[idx] = {'timestamp': previous}
 
+            self._apply_edit(events.set_fields(changes), 'scale')
             self.logger.info(f"Scaled {len(indices)} events by factor {factor}")
-            self._refresh_event_list()
+            self.event_table.rows_changed(indices[1:])
+            self._log_edit_latency('scale', started, len(indices))
             dialog.destroy()
             messagebox.showinfo("Success", f"Timestamps scaled by {factor}x for {len(indices)} events!")
 
@@ -1844,29 +1539,56 @@ class BebeGUI:
         ttk.Button(btn_frame, text="Apply", command=apply_scale, width=12).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy, width=12).pack(side=tk.LEFT, padx=5)
 
-    def _refresh_event_list(self):
-        """Reîmprospătează lista de evenimente în Treeview"""
-        # Șterge toate item-urile
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _set_events(self, events):
+        """Evenimente noi (încărcare / înregistrare): istoricul de editări se golește"""
+        self.current_events = EventRope.from_events(events)
+        self.edit_history.clear()
 
-        # Re-adaugă evenimentele
-        for i, event in enumerate(self.current_events):
-            time_str = f"{event.get('timestamp', 0):.2f}s"
-            event_type = event.get('type', '')
+    def _apply_edit(self, new_events, label):
+        """Înlocuiește current_events cu versiunea editată; cea veche rămâne pentru undo"""
+        self.edit_history.record(self.current_events, label)
+        self.current_events = new_events
+        self.event_table.source = new_events
+        self._invalidate_plan()
 
-            # Generează detalii
-            details = []
-            if 'x' in event and 'y' in event:
-                details.append(f"({event['x']}, {event['y']})")
-            if 'key' in event:
-                details.append(f"Key: {event['key']}")
-            if 'button' in event:
-                details.append(f"Button: {event['button']}")
+    def undo_edit(self):
+        """Revine la versiunea de dinaintea ultimei editări (Ctrl+Z)"""
+        self._step_history(self.edit_history.undo, 'undo')
 
-            detail_str = " ".join(details)
+    def redo_edit(self):
+        """Reface editarea anulată (Ctrl+Y)"""
+        self._step_history(self.edit_history.redo, 'redo')
 
-            self.tree.insert('', tk.END, values=(i + 1, time_str, event_type, detail_str))
+    def _step_history(self, step, operation):
+        if self.recorder.recording or self.load_job is not None:
+            return
+        started = time.perf_counter()
+        result = step(self.current_events)
+        if result is None:
+            self.lbl_status.config(text=f"Nothing to {operation}", foreground="gray")
+            return
+        self.current_events, label = result
+        self._invalidate_plan()
+        self.event_table.replace_source(self.current_events)
+        self._log_edit_latency(f"{operation} {label}", started, len(self.current_events))
+        self.lbl_status.config(text=f"{operation.capitalize()}: {label} ({len(self.current_events)} events)",
+                               foreground="blue")
+
+    def _invalidate_plan(self):
+        """Planul compilat nu mai corespunde evenimentelor (după editare)"""
+        self.current_plan = None
+
+    def _get_plan(self):
+        """ExecutionPlan pentru current_events (compilat la nevoie, apoi refolosit)"""
+        if self.current_plan is None or self.current_plan.backend is not self.player.backend:
+            self.current_plan = compile_events(self.current_events, self.player.backend)
+        return self.current_plan
+
+    def _log_edit_latency(self, operation, started, rows):
+        """Durata unei editări (modificarea evenimentelor + actualizarea tabelului)"""
+        self.last_edit_ms = (time.perf_counter() - started) * 1000
+        self.logger.info(f"Edit {operation}: {rows} row(s) in {self.last_edit_ms:.2f}ms "
+                         f"(table {self.event_table.last_update_ms:.2f}ms, {len(self.current_events)} events)")
 
     def toggle_mini_mode(self):
         """Enhanced mini mode with icons only"""
@@ -1982,32 +1704,59 @@ class BebeGUI:
             self.mini_status.config(text="Recording...")
 
     def add_event_to_list(self, event_text):
-        """Adauga eveniment in lista"""
-        # Foloseste root.after pentru thread-safe update
+        """Adauga eveniment in coada de afisare (apelat din thread-ul consumator)"""
+        # Nu atingem Tk de aici - pump-ul periodic inserează rândurile în lot
         if len(self.recorder.events) > 0:
-            event = self.recorder.events[-1]
-            self.root.after(0, self._insert_event, event)
-
-    def _insert_event(self, event):
-        """Insereaza eveniment in treeview (thread-safe)"""
-        details = format_event_details(event)
-        self.tree.insert('', tk.END, values=(
-            len(self.recorder.events),
-            f"{event['timestamp']:.3f}",
-            event['type'],
-            details
-        ))
-        self.tree.yview_moveto(1)  # Scroll la sfarsit
+            self._pending_rows.append(self.recorder.events[-1])
+
+    def _start_event_pump(self):
+        """Pornește pump-ul periodic pentru rândurile capturate live"""
+        self._pending_rows.clear()
+        self._live_events = []
+        self._live_row_count = 0
+        self.last_pump_rows = 0
+        self.pump_stats = {'flushes': 0, 'rows': 0, 'max_rows': 0}
+        self._pump_after_id = self.root.after(EVENT_PUMP_INTERVAL_MS, self._pump_event_rows)
+
+    def _stop_event_pump(self):
+        """Oprește pump-ul și renunță la rândurile neafișate"""
+        if self._pump_after_id is not None:
+            self.root.after_cancel(self._pump_after_id)
+            self._pump_after_id = None
+        self._pending_rows.clear()
+
+    def _pump_event_rows(self):
+        """Inserează toate rândurile în așteptare dintr-o dată și derulează o singură dată"""
+        pending = self._pending_rows
+        count = len(pending)
+        for _ in range(count):
+            self._live_events.append(pending.popleft())
+        self._live_row_count += count
+        if count:
+            self.event_table.rows_appended()  # Scroll la sfarsit
+            self.pump_stats['flushes'] += 1
+            self.pump_stats['rows'] += count
+            self.pump_stats['max_rows'] = max(self.pump_stats['max_rows'], count)
+            self.logger.debug(f"Event pump: inserted {count} row(s)")
+        self.last_pump_rows = count
+
+        if self.recorder.recording:
+            self._pump_after_id = self.root.after(EVENT_PUMP_INTERVAL_MS, self._pump_event_rows)
+        else:
+            self._pump_after_id = None
 
     def start_recording(self):
         """Porneste inregistrarea"""
         self.logger.info("start_recording() called")
-        self.current_events = []
-        self.tree.delete(*self.tree.get_children())
+        self._cancel_task_load()
+        self._set_events(EventRope())
+        self._invalidate_plan()
 
         self.btn_start.config(state=tk.DISABLED)
         self.btn_stop.config(state=tk.NORMAL)
         self.lbl_status.config(text=get_string('recording_status'), foreground="red")
+        self._start_event_pump()
+        self.event_table.set_source(self._live_events)
 
         # Start in thread separat
         def record_thread():
@@ -2023,18 +1772,14 @@ class BebeGUI:
 
     def stop_recording(self):
         """Opreste inregistrarea"""
-        self.current_events = self.recorder.stop_recording()
+        self._set_events(self.recorder.stop_recording())
+        self._stop_event_pump()
+        self.logger.info(f"Event pump stats: {self.pump_stats}")
+        self.current_plan = compile_events(self.current_events, self.player.backend)
 
         # Actualizeaza tabelul cu toate evenimentele
-        self.tree.delete(*self.tree.get_children())
-        for i, event in enumerate(self.current_events, 1):
-            details = format_event_details(event)
-            self.tree.insert('', tk.END, values=(
-                i,
-                f"{event['timestamp']:.3f}",
-                event['type'],
-                details
-            ))
+        self.event_table.set_source(self.current_events)
+        self.event_table.rows_appended()
 
         self.btn_start.config(state=tk.NORMAL)
         self.btn_stop.config(state=tk.DISABLED)
@@ -2049,6 +1794,24 @@ class BebeGUI:
             messagebox.showwarning(get_string('error'), get_string('no_task_to_play'))
             return
 
+        # Un task programat poate avea player-ul rezervat înainte să pornească (plan în încărcare)
+        scheduled = self.task_scheduler.running_task
+        if scheduled is None and self.daemon_client is not None:
+            try:
+                status = self.daemon_client.call('status')
+            except DaemonError:
+                status = None
+            if status and status['playing']:
+                self.logger.warning(f"Manual playback refused: daemon is playing {status['task']!r}")
+                messagebox.showwarning(get_string('error'),
+                                       f"BEBE daemon is playing '{status['task']}'. Stop it first.")
+                return
+        if scheduled is not None:
+            self.logger.warning(f"Manual playback refused: scheduled task {scheduled.name!r} is running")
+            messagebox.showwarning(get_string('error'),
+                                   f"Scheduled task '{scheduled.name}' is running. Stop it first (ESC/F9).")
+            return
+
         self.logger.info(f"Playing {len(self.current_events)} events")
         self.btn_play.config(state=tk.DISABLED)
         self.btn_pause.config(state=tk.NORMAL)
@@ -2069,31 +1832,35 @@ class BebeGUI:
             self.logger.info(f"❌ Loop DISABLED: loop_var={loop_enabled}, defaulting to loop=1")
 
         run_until_stop = self.run_until_stop_var.get()
+        timer_precision = self.timer_precision_var.get()
 
-        self.logger.info(f"📊 FINAL Playback settings: speed={speed}, loop={loop}, run_until_stop={run_until_stop}")
+        self.logger.info(f"📊 FINAL Playback settings: speed={speed}, loop={loop}, run_until_stop={run_until_stop}, timer={timer_precision}")
 
         # Activează listener pentru ESC/F9 (întotdeauna, nu doar pentru run_until_stop)
         self._start_playback_keyboard_listener()
 
+        plan = self._get_plan()
+        self._start_progress_sampler()
+
         def play_thread():
             self.logger.info("Playback thread started")
-            self.player.play_events(self.current_events, speed=speed, loop_count=loop,
-                                   callback=lambda msg: self.root.after(0, lambda: self.lbl_play_status.config(text=msg)),
-                                   run_until_stop=run_until_stop)
+            self.player.play_events(plan, speed=speed, loop_count=loop,
+                                   run_until_stop=run_until_stop,
+                                   timer_precision=timer_precision)
             self.logger.info("Playback finished")
             self.root.after(0, self._playback_finished)
 
         threading.Thread(target=play_thread, daemon=True).start()
 
-    def play_task_with_settings(self, speed=None, loop_count=1, run_until_stop=False):
-        """Rulează task-ul cu setări explicite (folosit de schedule)"""
+    def play_task_with_settings(self, speed=None, loop_count=1, run_until_stop=False, plan=None):
+        """Rulează task-ul cu setări explicite (folosit de schedule; `plan` = planul precompilat al task-ului programat)"""
         self.logger.info(f"play_task_with_settings() called: speed={speed}, loop_count={loop_count}, run_until_stop={run_until_stop}")
 
-        if not self.current_events:
+        if plan is None and not self.current_events:
             self.logger.warning("No events to play")
             return
 
-        self.logger.info(f"Playing {len(self.current_events)} events with explicit settings")
+        self.logger.info(f"Playing {len(plan) if plan is not None else len(self.current_events)} events with explicit settings")
         self.btn_play.config(state=tk.DISABLED)
         self.btn_pause.config(state=tk.NORMAL)
         self.btn_stop_play.config(state=tk.NORMAL)
@@ -2102,37 +1869,68 @@ class BebeGUI:
         if speed is None:
             speed = self.speed_var.get()
         speed = max(0.1, min(10.0, speed))
+        timer_precision = self.timer_precision_var.get()
 
         self.logger.info(f"📊 EXPLICIT Playback settings: speed={speed}, loop_count={loop_count}, run_until_stop={run_until_stop}")
 
         # Activează listener pentru ESC/F9
         self._start_playback_keyboard_listener()
 
+        if plan is None:
+            plan = self._get_plan()
+        self._start_progress_sampler()
+
         def play_thread():
             self.logger.info(f"Playback thread started with EXPLICIT settings: loop_count={loop_count}, run_until_stop={run_until_stop}")
-            self.player.play_events(self.current_events, speed=speed, loop_count=loop_count,
-                                   callback=lambda msg: self.root.after(0, lambda: self.lbl_play_status.config(text=msg)),
-                                   run_until_stop=run_until_stop)
+            self.player.play_events(plan, speed=speed, loop_count=loop_count,
+                                   run_until_stop=run_until_stop,
+                                   timer_precision=timer_precision)
             self.logger.info("Playback finished")
             self.root.after(0, self._playback_finished)
 
         threading.Thread(target=play_thread, daemon=True).start()
 
     def _start_playback_keyboard_listener(self):
-        """Pornește listener pentru ESC/F9 în timpul redării"""
-        def on_press(key):
-            if key == Key.f9 or key == Key.esc:
-                self.player.stop()
-                return False
+        """Înregistrează ESC/F9 (stop) pe hook-ul global pe durata redării"""
+        self._stop_playback_keyboard_listener()
+        self._playback_hotkeys = [self.hotkeys.register(key, self.player.stop) for key in (Key.f9, Key.esc)]
+
+    def _stop_playback_keyboard_listener(self):
+        for token in self._playback_hotkeys:
+            self.hotkeys.unregister(token)
+        self._playback_hotkeys = []
+
+    def _start_progress_sampler(self):
+        """Citește progresul player-ului la PROGRESS_SAMPLE_INTERVAL (10 Hz) în thread-ul Tk"""
+        self._stop_progress_sampler()
+        self._last_progress = None
+        self._progress_after_id = self.root.after(self._progress_interval_ms, self._sample_progress)
+
+    def _sample_progress(self):
+        self._progress_after_id = None
+        progress = self.player.progress
+        snapshot = progress.snapshot()
+        if snapshot != self._last_progress and not self.player.paused:
+            self._last_progress = snapshot
+            index, total, _, _, error = snapshot
+            if error:
+                text = error
+            else:
+                text = get_string('progress_playing', current=index, total=total, percent=progress.percent())
+            self.lbl_play_status.config(text=text)
+        if self.player.playing:
+            self._progress_after_id = self.root.after(self._progress_interval_ms, self._sample_progress)
 
-        self.playback_keyboard_listener = keyboard.Listener(on_press=on_press)
-        self.playback_keyboard_listener.start()
+    def _stop_progress_sampler(self):
+        if self._progress_after_id is not None:
+            self.root.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
 
     def _playback_finished(self):
         """Callback când redarea s-a terminat"""
-        if self.playback_keyboard_listener:
-            self.playback_keyboard_listener.stop()
-            self.playback_keyboard_listener = None
+        self._stop_progress_sampler()
+        self._stop_playback_keyboard_listener()
+        self.task_scheduler.playback_finished()  # Coada / programările amânate pot rula acum
 
         self.btn_play.config(state=tk.NORMAL)
         self.btn_pause.config(state=tk.DISABLED)
@@ -2179,9 +1977,9 @@ class BebeGUI:
     def stop_playback(self):
         """Opreste redarea"""
         self.player.stop()
-        if self.playback_keyboard_listener:
-            self.playback_keyboard_listener.stop()
-            self.playback_keyboard_listener = None
+        self._stop_progress_sampler()
+        self._stop_playback_keyboard_listener()
+        # Coada programărilor pornește din _playback_finished, după ce thread-ul de redare s-a oprit
         # Listener-ul Shift+Space rămâne activ pentru a putea fi folosit oricând
         self.btn_play.config(state=tk.NORMAL)
         self.btn_pause.config(state=tk.DISABLED)
@@ -2208,7 +2006,8 @@ class BebeGUI:
             # Șterge schedule-ul și oprește thread-ul
             self.schedule_config = None
             self.schedule_running = False
-            self.last_schedule_trigger = None
+            self.task_scheduler.remove_task(self._schedule_key)
+            self._schedule_key = None
             self.logger.info("Schedule DISABLED by user (explicit disable)")
             messagebox.showinfo("Schedule Disabled", "Schedule has been disabled and cleared.")
             return
@@ -2229,10 +2028,10 @@ class BebeGUI:
                 )
                 return
 
-            # Pornește thread-ul de scheduling dacă nu rulează deja
-            if not self.schedule_running:
-                self._start_schedule_thread()
-
+            # Pornește scheduler-ul; dacă rulează deja, programarea e doar înlocuită
+            was_running = self.schedule_running
+            self._start_schedule_thread()
+            if not was_running:
                 # Afișează mesaj de confirmare CU setările de playback
                 schedule_info = f"Schedule active!\n\n"
                 schedule_info += f"Days: {', '.join(result['days'])}\n"
@@ -2250,108 +2049,49 @@ class BebeGUI:
                     schedule_info += f"\n⚙️ Playback: Loop {loop_count}× (repeat {loop_count} times)"
                 else:
                     schedule_info += "\n⚙️ Playback: Single run (1 time)"
-
+                schedule_info += (f"\nPriority: {schedule_priority(result)}, if busy: {schedule_overlap(result)}, "
+                                  f"missed runs: {schedule_catch_up(result)}")
+
+                job = self.scheduler.get(self._schedule_key)
+                if job is None:
+                    schedule_info += "\nRuns in the BEBE daemon (schedule saved in the task file)"
+                elif job.next_fire:
+                    schedule_info += f"\nNext run: {job.next_fire:%A %H:%M}"
                 schedule_info += "\n\nTask will play automatically when conditions match."
 
                 messagebox.showinfo("Schedule Enabled", schedule_info)
 
     def _start_schedule_thread(self):
-        """Pornește thread-ul pentru scheduling"""
-        if self.schedule_running:
+        """Înregistrează programarea task-ului curent în scheduler (înlocuiește una existentă)"""
+        if not self.schedule_config:
             return
-
         self.schedule_running = True
-
-        def schedule_loop():
-            self.logger.info("Schedule loop started")
-            while self.schedule_running and self.schedule_config:
-                now = datetime.now()
-                current_time = now.time()
-                current_weekday = now.weekday()  # 0 = Monday, 6 = Sunday
-
-                # Mapare weekday la chei
-                weekday_map = {
-                    0: 'monday', 1: 'tuesday', 2: 'wednesday', 3: 'thursday',
-                    4: 'friday', 5: 'saturday', 6: 'sunday'
-                }
-                current_day_key = weekday_map[current_weekday]
-
-                # ✅ ADAUGĂ ACEASTĂ LINIE - citește playback settings din schedule
-                playback_settings = self.schedule_config.get('playback', {})
-
-                # Log verificare
-                self.logger.debug(f"Schedule check: day={current_day_key}, time={current_time.strftime('%H:%M:%S')}, events={len(self.current_events)}, playback={playback_settings}")
-
-                # Verifică dacă e ziua corectă
-                if current_day_key not in self.schedule_config['days']:
-                    self.logger.debug(f"Day mismatch: {current_day_key} not in {self.schedule_config['days']}")
-                    time.sleep(10)
-                    continue
-
-                # Verifică intervalul orar (dacă este activat)
-                time_interval_ok = True
-
-                if self.schedule_config.get('time_interval_enabled', False):
-                    try:
-                        time_from_str = self.schedule_config.get('time_from')
-                        time_to_str = self.schedule_config.get('time_to')
-
-                        if time_from_str and time_to_str:
-                            time_from = datetime.strptime(time_from_str, "%H:%M").time()
-                            time_to = datetime.strptime(time_to_str, "%H:%M").time()
-
-                            if time_from <= time_to:
-                                time_interval_ok = time_from <= current_time <= time_to
-                                self.logger.debug(f"Normal interval: {time_from} <= {current_time.strftime('%H:%M:%S')} <= {time_to} = {time_interval_ok}")
-                            else:
-                                time_interval_ok = current_time >= time_from or current_time <= time_to
-                                self.logger.debug(f"Overnight interval: {current_time.strftime('%H:%M:%S')} >= {time_from} OR <= {time_to} = {time_interval_ok}")
-                        else:
-                            time_interval_ok = False
-                            self.logger.warning("Time interval enabled but times not set")
-                    except Exception as e:
-                        self.logger.error(f"Schedule time parse error: {e}")
-                        time_interval_ok = False
-                else:
-                    self.logger.debug("Time interval not enabled - running all day")
-
-                # Rulează task-ul dacă toate condițiile sunt îndeplinite
-                if time_interval_ok:
-                    if not self.player.playing and self.current_events:
-                        current_minute = now.replace(second=0, microsecond=0)
-
-                        # Pentru Run Continuously - trigger la fiecare verificare
-                        # Pentru Loop sau default - trigger doar o dată per minut
-                        run_until_stop = playback_settings.get('run_until_stop', False)
-
-                        should_trigger = False
-                        if run_until_stop:
-                            should_trigger = True
-                            self.logger.debug("Run Continuously mode - triggering")
-                        elif self.last_schedule_trigger is None or self.last_schedule_trigger < current_minute:
-                            should_trigger = True
-                            self.last_schedule_trigger = current_minute
-                        else:
-                            self.logger.debug(f"Task already triggered this minute, skipping")
-
-                        if should_trigger:
-                            self.logger.info(f"✅ SCHEDULE TRIGGERED! day={current_day_key}, time={current_time.strftime('%H:%M:%S')}, playback={playback_settings}")
-                            # ✅ Acum playback_settings este definit corect
-                            self.root.after(0, lambda ps=playback_settings: self._play_scheduled_task(ps))
-                    elif self.player.playing:
-                        self.logger.debug("Task already playing, skipping trigger")
-                    elif not self.current_events:
-                        self.logger.warning("No events to play!")
-                else:
-                    self.logger.debug(f"Time interval condition not met")
-
-                time.sleep(10)
-
-        self.schedule_thread = threading.Thread(target=schedule_loop, daemon=True)
-        self.schedule_thread.start()
-
-
-    def _play_scheduled_task(self, playback_settings):
+        if self.current_task_path:
+            key, name = self.current_task_path.name, self.current_task_path.stem
+        else:
+            key, name = CURRENT_TASK_SCHEDULE, "current task"
+        if self._schedule_key not in (None, key):
+            self.task_scheduler.remove_task(self._schedule_key)
+        if self._daemon_schedules(key):
+            # Fișierul salvat e deja programat de daemon: o singură rulare, acolo
+            if self._schedule_key == key:
+                self.task_scheduler.remove_task(self._schedule_key)
+            self._schedule_key = None
+            self.logger.info(f"Schedule of {key} runs in the BEBE daemon")
+            return
+        self._schedule_key = key
+        # EventRope e imutabil: obiectul curent identifică versiunea planului din cache
+        task = ScheduledTask(key, name, self.schedule_config,
+                             lambda: self.current_events, lambda: self.current_events)
+        self.task_scheduler.set_task(task)
+        self.task_scheduler.start()
+        self.logger.info(f"Schedule active, next run: {self.scheduler.get(key).next_fire}")
+
+    def _start_scheduled_playback(self, task, plan, playback):
+        """Apelat de TaskScheduler (thread-ul scheduler-ului): redarea pornește pe thread-ul Tk"""
+        self.root.after(0, lambda: self._play_scheduled_task(playback, plan))
+
+    def _play_scheduled_task(self, playback_settings, plan=None):
         """Rulează task-ul cu setările salvate în schedule"""
         self.logger.info(f"🎬 Playing scheduled task with settings: {playback_settings}")
 
@@ -2371,11 +2111,18 @@ class BebeGUI:
         self.logger.info(f"✅ Schedule playback: loop_enabled={loop_enabled}, loop_count={loop_count}, run_until_stop={run_until_stop}")
         self.logger.info(f"✅ Final calculated: loop_count={final_loop_count}, run_until_stop={run_until_stop}")
 
+        # Task-urile din bibliotecă au viteza salvată; task-ul curent folosește viteza din GUI
+        try:
+            speed = float(playback_settings.get('speed', self.speed_var.get()))
+        except (TypeError, ValueError):
+            speed = self.speed_var.get()
+
         # Rulează task-ul CU SETĂRI EXPLICITE (nu se bazează pe GUI)
         self.play_task_with_settings(
-            speed=self.speed_var.get(),
+            speed=speed,
             loop_count=final_loop_count,
-            run_until_stop=run_until_stop
+            run_until_stop=run_until_stop,
+            plan=plan
         )
 
     def _build_task_data(self, task_name=None):
@@ -2384,13 +2131,14 @@ class BebeGUI:
             'speed': float(self.speed_var.get()),
             'loop': bool(self.loop_var.get()),
             'loop_count': int(self.loop_count_var.get()),
-            'run_until_stop': bool(self.run_until_stop_var.get())
+            'run_until_stop': bool(self.run_until_stop_var.get()),
+            'timer_precision': self.timer_precision_var.get()
         }
         data = {
             'version': TASK_DATA_VERSION,
             'created': datetime.now().isoformat(),
             'event_count': len(self.current_events),
-            'events': self.current_events,
+            'events': as_event_dicts(self.current_events),
             'schedule': self.schedule_config,
             'playback': playback
         }
@@ -2422,297 +2170,52 @@ class BebeGUI:
             self.logger.error("Nu am putut scrie log-ul: %s", e)
         return log_path
 
-    def _generate_runner_script(self, task_data, exe_name):
-        """Generează scriptul Python ce va fi compilat în executabil"""
-        data = dict(task_data)
-        data.setdefault('name', exe_name)
-        task_data_repr = repr(data)
-        title_repr = repr(f"{exe_name} - BEBE Task Runner")
-        template = textwrap.dedent(
-            """\
-            #!/usr/bin/env python3
-            # -*- coding: utf-8 -*-
-            \"\"\"Autogenerated runner for BEBE Task Recorder.\"\"\"
-
-            import sys
-            import time
-            import ctypes
-            from datetime import datetime
-            import pyautogui
-            from pynput import keyboard
-            from pynput.keyboard import Key, Controller as KeyboardController
-
-            TASK_DATA = __TASK_DATA__
-
-            pyautogui.PAUSE = 0.01
-            pyautogui.FAILSAFE = True
-
-            def is_admin():
-                try:
-                    return ctypes.windll.shell32.IsUserAnAdmin()
-                except Exception:
-                    return False
-
-            def run_as_admin():
-                if not is_admin():
-                    ctypes.windll.shell32.ShellExecuteW(
-                        None, 'runas', sys.executable, ' '.join(sys.argv), None, 1
-                    )
-                    sys.exit()
-
-            def show_message(title, message):
-                try:
-                    ctypes.windll.user32.MessageBoxW(None, message, title, 0)
-                except Exception:
-                    pass
-
-            class TaskPlayer:
-                def __init__(self, speed=1.0, loop_count=1, run_until_stop=False):
-                    self.keyboard_controller = KeyboardController()
-                    self.speed = max(0.1, min(10.0, speed))
-                    self.loop_count = max(1, loop_count)
-                    self.run_until_stop = run_until_stop
-                    self.stop_requested = False
-                    self.listener = None
-
-                def _start_listener(self):
-                    if not self.run_until_stop:
-                        return
-
-                    def on_press(key):
-                        if key in (Key.esc, Key.f9):
-                            self.stop_requested = True
-                            return False
-
-                    self.listener = keyboard.Listener(on_press=on_press)
-                    self.listener.start()
-
-                def _stop_listener(self):
-                    if self.listener:
-                        self.listener.stop()
-                        self.listener = None
-
-                def play(self, events):
-                    self._start_listener()
-                    loops = 0
-                    try:
-                        while True:
-                            loops += 1
-                            for index, event in enumerate(events):
-                                if self.stop_requested:
-                                    break
-                                if index > 0:
-                                    delay = (event['timestamp'] - events[index - 1]['timestamp']) / self.speed
-                                    if delay > 0:
-                                        time.sleep(delay)
-                                self.execute_event(event)
-                            if self.stop_requested:
-                                break
-                            if not self.run_until_stop and loops >= self.loop_count:
-                                break
-                    finally:
-                        self._stop_listener()
-
-                def execute_event(self, event):
-                    event_type = event.get('type')
-                    if event_type == 'mouse_move':
-                        pyautogui.moveTo(event['x'], event['y'], duration=0)
-                    elif event_type == 'mouse_click':
-                        button_name = event.get('button', '').lower()
-                        button = 'left'
-                        if 'right' in button_name:
-                            button = 'right'
-                        elif 'middle' in button_name:
-                            button = 'middle'
-                        pyautogui.moveTo(event['x'], event['y'], duration=0)
-                        if event.get('pressed'):
-                            pyautogui.mouseDown(button=button)
-                        else:
-                            pyautogui.mouseUp(button=button)
-                    elif event_type == 'mouse_scroll':
-                        pyautogui.scroll(int(event.get('dy', 0) * 100))
-                    elif event_type == 'key_press':
-                        self._handle_key(event.get('key', ''), press=True)
-                    elif event_type == 'key_release':
-                        self._handle_key(event.get('key', ''), press=False)
-
-                def _handle_key(self, key_name, press=True):
-                    if not key_name:
-                        return
-                    modifiers = []
-                    main_key = key_name
-                    if '+' in key_name:
-                        parts = key_name.split('+')
-                        modifiers = parts[:-1]
-                        main_key = parts[-1]
-                    main_key = main_key.strip("'\\"")
-
-                    for mod in modifiers:
-                        mod_lower = mod.lower()
-                        if mod_lower == 'ctrl':
-                            (self.keyboard_controller.press if press else self.keyboard_controller.release)(Key.ctrl)
-                        elif mod_lower == 'alt':
-                            (self.keyboard_controller.press if press else self.keyboard_controller.release)(Key.alt)
-                        elif mod_lower == 'shift':
-                            (self.keyboard_controller.press if press else self.keyboard_controller.release)(Key.shift)
-
-                    key = self._parse_key(main_key)
-                    if press:
-                        self.keyboard_controller.press(key)
-                    else:
-                        self.keyboard_controller.release(key)
-
-                    if not press:
-                        for mod in reversed(modifiers):
-                            mod_lower = mod.lower()
-                            if mod_lower == 'ctrl':
-                                self.keyboard_controller.release(Key.ctrl)
-                            elif mod_lower == 'alt':
-                                self.keyboard_controller.release(Key.alt)
-                            elif mod_lower == 'shift':
-                                self.keyboard_controller.release(Key.shift)
-
-                def _parse_key(self, key_str):
-                    special_keys = {
-                        'space': Key.space, 'enter': Key.enter, 'tab': Key.tab,
-                        'backspace': Key.backspace, 'esc': Key.esc, 'escape': Key.esc,
-                        'shift': Key.shift, 'ctrl': Key.ctrl, 'alt': Key.alt,
-                        'up': Key.up, 'down': Key.down, 'left': Key.left, 'right': Key.right,
-                        'delete': Key.delete, 'home': Key.home, 'end': Key.end,
-                        'page_up': Key.page_up, 'page_down': Key.page_down,
-                        'insert': Key.insert, 'caps_lock': Key.caps_lock, 'num_lock': Key.num_lock,
-                        'scroll_lock': Key.scroll_lock,
-                        'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
-                        'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
-                        'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
-                    }
-                    key_clean = key_str.replace('Key.', '').lower()
-                    if key_clean in special_keys:
-                        return special_keys[key_clean]
-                    if len(key_str) == 1:
-                        return key_str
-                    return key_str
-
-            def schedule_allows_run(schedule):
-                if not schedule or not schedule.get('enabled'):
-                    return True
-                now = datetime.now()
-                day_map = {
-                    0: 'monday', 1: 'tuesday', 2: 'wednesday', 3: 'thursday',
-                    4: 'friday', 5: 'saturday', 6: 'sunday'
-                }
-                current_day = day_map.get(now.weekday())
-                if current_day not in schedule.get('days', []):
-                    return False
-                try:
-                    start = datetime.strptime(schedule.get('time_from', '00:00'), '%H:%M').time()
-                    end = datetime.strptime(schedule.get('time_to', '23:59'), '%H:%M').time()
-                except Exception:
-                    return True
-                current_time = now.time()
-                return start <= current_time <= end
-
-            def main():
-                title = __TITLE__
-                run_as_admin()
-                data = TASK_DATA
-                events = data.get('events', [])
-                if not events:
-                    show_message(title, 'Acest executabil nu contine niciun eveniment de redat.')
-                    return
-                schedule = data.get('schedule')
-                if schedule and not schedule_allows_run(schedule):
-                    show_message(title, 'Executia este programata pentru un alt interval.')
-                    return
-                playback = data.get('playback', {})
-                speed = float(playback.get('speed', 1.0))
-                loop = bool(playback.get('loop', False))
-                run_until_stop = bool(playback.get('run_until_stop', False))
-                loop_count = 999 if loop and not run_until_stop else 1
-                player = TaskPlayer(speed=speed, loop_count=loop_count, run_until_stop=run_until_stop)
-                show_message(title, 'Task-ul va incepe in 3 secunde. Inchide acest mesaj pentru a continua.')
-                time.sleep(3)
-                player.play(events)
-                show_message(title, 'Task finalizat.')
-
-            if __name__ == '__main__':
-                main()
-            """
-        )
-        template = template.replace("__TASK_DATA__", task_data_repr)
-        template = template.replace("__TITLE__", title_repr)
-        return template
-
-    def _build_task_executable(self, exe_path):
-        """Construiește executabilul folosind PyInstaller"""
+    def _build_task_executable(self, exe_path, on_done=None):
+        """
+        Exportă task-ul ca executabil: runner-ul comun (compilat cu PyInstaller
+        doar când i se schimbă sursele, vezi runner_build.py) + <nume>.bebetask.
+        Exportul rulează în fundal - compilarea runner-ului poate dura minute;
+        rezultatul ajunge pe thread-ul Tk prin on_done(task_data, error).
+        """
+        if self._export_thread is not None and self._export_thread.is_alive():
+            messagebox.showwarning(get_string('error'), "An executable export is already running.")
+            return None
         exe_path = Path(exe_path)
         task_name = exe_path.stem
-        print(f"[DEBUG] _build_task_executable: task_name={task_name}")
+        # Datele task-ului sunt citite acum, pe thread-ul Tk
         task_data = self._build_task_data(task_name)
-        script_content = self._generate_runner_script(task_data, task_name)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
-            print(f"[DEBUG] Temporary builder dir: {temp_dir_path}")
-            runner_file = temp_dir_path / "task_runner.py"
-            runner_file.write_text(script_content, encoding='utf-8')
-            print(f"[DEBUG] Runner script written: {runner_file}")
-
-            # Find Python executable - if frozen, search for python.exe in PATH
-            if getattr(sys, 'frozen', False):
-                # Running from EXE - find python.exe
-                python_exe = shutil.which('python') or shutil.which('python3')
-                if not python_exe:
-                    raise RuntimeError("Python nu a fost gasit in PATH. Instaleaza Python si adauga-l in PATH.")
-            else:
-                # Running from Python source
-                python_exe = sys.executable
-
-            print(f"[DEBUG] Using Python: {python_exe}")
-
-            cmd = [
-                python_exe,
-                "-m",
-                "PyInstaller",
-                "--onefile",
-                "--noconsole",
-                "--clean",
-                "--uac-admin",
-                f"--name={task_name}",
-                str(runner_file)
-            ]
-            self.logger.info("Rulez PyInstaller pentru task '%s'", task_name)
-            self.logger.debug("Comanda PyInstaller: %s", " ".join(cmd))
-            print(f"[DEBUG] Executing PyInstaller command: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                cwd=temp_dir,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            print(f"[DEBUG] PyInstaller return code: {result.returncode}")
-            if result.stdout:
-                print("[DEBUG] PyInstaller STDOUT:")
-                print(result.stdout)
-            if result.stderr:
-                print("[DEBUG] PyInstaller STDERR:")
-                print(result.stderr)
-            if result.returncode != 0:
-                error_output = result.stderr or result.stdout or "PyInstaller a esuat fara mesaje."
-                self.logger.error("PyInstaller error output: %s", error_output)
-                raise RuntimeError(error_output)
-            built_exe = temp_dir_path / "dist" / f"{task_name}.exe"
-            print(f"[DEBUG] Expected built EXE path: {built_exe}")
-            if not built_exe.exists():
-                raise FileNotFoundError("PyInstaller nu a generat executabilul asteptat.")
-            exe_path.parent.mkdir(parents=True, exist_ok=True)
-            if exe_path.exists():
-                print(f"[DEBUG] Existing EXE found at destination. Removing: {exe_path}")
-                exe_path.unlink()
-            shutil.move(str(built_exe), str(exe_path))
-            print(f"[DEBUG] EXE moved to destination: {exe_path}")
+
+        def export_thread():
+            started = time.perf_counter()
+            payload = error = None
+            try:
+                payload = export_task_executable(exe_path, task_data)
+            except Exception as e:
+                self.logger.error(f"Export failed for {exe_path}: {e}", exc_info=True)
+                error = e
+            elapsed = time.perf_counter() - started
+            self.root.after(0, lambda: self._task_export_finished(
+                exe_path, task_data, payload, error, elapsed, on_done))
+
+        self.logger.info(f"Exporting task '{task_name}' as {exe_path.name} in background")
+        self._export_thread = threading.Thread(target=export_thread, daemon=True)
+        self._export_thread.start()
         return task_data
 
+    def _task_export_finished(self, exe_path, task_data, payload, error, elapsed, on_done=None):
+        """Rezultatul exportului (thread-ul Tk)"""
+        self._export_thread = None
+        if error is None:
+            self.logger.info("Task '%s' exportat ca %s + %s in %.2fs", exe_path.stem, exe_path.name,
+                             payload.name, elapsed)
+        if on_done is not None:
+            on_done(task_data, error)
+        elif error is None:
+            messagebox.showinfo(get_string('success'),
+                                f"Exported {exe_path.name} + {payload.name}\n{exe_path.parent}")
+        else:
+            messagebox.showerror(get_string('error'), f"Export failed: {error}")
+
     def save_task(self):
         """Salveaza task"""
         if not self.current_events:
@@ -2721,7 +2224,8 @@ class BebeGUI:
 
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("JSON files", "*.json"), ("BEBE binary task", "*.bebt"),
+                       ("JSON Lines task", "*.jsonl"), ("BEBE compressed task", "*.bebz")],
             initialdir=self.tasks_dir
         )
 
@@ -2730,14 +2234,16 @@ class BebeGUI:
                 filepath = Path(filename)
                 task_data = self._build_task_data(filepath.stem)
 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(task_data, f, indent=2, ensure_ascii=False)
+                task_io.save_task(filepath, task_data)
 
                 log_path = self._write_task_log(filepath, task_data)
 
                 self.lbl_file.config(text=filepath.name, foreground="blue")
+                self.current_task_path = filepath
+                if self.schedule_running:
+                    self._start_schedule_thread()  # Programarea trece pe numele noului fișier
                 self.refresh_task_list()
-                self.task_var.set(filepath.stem)
+                self.task_var.set(filepath.name)
 
                 messagebox.showinfo(
                     get_string('success'),
@@ -2757,7 +2263,9 @@ class BebeGUI:
     def load_task(self):
         """Incarca task"""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("Task files", "*.json *.bebt *.jsonl *.bebz"), ("JSON files", "*.json"),
+                       ("BEBE binary task", "*.bebt"), ("JSON Lines task", "*.jsonl"),
+                       ("BEBE compressed task", "*.bebz")],
             initialdir=self.tasks_dir
         )
 
@@ -2797,127 +2305,9 @@ def debug_log(message):
 
 
 def run_cli():
-    """Command-line interface for BEBE"""
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        description="BEBE Task Recorder - CLI Mode",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-
-    subparsers = parser.add_subparsers(dest='command', required=True)
-
-    # Play command
-    play_parser = subparsers.add_parser('play', help='Play a task file')
-    play_parser.add_argument('file', help='JSON task file path')
-    play_parser.add_argument('--speed', type=float, default=2.0,
-                            help='Playback speed (0.1-10.0)')
-    play_parser.add_argument('--loop', type=int, default=1,
-                            help='Number of repetitions')
-
-    # List command
-    subparsers.add_parser('list', help='List saved tasks')
-
-    # Info command
-    info_parser = subparsers.add_parser('info', help='Show task info')
-    info_parser.add_argument('file', help='JSON task file path')
-
-    # Export BAT command
-    export_parser = subparsers.add_parser('export-bat',
-                                         help='Export task as BAT file')
-    export_parser.add_argument('file', help='JSON task file path')
-    export_parser.add_argument('--output', help='Output BAT file path')
-    export_parser.add_argument('--schedule', action='store_true',
-                              help='Include scheduling commands')
-
-    args = parser.parse_args()
-
-    # Handle commands
-    if args.command == 'play':
-        play_task_cli(args.file, args.speed, args.loop)
-    elif args.command == 'list':
-        list_tasks_cli()
-    elif args.command == 'info':
-        show_task_info_cli(args.file)
-    elif args.command == 'export-bat':
-        export_bat_cli(args.file, args.output, args.schedule)
-
-
-def play_task_cli(filepath, speed, loop_count):
-    """Play task from CLI"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        events = data.get('events', [])
-        if not events:
-            print(f"❌ No events in {filepath}")
-            return
-
-        print(f"▶️  Playing {len(events)} events at {speed}x speed, {loop_count} time(s)")
-
-        player = TaskPlayer()
-        player.play_events(events, speed=speed, loop_count=loop_count,
-                          callback=lambda msg: print(f"  {msg}"))
-
-        print("✅ Playback complete!")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
-
-
-def list_tasks_cli():
-    """List all saved tasks"""
-    tasks_dir = Path("tasks")
-    if not tasks_dir.exists():
-        print("📁 No tasks directory found")
-        return
-
-    tasks = sorted(tasks_dir.glob("*.json"))
-    if not tasks:
-        print("📝 No saved tasks")
-        return
-
-    print(f"\n📋 Found {len(tasks)} task(s):\n")
-
-    for task in tasks:
-        print(f"  • {task.stem}")
-    print()
-
-
-def show_task_info_cli(filepath):
-    """Show task information"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        print(f"\n📊 Task Info: {Path(filepath).stem}")
-        print("=" * 50)
-        print(f"Events: {len(data.get('events', []))}")
-        print(f"Created: {data.get('created', 'Unknown')}")
-
-        if data.get('schedule'):
-            print(f"Schedule: {data['schedule']}")
-
-        if data.get('playback'):
-            pb = data['playback']
-            print(f"Playback: Speed={pb.get('speed', 1.0)}x, "
-                  f"Loop={pb.get('loop', False)}")
-        print()
-
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
-
-
-def export_bat_cli(filepath, output, include_schedule):
-    """Export task as BAT file"""
-    try:
-        # Implementation here
-        print(f"✅ Exported to {output or filepath.replace('.json', '.bat')}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    """Command-line interface for BEBE (vezi bebe_cli.py)"""
+    from bebe_cli import main as cli_main
+    cli_main()
 
 
 def main():
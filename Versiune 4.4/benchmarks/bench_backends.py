@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: throughput și latență per apel pentru backend-urile de input
+
+Pentru fiecare backend disponibil injectează N mișcări de mouse (cu flush
+o dată la fiecare tick de TICK evenimente) și raportează evenimente/s și
+latența per apel (medie, p50, p99).
+
+Rulare (Linux, fără a mișca mouse-ul real):
+    xvfb-run -a python benchmarks/bench_backends.py [numar_evenimente] [backend ...]
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backends import BACKENDS, create_backend  # noqa: E402
+
+TICK = 64
+
+
+def bench(backend, count):
+    latencies = []
+    perf = time.perf_counter_ns
+    start = perf()
+    for i in range(count):
+        t0 = perf()
+        backend.move(100 + (i % 200), 100 + (i % 150))
+        if i % TICK == TICK - 1:
+            backend.flush()
+        latencies.append(perf() - t0)
+    backend.flush()
+    total = perf() - start
+    latencies.sort()
+    return {
+        'events_per_s': count / (total / 1e9),
+        'mean_us': statistics.fmean(latencies) / 1e3,
+        'p50_us': latencies[len(latencies) // 2] / 1e3,
+        'p99_us': latencies[int(len(latencies) * 0.99)] / 1e3,
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    names = sys.argv[2:] or list(BACKENDS)
+
+    print(f"{'backend':<10} {'ev/s':>12} {'mean us':>10} {'p50 us':>10} {'p99 us':>10}")
+    for name in names:
+        try:
+            backend = create_backend(name)
+        except Exception as e:
+            print(f"{name:<10} indisponibil: {e}")
+            continue
+        try:
+            r = bench(backend, count)
+        finally:
+            backend.close()
+        print(f"{name:<10} {r['events_per_s']:>12.0f} {r['mean_us']:>10.2f} "
+              f"{r['p50_us']:>10.2f} {r['p99_us']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
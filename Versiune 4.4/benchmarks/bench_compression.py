@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: mărime și viteză de decodare pentru formatul comprimat (.bebz)
+
+Generează o înregistrare realistă (mișcări de mouse eșantionate la ~8 ms pe
+traiectorii netede, click-uri, tastare în rafale, pauze) și compară:
+    json-legacy  json.dump(indent=2), formatul vechi
+    json         task_io.save_task (header + un eveniment pe linie)
+    bebt         coloane necomprimate (mmap)
+    bebz-zlib    delta-codat + zlib
+    bebz-lzma    delta-codat + lzma
+
+Pentru fiecare: mărimea fișierului, timpul de salvare, încărcarea completă
+(task_io.load_task) și decodarea în flux (open_task_stream), în evenimente/s.
+
+Rulare:  python benchmarks/bench_compression.py [numar_evenimente]
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import task_io  # noqa: E402
+import task_packed  # noqa: E402
+from event_store import EventStore  # noqa: E402
+from task_jsonl import open_task_stream  # noqa: E402
+
+
+def iter_recording(count, seed=1):
+    """Înregistrare sintetică apropiată de cea a recorder-ului (timestamp-uri float de la perf_counter)"""
+    rng = random.Random(seed)
+    t = rng.uniform(0.2, 1.0)
+    x, y = 960, 540
+    produced = 0
+    while produced < count:
+        # Traiectorie spre o țintă, cu viteză variabilă
+        target_x, target_y = rng.randint(0, 1919), rng.randint(0, 1079)
+        steps = rng.randint(20, 120)
+        start_x, start_y = x, y
+        for step in range(1, steps + 1):
+            progress = (1 - math.cos(math.pi * step / steps)) / 2
+            x = round(start_x + (target_x - start_x) * progress + rng.uniform(-1, 1))
+            y = round(start_y + (target_y - start_y) * progress + rng.uniform(-1, 1))
+            t += 0.008 + rng.uniform(-0.0005, 0.0015)
+            yield {'type': 'mouse_move', 'x': x, 'y': y, 'timestamp': t}
+            produced += 1
+        t += rng.uniform(0.05, 0.4)
+        for pressed in (True, False):
+            yield {'type': 'mouse_click', 'x': x, 'y': y, 'button': 'Button.left',
+                   'pressed': pressed, 'timestamp': t}
+            t += rng.uniform(0.06, 0.12)
+            produced += 1
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(3, 25)):
+                key = rng.choice('abcdefghijklmnopqrstuvwxyz ')
+                key = 'Key.space' if key == ' ' else key
+                yield {'type': 'key_press', 'key': key, 'modifiers': [], 'timestamp': t}
+                t += rng.uniform(0.04, 0.1)
+                yield {'type': 'key_release', 'key': key, 'timestamp': t}
+                t += rng.uniform(0.03, 0.2)
+                produced += 2
+        if rng.random() < 0.1:
+            yield {'type': 'mouse_scroll', 'x': x, 'y': y, 'dx': 0, 'dy': rng.choice((-1, 1)),
+                   'timestamp': t}
+            produced += 1
+        t += rng.uniform(0.1, 2.0)
+
+
+def save_legacy(path, data):
+    data = dict(data)
+    data['events'] = data['events'].to_dicts()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    store = EventStore.from_dicts(iter_recording(count))
+    data = {'version': '4.4', 'events': store, 'playback': {'speed': 1.0}}
+    count = len(store)
+
+    writers = {
+        'json-legacy': ('task.legacy.json', save_legacy),
+        'json': ('task.json', task_io.save_task),
+        'bebt': ('task.bebt', task_io.save_task),
+        'bebz-zlib': ('task.zlib.bebz', lambda path, data: task_packed.write_packed_task(path, data, 'zlib')),
+        'bebz-lzma': ('task.lzma.bebz', lambda path, data: task_packed.write_packed_task(path, data, 'lzma')),
+    }
+
+    print(f"Evenimente: {count}")
+    print(f"{'format':<12} {'mărime':>10} {'raport':>7} {'salvare':>9} {'încărcare':>10} "
+          f"{'flux':>9} {'flux ev/s':>11}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy_size = None
+        for name, (filename, writer) in writers.items():
+            path = Path(temp_dir) / filename
+            save_time, _ = measure(lambda: writer(path, data))
+            size = os.path.getsize(path)
+            legacy_size = legacy_size or size
+            load_time, _ = measure(lambda: task_io.load_task(path))
+            stream_time, streamed = measure(lambda: sum(1 for _ in open_task_stream(path)[1]))
+            assert streamed == count, (name, streamed)
+            print(f"{name:<12} {size / 2**20:7.2f} MiB {legacy_size / size:6.1f}x "
+                  f"{save_time:8.2f}s {load_time:9.2f}s {stream_time:8.2f}s {count / stream_time:11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
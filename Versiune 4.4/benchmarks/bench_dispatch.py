@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: cost per eveniment al dispatch-ului în TaskPlayer
+
+Compară dispatcher-ul vechi (LegacyDispatcher: copie a execute_event /
+parse_key din TaskPlayer de dinainte de plan - lanț if/elif, split pe '+',
+dicționarul de taste speciale reconstruit la fiecare parse_key) cu planul
+pre-compilat (execute_op pe ExecutionPlan). TaskPlayer.execute_event nu mai
+e un termen de comparație: compilează evenimentul și apoi face dispatch pe
+opcode. Ambele variante scriu în sink-uri fără efect (NullBackend), deci se
+măsoară doar overhead-ul de interpretare; callback-ul de progres nu e inclus.
+Necesită pynput (pentru Key, ca originalul).
+
+Rulare:  python benchmarks/bench_dispatch.py [numar_evenimente]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pynput.keyboard import Key  # noqa: E402
+
+import player as player_module  # noqa: E402
+from backends import NullBackend  # noqa: E402
+from plan import compile_events  # noqa: E402
+
+
+class _NullSink:
+    """Înlocuiește pyautogui / keyboard_controller: numără apelurile"""
+
+    def __init__(self):
+        self.count = 0
+
+    def _call(self, *args, **kwargs):
+        self.count += 1
+
+    moveTo = mouseDown = mouseUp = scroll = press = release = _call
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class LegacyDispatcher:
+    """
+    Copie fidelă a TaskPlayer.execute_event / parse_key de dinainte de
+    ExecutionPlan; doar pyautogui, keyboard_controller și time.sleep sunt
+    înlocuite cu sink-uri fără efect.
+    """
+
+    def __init__(self):
+        self.pyautogui = _NullSink()
+        self.keyboard_controller = _NullSink()
+        self.sleep = _noop
+
+    def execute_event(self, event, current, total, callback=None):
+        """Executa eveniment"""
+        pyautogui = self.pyautogui
+        try:
+            event_type = event['type']
+
+            if event_type == 'mouse_move':
+                x, y = event['x'], event['y']
+                pyautogui.moveTo(x, y, duration=0)
+                if callback:
+                    percent = int((current / total) * 100)
+                    callback(percent)
+
+            elif event_type == 'mouse_click':
+                x, y = event['x'], event['y']
+                button_str = event['button']
+                pressed = event['pressed']
+
+                if 'left' in button_str.lower():
+                    button = 'left'
+                elif 'right' in button_str.lower():
+                    button = 'right'
+                else:
+                    button = 'middle'
+
+                pyautogui.moveTo(x, y, duration=0)
+
+                if pressed:
+                    pyautogui.mouseDown(button=button)
+                else:
+                    pyautogui.mouseUp(button=button)
+
+                if callback:
+                    percent = int((current / total) * 100)
+                    callback(percent)
+
+            elif event_type == 'mouse_scroll':
+                dy = event['dy']
+                pyautogui.scroll(int(dy * 100))
+                if callback:
+                    percent = int((current / total) * 100)
+                    callback(percent)
+
+            elif event_type == 'key_press':
+                key_name = event['key']
+
+                # Verifica daca e combinatie (ex: ctrl+a sau ctrl+'a')
+                if '+' in key_name:
+                    parts = key_name.split('+')
+                    modifiers = parts[:-1]  # ctrl, alt, shift
+                    main_key_str = parts[-1]    # 'a' sau "'a'"
+
+                    # Curata tasta principala (elimina ghilimele daca exista)
+                    main_key_str = main_key_str.strip("'\"")
+
+                    # Apasa modificatorii
+                    for mod in modifiers:
+                        if mod.lower() == 'ctrl':
+                            self.keyboard_controller.press(Key.ctrl)
+                        elif mod.lower() == 'alt':
+                            self.keyboard_controller.press(Key.alt)
+                        elif mod.lower() == 'shift':
+                            self.keyboard_controller.press(Key.shift)
+
+                    # Apasa tasta principala
+                    key = self.parse_key(main_key_str)
+                    self.keyboard_controller.press(key)
+                    self.sleep(0.01)  # Mic delay
+                    self.keyboard_controller.release(key)
+
+                    # Elibereaza modificatorii
+                    for mod in modifiers:
+                        if mod.lower() == 'ctrl':
+                            self.keyboard_controller.release(Key.ctrl)
+                        elif mod.lower() == 'alt':
+                            self.keyboard_controller.release(Key.alt)
+                        elif mod.lower() == 'shift':
+                            self.keyboard_controller.release(Key.shift)
+                else:
+                    key = self.parse_key(key_name)
+                    self.keyboard_controller.press(key)
+
+                if callback:
+                    percent = int((current / total) * 100)
+                    callback(percent)
+
+            elif event_type == 'key_release':
+                key_name = event['key']
+
+                # Verifica daca e combinatie (ex: ctrl+a)
+                if '+' in key_name:
+                    parts = key_name.split('+')
+                    modifiers = parts[:-1]  # ctrl, alt, shift
+                    main_key_str = parts[-1]    # 'a' sau "'a'"
+
+                    # Curata tasta principala (elimina ghilimele daca exista)
+                    main_key_str = main_key_str.strip("'\"")
+
+                    # Elibereaza tasta principala
+                    key = self.parse_key(main_key_str)
+                    self.keyboard_controller.release(key)
+
+                    # Elibereaza modificatorii
+                    for mod in modifiers:
+                        if mod.lower() == 'ctrl':
+                            self.keyboard_controller.release(Key.ctrl)
+                        elif mod.lower() == 'alt':
+                            self.keyboard_controller.release(Key.alt)
+                        elif mod.lower() == 'shift':
+                            self.keyboard_controller.release(Key.shift)
+                else:
+                    # Tasta simpla fara modificatori
+                    key = self.parse_key(key_name)
+                    self.keyboard_controller.release(key)
+
+        except Exception as e:
+            if callback:
+                callback(f"Eroare: {e}")
+
+    def parse_key(self, key_str):
+        """Converteste string in Key"""
+        # Mapeaza taste speciale
+        special_keys = {
+            'space': Key.space, 'enter': Key.enter,
+            'tab': Key.tab, 'backspace': Key.backspace,
+            'esc': Key.esc, 'escape': Key.esc,
+            'shift': Key.shift, 'ctrl': Key.ctrl,
+            'alt': Key.alt, 'up': Key.up,
+            'down': Key.down, 'left': Key.left,
+            'right': Key.right, 'delete': Key.delete,
+            'home': Key.home, 'end': Key.end,
+            'page_up': Key.page_up, 'page_down': Key.page_down,
+            'insert': Key.insert, 'caps_lock': Key.caps_lock,
+            'num_lock': Key.num_lock, 'scroll_lock': Key.scroll_lock,
+            'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
+            'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
+            'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12,
+        }
+
+        # Elimina "Key." daca exista
+        key_str_clean = key_str.replace('Key.', '').lower()
+
+        if key_str_clean in special_keys:
+            return special_keys[key_str_clean]
+
+        # Daca e un singur caracter (litera, cifra, simbol)
+        if len(key_str) == 1:
+            return key_str
+
+        # Fallback: returneaza string-ul original
+        return key_str
+
+
+def make_events(count, seed=1):
+    """Task sintetic: mișcări mouse, click-uri, taste simple și combinații"""
+    rng = random.Random(seed)
+    events = []
+    t = 0.0
+    x, y = 500, 400
+    keys = ['a', 'b', 'enter', 'space', 'ctrl+c', 'ctrl+shift+a', 'alt+f4', 'tab']
+    for _ in range(count):
+        t += rng.uniform(0.001, 0.05)
+        kind = rng.random()
+        if kind < 0.6:
+            x += rng.randint(-5, 5)
+            y += rng.randint(-5, 5)
+            events.append({'type': 'mouse_move', 'x': x, 'y': y, 'timestamp': t})
+        elif kind < 0.75:
+            events.append({'type': 'mouse_click', 'x': x, 'y': y, 'button': 'Button.left',
+                           'pressed': rng.random() < 0.5, 'timestamp': t})
+        elif kind < 0.8:
+            events.append({'type': 'mouse_scroll', 'x': x, 'y': y, 'dx': 0, 'dy': -1, 'timestamp': t})
+        else:
+            key = rng.choice(keys)
+            event_type = 'key_press' if rng.random() < 0.5 else 'key_release'
+            events.append({'type': event_type, 'key': key, 'modifiers': [], 'timestamp': t})
+    return events
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events = make_events(count)
+
+    # Fără delay-ul de 10 ms din combinații (în ambele variante)
+    player_module.KEY_COMBO_HOLD = 0
+
+    legacy_player = LegacyDispatcher()
+    start = time.perf_counter()
+    for i, event in enumerate(events, 1):
+        legacy_player.execute_event(event, i, count)
+    legacy = time.perf_counter() - start
+
+    player = player_module.TaskPlayer(backend=NullBackend())
+
+    start = time.perf_counter()
+    plan = compile_events(events, player.backend)
+    compile_time = time.perf_counter() - start
+
+    ops = plan.ops
+    start = time.perf_counter()
+    for op in ops:
+        player.execute_op(op)
+    planned = time.perf_counter() - start
+
+    print(f"Evenimente:              {count}")
+    print(f"execute_event (vechi):   {legacy / count * 1e6:8.3f} us/eveniment")
+    print(f"compile_events (o dată): {compile_time * 1e3:8.1f} ms total")
+    print(f"execute_op (plan):       {planned / count * 1e6:8.3f} us/eveniment")
+    print(f"Câștig per loop:         {legacy / planned:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memorie per eveniment - listă de dict-uri vs EventStore
+
+Construiește același task sintetic în ambele reprezentări (evenimentele sunt
+generate unul câte unul, deci EventStore nu păstrează dict-urile) și măsoară
+cu tracemalloc memoria alocată și vârful. Afișează și timpul de compilare a
+planului din fiecare reprezentare.
+
+Rulare:  python benchmarks/bench_event_store.py [numar_evenimente]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backends import NullBackend  # noqa: E402
+from event_store import EventStore  # noqa: E402
+from plan import compile_events  # noqa: E402
+
+
+def iter_events(count, seed=1):
+    """Task sintetic în formatul recorder-ului, generat eveniment cu eveniment"""
+    rng = random.Random(seed)
+    t = 0.0
+    x, y = 500, 400
+    keys = ['a', 'b', 'enter', 'space', 'ctrl+c', 'ctrl+shift+a', 'alt+f4', 'tab']
+    for _ in range(count):
+        t += rng.uniform(0.001, 0.05)
+        kind = rng.random()
+        if kind < 0.6:
+            x += rng.randint(-5, 5)
+            y += rng.randint(-5, 5)
+            yield {'type': 'mouse_move', 'x': x, 'y': y, 'timestamp': t}
+        elif kind < 0.75:
+            yield {'type': 'mouse_click', 'x': x, 'y': y, 'button': 'Button.left',
+                   'pressed': rng.random() < 0.5, 'timestamp': t}
+        elif kind < 0.8:
+            yield {'type': 'mouse_scroll', 'x': x, 'y': y, 'dx': 0, 'dy': -1, 'timestamp': t}
+        else:
+            key = rng.choice(keys)
+            if rng.random() < 0.5:
+                yield {'type': 'key_press', 'key': key, 'modifiers': [], 'timestamp': t}
+            else:
+                yield {'type': 'key_release', 'key': key, 'timestamp': t}
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    events, list_bytes, list_peak, list_time = measure(lambda: list(iter_events(count)))
+    start = time.perf_counter()
+    compile_events(events, NullBackend())
+    list_compile = time.perf_counter() - start
+    del events
+
+    store, store_bytes, store_peak, store_time = measure(lambda: EventStore.from_dicts(iter_events(count)))
+    start = time.perf_counter()
+    compile_events(store, NullBackend())
+    store_compile = time.perf_counter() - start
+
+    print(f"Evenimente:             {count}")
+    print(f"list[dict]:  {list_bytes / count:7.1f} B/eveniment  "
+          f"(vârf {list_peak / 2**20:7.1f} MiB, construire {list_time:6.2f} s, compilare {list_compile:6.2f} s)")
+    print(f"EventStore:  {store_bytes / count:7.1f} B/eveniment  "
+          f"(vârf {store_peak / 2**20:7.1f} MiB, construire {store_time:6.2f} s, compilare {store_compile:6.2f} s)")
+    print(f"Coloane:     {store.memory_bytes() / count:7.1f} B/eveniment, "
+          f"{len(store.strings)} string-uri, {len(store.extras)} evenimente ne-canonice")
+    print(f"Reducere:    {list_bytes / max(store_bytes, 1):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: timpul de pornire al comenzilor CLI ușoare (list / info)
+
+Rulează `python bebe.py list` și `python bebe.py info <task>` în procese
+separate, fără DISPLAY, și măsoară timpul total (interpretor inclus).
+Verifică și că importul lui bebe_cli nu încarcă tkinter, pyautogui, pynput
+sau PIL. Se termină cu cod de eroare dacă mediana depășește limita
+(implicit 100 ms) sau dacă un modul greu a fost importat.
+
+Rulare:  python benchmarks/bench_import_time.py [repetari] [limita_ms]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ('tkinter', 'pyautogui', 'pynput', 'PIL', 'pystray', 'ctypes')
+
+
+def make_task(path, count=2000):
+    events = [{'type': 'mouse_move', 'x': i % 1920, 'y': i % 1080, 'timestamp': i * 0.01}
+              for i in range(count)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': '4.4', 'events': events, 'playback': {'speed': 1.0}}, f)
+
+
+def headless_env():
+    env = dict(os.environ)
+    env.pop('DISPLAY', None)
+    env.pop('WAYLAND_DISPLAY', None)
+    return env
+
+
+def time_command(args, cwd, repeats):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, str(APP_DIR / 'bebe.py')] + args, cwd=cwd,
+                                env=headless_env(), capture_output=True, text=True)
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"bebe {' '.join(args)} a eșuat:\n{result.stdout}{result.stderr}")
+    return samples
+
+
+def heavy_imports():
+    code = ("import sys; sys.path.insert(0, %r); import bebe_cli; "
+            "print(','.join(m for m in %r if m in sys.modules))" % (str(APP_DIR), HEAVY_MODULES))
+    result = subprocess.run([sys.executable, '-c', code], env=headless_env(),
+                            capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(',') if name]
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    limit_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+    failed = False
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    baseline_ms = (time.perf_counter() - start) * 1000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tasks_dir = Path(temp_dir) / 'tasks'
+        tasks_dir.mkdir()
+        make_task(tasks_dir / 'demo.json')
+        for args in (['list'], ['info', str(tasks_dir / 'demo.json')]):
+            samples = time_command(args, temp_dir, repeats)
+            median = statistics.median(samples)
+            status = "OK" if median < limit_ms else "DEPĂȘIT"
+            failed = failed or median >= limit_ms
+            print(f"bebe {args[0]:<5} mediană {median:7.1f} ms, min {min(samples):7.1f} ms  [{status}]")
+
+    loaded = heavy_imports()
+    if loaded:
+        failed = True
+        print(f"Module grele importate de bebe_cli: {', '.join(loaded)}")
+    else:
+        print("bebe_cli nu importă: " + ', '.join(HEAVY_MODULES))
+    print(f"Pornire interpretor gol: {baseline_ms:.1f} ms, limită: {limit_ms} ms")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: precizia declanșării programărilor (scheduler.py)
+
+La fiecare repetare, Scheduler-ul rulează cu un ceas decalat astfel încât
+începutul minutului următor să fie la ~0.3 s distanță, cu N programări a
+căror fereastră începe exact atunci (plus una care nu trebuie să ruleze în
+ziua respectivă). Pentru fiecare declanșare se măsoară întârzierea față de
+începutul ferestrei. Se termină cu cod de eroare dacă întârzierea maximă
+depășește limita (implicit 5 ms).
+
+Rulare:  python benchmarks/bench_scheduler.py [programari] [repetari] [limita_ms]
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scheduler import Scheduler, DAY_KEYS  # noqa: E402
+
+LEAD_SECONDS = 0.3
+
+
+def run_round(count):
+    """Latențele (ms) pentru `count` programări care încep la același minut"""
+    now = datetime.now()
+    window = now.replace(second=0, microsecond=0) + timedelta(minutes=5)
+    offset = window - timedelta(seconds=LEAD_SECONDS) - now
+    clock = lambda: datetime.now() + offset  # noqa: E731
+    scheduler = Scheduler(now=clock)
+    latencies = []
+    done = threading.Event()
+
+    def fire(job):
+        latencies.append((clock() - window).total_seconds() * 1000)
+        if len(latencies) == count:
+            done.set()
+        return True
+
+    config = {'days': list(DAY_KEYS), 'time_interval_enabled': True,
+              'time_from': window.strftime('%H:%M'), 'time_to': window.strftime('%H:%M')}
+    for index in range(count):
+        scheduler.add(f'task{index}', config, fire)
+    other_day = DAY_KEYS[(window.weekday() + 1) % 7]
+    scheduler.add('other-day', dict(config, days=[other_day]), fire)
+    scheduler.start()
+    done.wait(LEAD_SECONDS + 5)
+    scheduler.stop()
+    if len(latencies) != count:
+        raise RuntimeError(f"Doar {len(latencies)}/{count} programări declanșate")
+    return latencies, scheduler.latency_stats()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    limit_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    worst = 0.0
+    print(f"Programări per repetare: {count}")
+    for round_index in range(rounds):
+        latencies, stats = run_round(count)
+        worst = max(worst, max(latencies))
+        print(f"  repetare {round_index + 1}: prima {latencies[0]:.3f} ms, "
+              f"ultima {latencies[-1]:.3f} ms, medie scheduler {stats['mean']:.3f} ms")
+    print(f"Întârziere maximă: {worst:.3f} ms")
+    if worst > limit_ms:
+        print(f"DEPĂȘIT: {worst:.3f} ms > {limit_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
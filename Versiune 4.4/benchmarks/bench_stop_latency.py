@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: latența stop/pause în timpul unei pauze lungi dintre evenimente
+
+Redă (cu NullBackend) un task cu un gol de 5 minute între două evenimente,
+apoi cere stop() / pause() la mijlocul golului și citește metricile
+TaskPlayer.stop_latency_ms / pause_latency_ms. Se termină cu cod de eroare
+dacă oricare măsurătoare depășește limita (implicit 5 ms).
+
+Rulare:  python benchmarks/bench_stop_latency.py [repetari] [limita_ms]
+"""
+
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from player import TaskPlayer  # noqa: E402
+from backends import NullBackend  # noqa: E402
+from plan import compile_events  # noqa: E402
+from timing import TIMER_PRECISIONS  # noqa: E402
+
+GAP_SECONDS = 300.0
+EVENTS = [
+    {'type': 'mouse_move', 'x': 10, 'y': 10, 'timestamp': 0.0},
+    {'type': 'mouse_move', 'x': 20, 'y': 20, 'timestamp': GAP_SECONDS},
+]
+
+
+def start_player(player, plan, precision):
+    thread = threading.Thread(target=player.play_events, args=(plan,),
+                              kwargs={'speed': 1.0, 'timer_precision': precision}, daemon=True)
+    thread.start()
+    # Așteaptă ca primul eveniment să fie redat (player-ul e acum în golul de 5 minute)
+    while player.backend.count < 1:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    return thread
+
+
+def measure_stop(player, plan, precision):
+    thread = start_player(player, plan, precision)
+    player.stop()
+    thread.join(1.0)
+    if thread.is_alive():
+        raise RuntimeError("Player-ul nu s-a oprit")
+    return player.stop_latency_ms
+
+
+def measure_pause(player, plan, precision):
+    thread = start_player(player, plan, precision)
+    player.pause()
+    deadline = time.perf_counter() + 1.0
+    while player.pause_latency_ms is None and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    latency = player.pause_latency_ms
+    player.stop()
+    thread.join(1.0)
+    if latency is None:
+        raise RuntimeError("Player-ul nu a intrat în pauză")
+    return latency
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    limit_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    failed = False
+    logging.getLogger('player').setLevel(logging.ERROR)
+
+    for precision in TIMER_PRECISIONS:
+        stops = []
+        pauses = []
+        for _ in range(repeats):
+            player = TaskPlayer(backend=NullBackend())
+            plan = compile_events(EVENTS, player.backend)
+            stops.append(measure_stop(player, plan, precision))
+            player = TaskPlayer(backend=NullBackend())
+            plan = compile_events(EVENTS, player.backend)
+            pauses.append(measure_pause(player, plan, precision))
+        worst = max(max(stops), max(pauses))
+        status = "OK" if worst < limit_ms else "DEPĂȘIT"
+        failed = failed or worst >= limit_ms
+        print(f"{precision:>8}: stop max {max(stops):7.3f} ms, medie {sum(stops) / len(stops):7.3f} ms | "
+              f"pause max {max(pauses):7.3f} ms, medie {sum(pauses) / len(pauses):7.3f} ms  [{status}]")
+
+    print(f"Limită: {limit_ms} ms la mijlocul unui gol de {GAP_SECONDS:.0f} s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
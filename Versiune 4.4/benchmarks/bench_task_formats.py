@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: încărcare task JSON vs binar (.bebt) vs JSON-Lines (.jsonl)
+
+Generează un task sintetic (implicit 1.000.000 evenimente), îl salvează în
+ambele formate și măsoară, fiecare în proces separat, timpul de încărcare
+și creșterea RSS (ru_maxrss) pentru:
+    json       task_io.load_task (listă de dict-uri)
+    json+store încărcarea din GUI (listă de dict-uri -> EventStore)
+    bebt       task_io.load_task pe .bebt (mmap -> EventStore, copiere în bloc)
+    bebt-mmap  doar deschiderea prin mmap (coloane zero-copy)
+    jsonl      task_io.load_task pe .jsonl (flux -> EventStore)
+    json-header / json-range
+               doar header-ul (summary) / 100 evenimente din mijloc, prin
+               tabela de offset-uri 'chunks'
+    *-stream   parcurgerea în flux a tuturor evenimentelor (memorie limitată);
+               "primul" = timpul până la primul eveniment
+
+Rulare:  python benchmarks/bench_task_formats.py [numar_evenimente]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import task_io  # noqa: E402
+from event_store import EventStore  # noqa: E402
+from bench_event_store import iter_events  # noqa: E402
+
+LOADERS = {
+    'json': "data = task_io.load_task(path)",
+    'json+store': "data = task_io.load_task(path); events = EventStore.from_dicts(data['events'])",
+    'bebt': "data = task_io.load_task(path)",
+    'bebt-mmap': "task = BinaryTask(path); n = len(task)",
+    'jsonl': "data = task_io.load_task(path)",
+    'json-header': "header = task_io.read_task_header(path)",
+    'json-range': "middle = task_io.read_task_header(path)['event_count'] // 2; "
+                  "events = task_io.read_event_range(path, middle, middle + 100)",
+    'json-stream': "meta, events = open_task_stream(path); first = next(events); FIRST = time.perf_counter() - start; n = sum(1 for _ in events)",
+    'jsonl-stream': "meta, events = open_task_stream(path); first = next(events); FIRST = time.perf_counter() - start; n = sum(1 for _ in events)",
+}
+FILES = {'json': 'task.json', 'bebt': 'task.bebt', 'jsonl': 'task.jsonl'}
+
+CHILD = """
+import resource, sys, time
+sys.path.insert(0, {app_dir!r})
+import task_io
+from event_store import EventStore
+from task_binary import BinaryTask
+from task_jsonl import open_task_stream
+path = {path!r}
+FIRST = None
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{loader}
+elapsed = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, after - before, FIRST)
+"""
+
+
+def run_loader(name, path):
+    code = CHILD.format(app_dir=str(APP_DIR), path=str(path), loader=LOADERS[name])
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    elapsed, rss_kib, first = result.stdout.split()
+    # ru_maxrss: KiB pe Linux, octeți pe macOS
+    rss = int(rss_kib) * (1 if sys.platform == 'darwin' else 1024)
+    return float(elapsed), rss, None if first == 'None' else float(first)
+
+
+def generate(temp_dir, count):
+    """
+    Creează fișierele de test într-un proces separat: ru_maxrss e moștenit de
+    procesele copil, deci procesul principal trebuie să rămână mic.
+    """
+    store = EventStore.from_dicts(iter_events(count))
+    data = {'version': '4.4', 'events': store, 'playback': {'speed': 1.0}}
+    for name in FILES.values():
+        start = time.perf_counter()
+        task_io.save_task(Path(temp_dir) / name, data)
+        print(time.perf_counter() - start)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--generate':
+        generate(sys.argv[2], int(sys.argv[3]))
+        return
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    if sys.platform == 'win32':
+        print("Necesită modulul resource (Linux/macOS)")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = subprocess.run([sys.executable, __file__, '--generate', temp_dir, str(count)],
+                                capture_output=True, text=True, check=True)
+        save_times = [float(line) for line in result.stdout.split()]
+
+        print(f"Evenimente: {count}")
+        for (kind, name), save_time in zip(FILES.items(), save_times):
+            size = os.path.getsize(Path(temp_dir) / name)
+            print(f"Fișier {kind:<5}: {size / 2**20:8.1f} MiB (salvare {save_time:6.2f} s)")
+        for name in LOADERS:
+            path = Path(temp_dir) / FILES[name.split('-')[0].split('+')[0]]
+            elapsed, rss, first = run_loader(name, path)
+            line = f"{name:<12} încărcare {elapsed * 1000:9.1f} ms   RSS +{rss / 2**20:8.1f} MiB"
+            if first is not None:
+                line += f"   primul {first * 1000:7.2f} ms"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
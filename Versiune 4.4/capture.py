@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Capture buffer
+Ring buffer prealocat între thread-urile hook (pynput) și recorder.
+
+Callback-urile listener-elor doar scriu o înregistrare mică într-un slot și
+avansează indexul; normalizarea, filtrarea și stocarea se fac într-un thread
+consumator separat, ca hook-ul sistemului de operare să nu fie întârziat.
+"""
+
+import threading
+import time
+from operator import itemgetter
+
+DEFAULT_CAPACITY = 16384
+CONSUMER_POLL_INTERVAL = 0.005  # 5 ms
+# Cât de recentă poate fi o înregistrare ca să fie încă amânată (vezi CaptureConsumer)
+CONSUMER_HOLDBACK = 0.02        # 20 ms
+
+# Tipuri de înregistrări: (kind, perf_counter, a, b, c, d)
+REC_MOUSE_MOVE = 0      # a=x, b=y
+REC_MOUSE_CLICK = 1     # a=x, b=y, c=button, d=pressed
+REC_MOUSE_SCROLL = 2    # a=x, b=y, c=dx, d=dy
+REC_KEY_PRESS = 3       # a=key
+REC_KEY_RELEASE = 4     # a=key
+
+
+class CaptureRing:
+    """
+    Ring buffer single-producer/single-consumer fără lock-uri.
+
+    Producătorul scrie doar _head, consumatorul doar _tail; sub GIL fiecare
+    atribuire e atomică, deci nu e nevoie de lock. Când bufferul e plin,
+    înregistrarea nouă e aruncată și contorizată în `overflow`.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity & (capacity - 1):
+            raise ValueError("Capacitatea trebuie să fie o putere a lui 2")
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._slots = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self.high_water = 0
+        self.overflow = 0
+
+    def push(self, record):
+        """Apelat din thread-ul hook - O(1), fără alocări în afară de record"""
+        head = self._head
+        depth = head - self._tail
+        if depth >= self.capacity:
+            self.overflow += 1
+            return False
+        self._slots[head & self._mask] = record
+        self._head = head + 1
+        if depth >= self.high_water:
+            self.high_water = depth + 1
+        return True
+
+    def drain(self, out):
+        """Mută toate înregistrările disponibile în lista `out` (thread consumator)"""
+        tail = self._tail
+        head = self._head
+        slots = self._slots
+        mask = self._mask
+        while tail < head:
+            index = tail & mask
+            out.append(slots[index])
+            slots[index] = None
+            tail += 1
+        self._tail = tail
+        return out
+
+    def __len__(self):
+        return self._head - self._tail
+
+    @property
+    def captured(self):
+        return self._head
+
+
+class CaptureConsumer:
+    """
+    Thread care golește periodic unul sau mai multe ring-uri în ordine cronologică.
+
+    Fiecare ring e ordonat, dar între ring-uri un hook poate împinge o
+    înregistrare după ce una mai nouă din alt ring a fost deja procesată
+    (thread-ul hook întrerupt între perf_counter() și push). De aceea, cu mai
+    multe ring-uri, înregistrările mai noi de `holdback` secunde rămân în
+    așteptare până la golirea următoare; ordinea e garantată cât timp un hook
+    nu întârzie push-ul cu mai mult de atât. stop() procesează tot.
+    """
+
+    def __init__(self, rings, handler, interval=CONSUMER_POLL_INTERVAL,
+                 holdback=CONSUMER_HOLDBACK, clock=time.perf_counter):
+        self.rings = rings
+        self.handler = handler
+        self.interval = interval
+        self.holdback = holdback
+        self.clock = clock
+        self._pending = []   # Înregistrări amânate, sortate după timestamp
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bebe-capture", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.drain()
+
+    def drain(self, flush=False):
+        """
+        Procesează ce s-a acumulat, sortat după timestamp; fără `flush`,
+        înregistrările mai noi de `holdback` rămân pentru golirea următoare.
+        """
+        batch = self._pending
+        for ring in self.rings:
+            ring.drain(batch)
+        ready = len(batch)
+        if len(self.rings) > 1:
+            batch.sort(key=itemgetter(1))
+            if not flush:
+                cutoff = self.clock() - self.holdback
+                while ready and batch[ready - 1][1] > cutoff:
+                    ready -= 1
+        self._pending = batch[ready:]
+        for record in batch[:ready]:
+            self.handler(record)
+        return ready
+
+    def stop(self):
+        """Oprește thread-ul și procesează înregistrările rămase"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.drain(flush=True)
+
+    def stats(self):
+        """Contoare agregate: capacitate, high-water mark, overflow"""
+        return {
+            'capacity': sum(ring.capacity for ring in self.rings),
+            'captured': sum(ring.captured for ring in self.rings),
+            'high_water': max((ring.high_water for ring in self.rings), default=0),
+            'overflow': sum(ring.overflow for ring in self.rings),
+        }
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Edit history
+EventRope: secvență persistentă de evenimente, împărțită în bucăți
+(EventStore de cel mult CHUNK_SIZE rânduri). O editare copiază doar
+bucățile atinse și returnează o nouă secvență; restul bucăților sunt
+partajate cu versiunea anterioară, deci EditHistory poate păstra versiunile
+vechi pentru undo/redo fără a copia task-ul.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+from event_store import EventStore, COLUMNS
+
+
+CHUNK_SIZE = 1024
+DEFAULT_HISTORY_DEPTH = 100
+
+
+def _slice_store(store, start, stop):
+    """Copie a rândurilor [start, stop) dintr-un EventStore (coloane copiate în bloc)"""
+    columns = {name: getattr(store, name)[start:stop] for name, _ in COLUMNS}
+    extras = {index - start: dict(event) for index, event in store.extras.items()
+              if start <= index < stop}
+    return EventStore.from_columns(columns, store.strings, extras)
+
+
+def _take_rows(store, keep):
+    """Copie doar cu rândurile `keep` (indecși sortați) dintr-un EventStore"""
+    columns = {}
+    for name, typecode in COLUMNS:
+        column = getattr(store, name)
+        columns[name] = array(typecode, [column[index] for index in keep])
+    extras = {}
+    if store.extras:
+        for new_index, index in enumerate(keep):
+            if index in store.extras:
+                extras[new_index] = dict(store.extras[index])
+    return EventStore.from_columns(columns, store.strings, extras)
+
+
+class EventRope:
+    """
+    Secvență imutabilă de evenimente (listă de bucăți EventStore).
+
+    Citirea (len, index, iterare, iter_dicts) e compatibilă cu EventStore;
+    editările (delete, set_fields) returnează o nouă EventRope.
+    """
+
+    __slots__ = ('_chunks', '_starts', '_length')
+
+    def __init__(self, chunks=()):
+        self._chunks = tuple(chunk for chunk in chunks if len(chunk))
+        starts = []
+        length = 0
+        for chunk in self._chunks:
+            starts.append(length)
+            length += len(chunk)
+        self._starts = starts
+        self._length = length
+
+    @classmethod
+    def from_events(cls, events, chunk_size=CHUNK_SIZE):
+        """Secvență din EventStore / EventRope / listă de dict-uri"""
+        if isinstance(events, EventRope):
+            return events
+        store = events if isinstance(events, EventStore) else EventStore.from_dicts(events)
+        return cls(_slice_store(store, start, start + chunk_size)
+                   for start in range(0, len(store), chunk_size))
+
+    # --- Citire ---
+
+    def __len__(self):
+        return self._length
+
+    def _locate(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("EventRope index out of range")
+        chunk_index = bisect_right(self._starts, index) - 1
+        return chunk_index, index - self._starts[chunk_index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        chunk_index, local = self._locate(index)
+        return self._chunks[chunk_index][local]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def iter_dicts(self):
+        for chunk in self._chunks:
+            yield from chunk.iter_dicts()
+
+    def to_dicts(self):
+        return list(self.iter_dicts())
+
+    def to_store(self):
+        """Un singur EventStore cu toate evenimentele"""
+        store = EventStore()
+        store.extend(self.iter_dicts())
+        return store
+
+    def chunk_count(self):
+        return len(self._chunks)
+
+    # --- Editare (returnează o nouă secvență) ---
+
+    def _group_by_chunk(self, indices):
+        groups = {}
+        for index in indices:
+            chunk_index, local = self._locate(index)
+            groups.setdefault(chunk_index, []).append(local)
+        return groups
+
+    def delete(self, indices):
+        """Secvență fără rândurile `indices`; sunt copiate doar bucățile atinse"""
+        chunks = list(self._chunks)
+        for chunk_index, locals_ in self._group_by_chunk(set(indices)).items():
+            chunk = chunks[chunk_index]
+            removed = set(locals_)
+            keep = [local for local in range(len(chunk)) if local not in removed]
+            chunks[chunk_index] = _take_rows(chunk, keep) if keep else None
+        return EventRope(self._merge_small(chunk for chunk in chunks if chunk is not None))
+
+    def set_fields(self, changes):
+        """Secvență cu câmpurile modificate: changes = {index: {câmp: valoare}}"""
+        chunks = list(self._chunks)
+        for chunk_index, locals_ in self._group_by_chunk(changes).items():
+            copy = _slice_store(chunks[chunk_index], 0, len(chunks[chunk_index]))
+            start = self._starts[chunk_index]
+            for local in locals_:
+                for key, value in changes[start + local].items():
+                    copy.set_field(local, key, value)
+            chunks[chunk_index] = copy
+        return EventRope(chunks)
+
+    @staticmethod
+    def _merge_small(chunks, min_size=CHUNK_SIZE // 4):
+        """Bucățile micșorate după ștergeri sunt lipite de vecina anterioară"""
+        merged = []
+        for chunk in chunks:
+            if merged and (len(chunk) < min_size or len(merged[-1]) < min_size) \
+                    and len(merged[-1]) + len(chunk) <= CHUNK_SIZE:
+                previous = merged[-1]
+                combined = _slice_store(previous, 0, len(previous))
+                combined.extend(chunk.iter_dicts())
+                merged[-1] = combined
+            else:
+                merged.append(chunk)
+        return merged
+
+
+class EditHistory:
+    """
+    Undo/redo pe versiuni EventRope. Fiecare intrare păstrează versiunea
+    anterioară editării; memoria e limitată de `depth` și de bucățile
+    copiate de editări (restul sunt partajate).
+    """
+
+    def __init__(self, depth=DEFAULT_HISTORY_DEPTH):
+        self._undo = deque(maxlen=depth)
+        self._redo = []
+
+    def record(self, previous, label=''):
+        """Salvează versiunea de dinaintea unei editări (golește redo)"""
+        self._undo.append((label, previous))
+        self._redo.clear()
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self, current):
+        """(versiunea anterioară, eticheta) sau None dacă nu există"""
+        if not self._undo:
+            return None
+        label, previous = self._undo.pop()
+        self._redo.append((label, current))
+        return previous, label
+
+    def redo(self, current):
+        """(versiunea refăcută, eticheta) sau None dacă nu există"""
+        if not self._redo:
+            return None
+        label, following = self._redo.pop()
+        self._undo.append((label, current))
+        return following, label
+
+    def __len__(self):
+        return len(self._undo)
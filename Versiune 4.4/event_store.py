@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Event store
+Stocare columnară a evenimentelor în array-uri tipizate (array.array) cu o
+tabelă de string-uri pentru numele tastelor/butoanelor, în locul unui dict
+Python per eveniment. EventView oferă o vedere compatibilă cu dict pentru
+codul existent (event['x'], event.get('key'), 'button' in event, ...).
+"""
+
+from array import array
+
+
+EVENT_TYPES = ('mouse_move', 'mouse_click', 'mouse_scroll', 'key_press', 'key_release')
+TYPE_IDS = {name: index for index, name in enumerate(EVENT_TYPES)}
+TYPE_OTHER = 255  # Eveniment ne-canonic, păstrat integral în `extras`
+
+T_MOVE, T_CLICK, T_SCROLL, T_KEY_PRESS, T_KEY_RELEASE = range(5)
+
+# Cheile fiecărui tip, în ordinea în care le scrie recorder-ul
+FIELDS = (
+    ('type', 'x', 'y', 'timestamp'),
+    ('type', 'x', 'y', 'button', 'pressed', 'timestamp'),
+    ('type', 'x', 'y', 'dx', 'dy', 'timestamp'),
+    ('type', 'key', 'modifiers', 'timestamp'),
+    ('type', 'key', 'timestamp'),
+)
+FIELD_SETS = tuple(frozenset(fields) for fields in FIELDS)
+
+# Coloanele EventStore (nume atribut, typecode array) - aceeași ordine în formatul binar
+COLUMNS = (
+    ('types', 'B'),
+    ('timestamps', 'd'),
+    ('xs', 'i'),
+    ('ys', 'i'),
+    ('a', 'i'),
+    ('b', 'i'),
+    ('keys', 'i'),
+    ('mods', 'i'),
+)
+
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+
+def _is_int32(value):
+    return type(value) is int and INT32_MIN <= value <= INT32_MAX
+
+
+def _is_number(value):
+    return type(value) in (int, float)
+
+
+def decode_row(columns, index):
+    """
+    Rândul `index` ca dict, din orice obiect cu atributele coloanelor
+    (EventStore sau vederile mmap din task_binary), `strings` și `extras`.
+    """
+    type_id = columns.types[index]
+    timestamp = columns.timestamps[index]
+    if type_id == T_MOVE:
+        return {'type': 'mouse_move', 'x': columns.xs[index], 'y': columns.ys[index],
+                'timestamp': timestamp}
+    if type_id == T_CLICK:
+        return {'type': 'mouse_click', 'x': columns.xs[index], 'y': columns.ys[index],
+                'button': columns.strings[columns.a[index]], 'pressed': bool(columns.b[index]),
+                'timestamp': timestamp}
+    if type_id == T_SCROLL:
+        return {'type': 'mouse_scroll', 'x': columns.xs[index], 'y': columns.ys[index],
+                'dx': columns.a[index], 'dy': columns.b[index], 'timestamp': timestamp}
+    if type_id == T_KEY_PRESS:
+        modifiers = columns.strings[columns.mods[index]]
+        return {'type': 'key_press', 'key': columns.strings[columns.keys[index]],
+                'modifiers': modifiers.split(',') if modifiers else [],
+                'timestamp': timestamp}
+    if type_id == T_KEY_RELEASE:
+        return {'type': 'key_release', 'key': columns.strings[columns.keys[index]],
+                'timestamp': timestamp}
+    return dict(columns.extras[index])
+
+
+class EventView:
+    """Vedere dict-compatibilă asupra unui rând din EventStore"""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._store.get_field(self._index, key)
+
+    def __setitem__(self, key, value):
+        self._store.set_field(self._index, key, value)
+
+    def get(self, key, default=None):
+        try:
+            return self._store.get_field(self._index, key)
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._store.field_names(self._index)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self._store.field_names(self._index)
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def to_dict(self):
+        return self._store.get_row(self._index)
+
+    def __eq__(self, other):
+        if isinstance(other, EventView):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class EventStore:
+    """Listă de evenimente stocată pe coloane"""
+
+    def __init__(self):
+        self.types = array('B')
+        self.timestamps = array('d')
+        self.xs = array('i')
+        self.ys = array('i')
+        self.a = array('i')      # click: id buton; scroll: dx
+        self.b = array('i')      # click: pressed; scroll: dy
+        self.keys = array('i')   # id tastă (-1 = fără)
+        self.mods = array('i')   # id modificatori ('ctrl,shift'), -1 = fără
+        self.strings = []        # Tabela de string-uri (taste, butoane, modificatori)
+        self._string_ids = {}
+        self.extras = {}         # index -> dict pentru evenimente ne-canonice (rare)
+
+    # --- Tabela de string-uri ---
+
+    def intern(self, text):
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    # --- Construcție ---
+
+    @classmethod
+    def from_columns(cls, columns, strings, extras=None):
+        """Store construit direct din coloane (dict nume -> array) și tabela de string-uri"""
+        store = cls()
+        for name, typecode in COLUMNS:
+            column = columns[name]
+            if not isinstance(column, array) or column.typecode != typecode:
+                copy = array(typecode)
+                if isinstance(column, memoryview):
+                    # Copiere în bloc (ex: coloane mmap din task_binary), fără obiecte per eveniment
+                    with column.cast('B') as raw:
+                        copy.frombytes(raw)
+                elif isinstance(column, (bytes, bytearray)):
+                    copy.frombytes(column)
+                else:
+                    copy.extend(column)
+                column = copy
+            setattr(store, name, column)
+        store.strings = list(strings)
+        store._string_ids = {text: index for index, text in enumerate(store.strings)}
+        store.extras = dict(extras or {})
+        return store
+
+    @classmethod
+    def from_dicts(cls, events):
+        store = cls()
+        store.extend(events)
+        return store
+
+    def extend(self, events):
+        append = self.append
+        for event in events:
+            append(event)
+
+    def _canonical_type(self, event):
+        type_id = TYPE_IDS.get(event.get('type'), TYPE_OTHER)
+        if type_id == TYPE_OTHER or event.keys() != FIELD_SETS[type_id]:
+            return TYPE_OTHER
+        if not _is_number(event['timestamp']):
+            return TYPE_OTHER
+        if type_id <= T_SCROLL and not (_is_int32(event['x']) and _is_int32(event['y'])):
+            return TYPE_OTHER
+        if type_id == T_CLICK and not (isinstance(event['button'], str) and type(event['pressed']) is bool):
+            return TYPE_OTHER
+        if type_id == T_SCROLL and not (_is_int32(event['dx']) and _is_int32(event['dy'])):
+            return TYPE_OTHER
+        if type_id >= T_KEY_PRESS and not isinstance(event['key'], str):
+            return TYPE_OTHER
+        if type_id == T_KEY_PRESS:
+            modifiers = event['modifiers']
+            if not isinstance(modifiers, list) or not all(
+                    isinstance(m, str) and ',' not in m for m in modifiers):
+                return TYPE_OTHER
+        return type_id
+
+    def append(self, event):
+        if isinstance(event, EventView):
+            event = event.to_dict()
+        type_id = self._canonical_type(event)
+        x = y = a = b = 0
+        key_id = mods_id = -1
+        if type_id == TYPE_OTHER:
+            self.extras[len(self.types)] = dict(event)
+            timestamp = event.get('timestamp', 0.0)
+            timestamp = float(timestamp) if _is_number(timestamp) else 0.0
+        else:
+            timestamp = float(event['timestamp'])
+            if type_id <= T_SCROLL:
+                x = event['x']
+                y = event['y']
+                if type_id == T_CLICK:
+                    a = self.intern(event['button'])
+                    b = 1 if event['pressed'] else 0
+                elif type_id == T_SCROLL:
+                    a = event['dx']
+                    b = event['dy']
+            else:
+                key_id = self.intern(event['key'])
+                if type_id == T_KEY_PRESS:
+                    mods_id = self.intern(','.join(event['modifiers']))
+        self.types.append(type_id)
+        self.timestamps.append(timestamp)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.a.append(a)
+        self.b.append(b)
+        self.keys.append(key_id)
+        self.mods.append(mods_id)
+
+    # --- Acces ---
+
+    def __len__(self):
+        return len(self.types)
+
+    def _normalize_index(self, index):
+        size = len(self.types)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("EventStore index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EventView(self, i) for i in range(*index.indices(len(self)))]
+        return EventView(self, self._normalize_index(index))
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield EventView(self, index)
+
+    def field_names(self, index):
+        type_id = self.types[index]
+        if type_id == TYPE_OTHER:
+            return self.extras[index].keys()
+        return FIELDS[type_id]
+
+    def get_field(self, index, key):
+        type_id = self.types[index]
+        if type_id == TYPE_OTHER:
+            return self.extras[index][key]
+        if key == 'timestamp':
+            return self.timestamps[index]
+        if key == 'type':
+            return EVENT_TYPES[type_id]
+        if key not in FIELD_SETS[type_id]:
+            raise KeyError(key)
+        if key == 'x':
+            return self.xs[index]
+        if key == 'y':
+            return self.ys[index]
+        if key == 'key':
+            return self.strings[self.keys[index]]
+        if key == 'button':
+            return self.strings[self.a[index]]
+        if key == 'pressed':
+            return bool(self.b[index])
+        if key == 'dx':
+            return self.a[index]
+        if key == 'dy':
+            return self.b[index]
+        if key == 'modifiers':
+            text = self.strings[self.mods[index]]
+            return text.split(',') if text else []
+        raise KeyError(key)
+
+    def get_row(self, index):
+        """Rândul ca dict nou (aceleași chei și ordine ca la înregistrare)"""
+        return decode_row(self, index)
+
+    def iter_dicts(self):
+        for index in range(len(self.types)):
+            yield self.get_row(index)
+
+    def to_dicts(self):
+        return list(self.iter_dicts())
+
+    # --- Modificare ---
+
+    def set_field(self, index, key, value):
+        index = self._normalize_index(index)
+        type_id = self.types[index]
+        if type_id != TYPE_OTHER:
+            if key == 'timestamp' and _is_number(value):
+                self.timestamps[index] = float(value)
+                return
+            if key in ('x', 'y') and key in FIELD_SETS[type_id] and _is_int32(value):
+                (self.xs if key == 'x' else self.ys)[index] = value
+                return
+            # Orice altă modificare: rândul devine ne-canonic
+            self.extras[index] = self.get_row(index)
+            self.types[index] = TYPE_OTHER
+        self.extras[index][key] = value
+        if key == 'timestamp' and _is_number(value):
+            self.timestamps[index] = float(value)
+
+    def pop(self, index=-1):
+        index = self._normalize_index(index)
+        row = self.get_row(index)
+        del self[index]
+        return row
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                for i in sorted(range(start, stop, step), reverse=True):
+                    del self[i]
+                return
+            count = stop - start
+        else:
+            start = self._normalize_index(index)
+            stop = start + 1
+            count = 1
+        if count <= 0:
+            return
+        for name, _ in COLUMNS:
+            del getattr(self, name)[start:stop]
+        if self.extras:
+            shifted = {}
+            for i, extra in self.extras.items():
+                if i < start:
+                    shifted[i] = extra
+                elif i >= stop:
+                    shifted[i - count] = extra
+            self.extras = shifted
+
+    def clear(self):
+        del self[0:len(self)]
+        self.extras = {}
+
+    def memory_bytes(self):
+        """Memoria ocupată de coloane (fără tabela de string-uri și extras)"""
+        return sum(getattr(self, name).itemsize * len(self) for name, _ in COLUMNS)
+
+
+def as_event_dicts(events):
+    """Listă de dict-uri pentru serializare (EventStore, EventRope sau listă obișnuită)"""
+    if hasattr(events, 'to_dicts'):
+        return events.to_dicts()
+    return [event.to_dict() if isinstance(event, EventView) else event for event in events]
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Virtual event table
+Tabel de evenimente care creează rânduri Treeview doar pentru fereastra
+vizibilă: sursa (EventStore, listă) poate avea sute de mii de evenimente,
+iar derularea, selecția și meniul contextual lucrează pe indecși.
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk
+from bisect import bisect_left
+from collections import OrderedDict
+
+
+ROW_CACHE_SIZE = 512    # Rânduri formatate păstrate (câteva ecrane)
+DEFAULT_ROW_HEIGHT = 25
+
+
+class VirtualEventTable:
+    """
+    Treeview virtualizat.
+
+    Args:
+        parent: Widget-ul părinte
+        columns: Coloanele (id-uri Treeview); prima e numărul rândului
+        format_row: Funcție event -> tuplu de valori pentru celelalte coloane;
+            apelată doar pentru rândurile vizibile, rezultatul e păstrat în
+            cache (numărul rândului nu e inclus, deci renumerotarea e gratuită)
+    """
+
+    def __init__(self, parent, columns, format_row, height=7):
+        self.format_row = format_row
+        self.source = ()
+        self.top = 0                # Indexul primului rând vizibil
+        self.visible_rows = height
+        self.selected = set()       # Indecși selectați (în sursă)
+        self._anchor = None         # Pentru Shift+click / Shift+săgeți
+        self._cursor = None
+        self._cache = OrderedDict()
+        self.last_update_ms = 0.0   # Durata ultimei actualizări incrementale (rows_removed/rows_changed)
+
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', height=height,
+                                 selectmode='none')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        tree = self.tree
+        tree.bind('<Configure>', self._on_configure)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda e: self._scroll_by(-3))  # Linux
+        tree.bind('<Button-5>', lambda e: self._scroll_by(3))
+        tree.bind('<Button-1>', self._on_click)
+        tree.bind('<Shift-Button-1>', lambda e: self._on_click(e, extend=True))
+        tree.bind('<Control-Button-1>', lambda e: self._on_click(e, toggle=True))
+        tree.bind('<Up>', lambda e: self._move_cursor(-1, e))
+        tree.bind('<Down>', lambda e: self._move_cursor(1, e))
+        tree.bind('<Prior>', lambda e: self._move_cursor(-self.visible_rows, e))
+        tree.bind('<Next>', lambda e: self._move_cursor(self.visible_rows, e))
+        tree.bind('<Home>', lambda e: self._move_cursor(-len(self.source), e))
+        tree.bind('<End>', lambda e: self._move_cursor(len(self.source), e))
+        tree.bind('<Control-a>', self._select_all)
+
+    # === Layout / pass-through ===
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def heading(self, column, **kwargs):
+        self.tree.heading(column, **kwargs)
+
+    def column(self, column, **kwargs):
+        self.tree.column(column, **kwargs)
+
+    def bind(self, sequence, callback):
+        self.tree.bind(sequence, callback, add='+')
+
+    # === Sursa de date ===
+
+    def set_source(self, source):
+        """Afișează o nouă sursă (secvență de evenimente); selecția și derularea se resetează"""
+        self.source = source
+        self.top = 0
+        self.selected.clear()
+        self._anchor = self._cursor = None
+        self._cache.clear()
+        self._render()
+
+    def replace_source(self, source):
+        """Sursă nouă pentru aceleași date (ex: undo/redo): derularea și selecția se păstrează"""
+        self.source = source
+        self.refresh()
+
+    def refresh(self):
+        """Sursa s-a schimbat în întregime (ex: editare): invalidează cache-ul și redesenează"""
+        self._cache.clear()
+        count = len(self.source)
+        self.selected = {index for index in self.selected if index < count}
+        self._render()
+
+    def rows_removed(self, indices):
+        """
+        Rândurile `indices` au fost șterse din sursă: cache-ul și selecția sunt
+        deplasate, iar doar fereastra vizibilă e redesenată.
+        """
+        started = time.perf_counter()
+        removed = sorted(set(indices))
+        if removed:
+            removed_set = set(removed)
+
+            def shifted(index):
+                return index - bisect_left(removed, index)
+
+            first = removed[0]
+            cache = OrderedDict()
+            for index, values in self._cache.items():
+                if index < first:
+                    cache[index] = values
+                elif index not in removed_set:
+                    cache[shifted(index)] = values
+            self._cache = cache
+            self.selected = {shifted(index) for index in self.selected if index not in removed_set}
+            if self._anchor is not None:
+                self._anchor = shifted(self._anchor)
+            if self._cursor is not None:
+                self._cursor = min(shifted(self._cursor), max(0, len(self.source) - 1))
+            self._render()
+        self.last_update_ms = (time.perf_counter() - started) * 1000
+        return self.last_update_ms
+
+    def rows_changed(self, indices):
+        """Rândurile `indices` au conținut nou (ex: timestamp scalat): se reformatează doar cele vizibile"""
+        started = time.perf_counter()
+        cache = self._cache
+        if len(cache) < len(indices):
+            indices = set(indices)
+            for index in list(cache):
+                if index in indices:
+                    del cache[index]
+        else:
+            for index in indices:
+                cache.pop(index, None)
+        self._render()
+        self.last_update_ms = (time.perf_counter() - started) * 1000
+        return self.last_update_ms
+
+    def rows_appended(self, follow=True):
+        """Au apărut rânduri noi la final (înregistrare live); derulează la final dacă follow"""
+        if follow:
+            self.top = max(0, len(self.source) - self.visible_rows)
+        self._render()
+
+    def _formatted(self, index):
+        cache = self._cache
+        values = cache.get(index)
+        if values is None:
+            values = self.format_row(self.source[index])
+            cache[index] = values
+            if len(cache) > ROW_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(index)
+        return values
+
+    # === Desenare ===
+
+    def _render(self):
+        """Sincronizează rândurile Treeview (câte unul per slot vizibil) cu fereastra curentă"""
+        count = len(self.source)
+        self.top = max(0, min(self.top, count - self.visible_rows))
+        shown = min(self.visible_rows, count - self.top)
+        tree = self.tree
+        children = tree.get_children()
+        for slot in range(len(children), shown):
+            tree.insert('', tk.END, iid=f'slot{slot}')
+        if len(children) > shown:
+            tree.delete(*children[shown:])
+        selection = []
+        for slot in range(shown):
+            index = self.top + slot
+            iid = f'slot{slot}'
+            tree.item(iid, values=(index + 1,) + self._formatted(index))
+            if index in self.selected:
+                selection.append(iid)
+        tree.selection_set(selection)
+        if count:
+            self.scrollbar.set(self.top / count, (self.top + shown) / count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_configure(self, event):
+        style = ttk.Style(self.tree)
+        row_height = int(style.lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        # Antetul ocupă aproximativ un rând
+        rows = max(1, event.height // row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self._render()
+
+    # === Derulare ===
+
+    def _scroll_by(self, rows):
+        self.top = max(0, min(self.top + rows, len(self.source) - self.visible_rows))
+        self._render()
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * len(self.source))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self.top += amount * (self.visible_rows if args[2] == 'pages' else 1)
+        self._render()
+
+    def yview_moveto(self, fraction):
+        self._on_scrollbar('moveto', fraction)
+
+    def see(self, index):
+        """Derulează astfel încât rândul `index` să fie vizibil"""
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.visible_rows:
+            self.top = index - self.visible_rows + 1
+        self._render()
+
+    # === Selecție ===
+
+    def index_at(self, y):
+        """Indexul (în sursă) al rândului de la coordonata y, sau None"""
+        iid = self.tree.identify_row(y)
+        if not iid:
+            return None
+        index = self.top + self.tree.index(iid)
+        return index if index < len(self.source) else None
+
+    def selection(self):
+        """Indecșii selectați, sortați"""
+        return sorted(self.selected)
+
+    def selection_set(self, indices):
+        self.selected = set(indices)
+        self._render()
+
+    def _on_click(self, event, extend=False, toggle=False):
+        self.tree.focus_set()
+        index = self.index_at(event.y)
+        if index is None:
+            return 'break'
+        if extend and self._anchor is not None:
+            low, high = sorted((self._anchor, index))
+            self.selected = set(range(low, high + 1))
+        elif toggle:
+            self.selected ^= {index}
+            self._anchor = index
+        else:
+            self.selected = {index}
+            self._anchor = index
+        self._cursor = index
+        self._render()
+        return 'break'
+
+    def _move_cursor(self, delta, event):
+        count = len(self.source)
+        if not count:
+            return 'break'
+        current = self._cursor if self._cursor is not None else self.top
+        index = max(0, min(count - 1, current + delta))
+        extend = bool(event.state & 0x0001)  # Shift
+        if extend and self._anchor is not None:
+            low, high = sorted((self._anchor, index))
+            self.selected = set(range(low, high + 1))
+        else:
+            self.selected = {index}
+            self._anchor = index
+        self._cursor = index
+        self.see(index)
+        return 'break'
+
+    def _select_all(self, event=None):
+        self.selected = set(range(len(self.source)))
+        self._render()
+        return 'break'
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Global hotkeys
+Un singur hook global de tastatură (pynput keyboard.Listener) pentru tot
+procesul. Tastele rapide (F9/ESC stop, F10 pauză, ...) se înregistrează cu
+register(); recorder-ul primește toate tastele prin add_observer().
+
+Potrivirea tastelor e o căutare într-un dict, iar tabela de legături e
+înlocuită (copy-on-write) la fiecare register/unregister, deci hook-ul nu
+ia lock-uri și nu loghează nimic per tastă. Callback-urile rulează pe
+thread-ul hook-ului: trebuie să fie scurte (ex: root.after, Event.set).
+"""
+
+import itertools
+import logging
+import threading
+
+from pynput import keyboard
+
+
+logger = logging.getLogger(__name__)
+
+
+class HotkeyService:
+    """
+    Dispatcher de taste rapide peste un singur keyboard.Listener.
+
+    Listener-ul pornește la prima înregistrare și rămâne activ până la stop().
+    """
+
+    def __init__(self, listener_factory=keyboard.Listener):
+        self._listener_factory = listener_factory
+        self._listener = None
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self._bindings = {}     # tastă -> tuplu (token, callback); înlocuit la fiecare modificare
+        self._observers = ()    # tuplu (token, on_press, on_release)
+        self._failed = set()    # Callback-uri care au aruncat deja o excepție (logate o singură dată)
+
+    # === Înregistrare ===
+
+    def register(self, key, callback):
+        """Apelează callback() la apăsarea tastei `key` (ex: Key.f10); returnează un token"""
+        with self._lock:
+            token = next(self._tokens)
+            bindings = dict(self._bindings)
+            bindings[key] = bindings.get(key, ()) + ((token, callback),)
+            self._bindings = bindings
+        self.start()
+        return token
+
+    def add_observer(self, on_press=None, on_release=None):
+        """Primește toate tastele (ex: înregistrarea); returnează un token"""
+        with self._lock:
+            token = next(self._tokens)
+            self._observers = self._observers + ((token, on_press, on_release),)
+        self.start()
+        return token
+
+    def unregister(self, token):
+        """Elimină o legătură sau un observator; token-urile necunoscute sunt ignorate"""
+        if token is None:
+            return
+        with self._lock:
+            bindings = {}
+            for key, entries in self._bindings.items():
+                entries = tuple(entry for entry in entries if entry[0] != token)
+                if entries:
+                    bindings[key] = entries
+            self._bindings = bindings
+            self._observers = tuple(entry for entry in self._observers if entry[0] != token)
+
+    def bindings(self):
+        """Tastele cu cel puțin o legătură"""
+        return list(self._bindings)
+
+    # === Listener ===
+
+    @property
+    def running(self):
+        return self._listener is not None and self._listener.running
+
+    def start(self):
+        """Pornește hook-ul (dacă nu rulează deja)"""
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = self._listener_factory(on_press=self._on_press,
+                                                    on_release=self._on_release)
+            self._listener.start()
+        logger.info("Global hotkey listener started")
+
+    def stop(self):
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            logger.info("Global hotkey listener stopped")
+
+    # === Hook (thread-ul listener-ului) ===
+
+    def _on_press(self, key):
+        for token, on_press, _ in self._observers:
+            if on_press is not None:
+                self._call(token, on_press, key)
+        entries = self._bindings.get(key)
+        if entries:
+            for token, callback in entries:
+                self._call(token, callback)
+
+    def _on_release(self, key):
+        for token, _, on_release in self._observers:
+            if on_release is not None:
+                self._call(token, on_release, key)
+
+    def _call(self, token, callback, *args):
+        # Excepțiile nu trebuie să oprească listener-ul (pynput îl oprește la excepție)
+        try:
+            callback(*args)
+        except Exception:
+            if token not in self._failed:
+                self._failed.add(token)
+                logger.exception(f"Hotkey callback {callback!r} failed")
+
+
+_default_service = None
+_default_lock = threading.Lock()
+
+
+def get_hotkey_service():
+    """Serviciul comun al procesului (GUI, recorder, player folosesc același hook)"""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = HotkeyService()
+        return _default_service
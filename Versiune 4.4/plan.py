@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Execution plan
+Compilează lista de evenimente într-un plan de operații pre-rezolvate
+(taste și butoane native ale backend-ului de input, modificatori,
+timestamp-uri), construit o singură dată per task și refolosit la fiecare
+loop sau rulare programată.
+"""
+
+import logging
+from array import array
+
+
+# Coduri operații (index în tabela de dispatch a player-ului)
+OP_NOOP = 0
+OP_MOVE = 1         # (OP_MOVE, x, y)
+OP_CLICK = 2        # (OP_CLICK, x, y, button, pressed)
+OP_SCROLL = 3       # (OP_SCROLL, dy)
+OP_KEY_PRESS = 4    # (OP_KEY_PRESS, modifiers, key)
+OP_KEY_RELEASE = 5  # (OP_KEY_RELEASE, modifiers, key)
+
+# Nume canonice pentru taste speciale (aliasuri -> nume canonic)
+SPECIAL_KEY_NAMES = {
+    name: name for name in (
+        'space', 'enter', 'tab', 'backspace', 'esc', 'shift', 'ctrl', 'alt',
+        'up', 'down', 'left', 'right', 'delete', 'home', 'end',
+        'page_up', 'page_down', 'insert', 'caps_lock', 'num_lock', 'scroll_lock',
+        'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12',
+    )
+}
+SPECIAL_KEY_NAMES['escape'] = 'esc'
+
+MODIFIER_NAMES = ('ctrl', 'alt', 'shift')
+
+logger = logging.getLogger(__name__)
+
+
+def parse_key(key_str):
+    """Nume canonic al tastei ('Key.enter' -> 'enter'; caracterele rămân neschimbate)"""
+    key_str_clean = key_str.replace('Key.', '').lower()
+    special = SPECIAL_KEY_NAMES.get(key_str_clean)
+    if special is not None:
+        return special
+    # Caracter simplu (litera, cifra, simbol) sau fallback: string-ul original
+    return key_str
+
+
+def parse_button(button_str):
+    """'Button.left' -> 'left' (aceeași regulă ca redarea clasică)"""
+    button_lower = button_str.lower()
+    if 'left' in button_lower:
+        return 'left'
+    if 'right' in button_lower:
+        return 'right'
+    return 'middle'
+
+
+def parse_key_combo(key_name):
+    """'ctrl+shift+a' -> (('ctrl', 'shift'), 'a')"""
+    if '+' not in key_name:
+        return (), parse_key(key_name)
+    parts = key_name.split('+')
+    modifiers = tuple(mod.lower() for mod in parts[:-1] if mod.lower() in MODIFIER_NAMES)
+    # Curata tasta principala (elimina ghilimele daca exista)
+    main_key_str = parts[-1].strip("'\"")
+    return modifiers, parse_key(main_key_str)
+
+
+def compile_event(event, backend):
+    """Transformă un eveniment (dict) într-o operație pre-rezolvată pentru backend"""
+    event_type = event['type']
+    if event_type == 'mouse_move':
+        return (OP_MOVE, event['x'], event['y'])
+    if event_type == 'mouse_click':
+        button = backend.resolve_button(parse_button(event['button']))
+        return (OP_CLICK, event['x'], event['y'], button, bool(event['pressed']))
+    if event_type == 'mouse_scroll':
+        return (OP_SCROLL, event['dy'])
+    if event_type in ('key_press', 'key_release'):
+        modifiers, key = parse_key_combo(event['key'])
+        modifiers = tuple(backend.resolve_key(mod) for mod in modifiers)
+        opcode = OP_KEY_PRESS if event_type == 'key_press' else OP_KEY_RELEASE
+        return (opcode, modifiers, backend.resolve_key(key))
+    return (OP_NOOP,)
+
+
+class ExecutionPlan:
+    """Plan compact de operații + timestamp-uri, refolosibil între loop-uri"""
+
+    __slots__ = ('ops', 'timestamps', 'backend')
+
+    def __init__(self, ops, timestamps, backend):
+        self.ops = ops
+        self.timestamps = timestamps
+        self.backend = backend  # Backend-ul pentru care au fost rezolvate tastele/butoanele
+
+    def __len__(self):
+        return len(self.ops)
+
+    def duration(self):
+        """Durata (la viteză 1x) între primul și ultimul eveniment"""
+        if not self.timestamps:
+            return 0.0
+        return self.timestamps[-1] - self.timestamps[0]
+
+
+def iter_compiled(events, backend):
+    """Generator (op, timestamp) - compilare incrementală, ex: pentru redare în flux"""
+    if hasattr(events, 'iter_dicts'):
+        # EventStore: un dict temporar per rând e mai ieftin decât accesul prin vederi
+        events = events.iter_dicts()
+    cache = {}  # Evenimente repetate (ex: aceeași tastă) se rezolvă o singură dată
+    timestamp = 0.0
+    for event in events:
+        try:
+            event_type = event.get('type')
+            key = event.get('key')
+            if event_type in ('key_press', 'key_release') and isinstance(key, str):
+                cache_key = (event_type, key)
+                op = cache.get(cache_key)
+                if op is None:
+                    op = cache[cache_key] = compile_event(event, backend)
+            else:
+                op = compile_event(event, backend)
+            timestamp = float(event.get('timestamp', 0.0))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            # Evenimentul invalid devine NOOP la momentul celui anterior (redarea nu se oprește)
+            logger.warning(f"Eveniment invalid ignorat la compilare: {event} ({e})")
+            op = (OP_NOOP,)
+        yield op, timestamp
+
+
+def compile_events(events, backend):
+    """Compilează lista de evenimente într-un ExecutionPlan pentru backend"""
+    ops = []
+    timestamps = array('d')
+    for op, timestamp in iter_compiled(events, backend):
+        ops.append(op)
+        timestamps.append(timestamp)
+    return ExecutionPlan(ops, timestamps, backend)
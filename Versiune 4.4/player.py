@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Player
+Redarea task-urilor (TaskPlayer). Nu importă Tk; pyautogui/pynput sunt
+încărcate abia la crearea backend-ului de input.
+"""
+
+import time
+import threading
+import logging
+
+from timing import PlaybackClock, get_sleeper, DEFAULT_TIMER_PRECISION
+from backends import create_backend
+from progress import ProgressReporter
+from plan import (ExecutionPlan, compile_events, compile_event, iter_compiled, parse_key,
+                  OP_NOOP, OP_MOVE, OP_CLICK, OP_SCROLL, OP_KEY_PRESS, OP_KEY_RELEASE)
+
+# Plafon de siguranță pentru așteptarea pe condiție în pauză (pause/stop notifică imediat)
+PAUSE_WAIT_TIMEOUT = 0.5
+# Cât sunt ținute apăsate tastele unei combinații (întreruptă de pause()/stop())
+KEY_COMBO_HOLD = 0.01
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPlayer:
+    """Reda task-uri cu suport pentru pauză"""
+
+    def __init__(self, backend=None):
+        self.playing = False
+        self.paused = False
+        self.pause_event = threading.Event()
+        # Stare pause/stop protejată de o condiție; `_wake` întrerupe așteptarea dintre evenimente
+        self._state = threading.Condition()
+        self._wake = threading.Event()
+        self._stop_requested_ns = None
+        self._pause_requested_ns = None
+        self.stop_latency_ms = None   # Stop cerut -> bucla de redare oprită
+        self.pause_latency_ms = None  # Pauză cerută -> bucla de redare în așteptare
+        # Backend de injectare (pyautogui/pynput/xtest/null, vezi backends.py)
+        self.backend = backend or create_backend()
+        self.stop_requested = False
+        self.clock = PlaybackClock()  # Deadline-uri absolute + statistici drift
+        # Ultima poziție a redării, citită periodic de GUI/CLI (fără callback per eveniment)
+        self.progress = ProgressReporter()
+        # Tabelă de dispatch indexată după codul operației (vezi plan.py)
+        self._dispatch = {
+            OP_NOOP: self._op_noop,
+            OP_MOVE: self._op_move,
+            OP_CLICK: self._op_click,
+            OP_SCROLL: self._op_scroll,
+            OP_KEY_PRESS: self._op_key_press,
+            OP_KEY_RELEASE: self._op_key_release,
+        }
+
+    def play_events(self, events, speed=2.0, loop_count=1, run_until_stop=False,
+                    timer_precision=DEFAULT_TIMER_PRECISION):
+        """
+        Reda evenimente
+
+        Args:
+            events: Lista de evenimente sau un ExecutionPlan deja compilat
+            speed: Viteza de redare
+            loop_count: Număr de repetări (ignorat dacă run_until_stop=True)
+            run_until_stop: Dacă True, rulează continuu până la stop
+            timer_precision: Compromis CPU/precizie pentru așteptări (low/balanced/high)
+        """
+        self._begin()
+
+        # Planul se compilează o singură dată, nu la fiecare loop
+        plan = events if isinstance(events, ExecutionPlan) else compile_events(events, self.backend)
+        if plan.backend is not self.backend:
+            raise ValueError("ExecutionPlan a fost compilat pentru alt backend de input")
+        ops = plan.ops
+        timestamps = plan.timestamps
+
+        self._play_loop(lambda: zip(ops, timestamps), len(ops), speed, loop_count,
+                        run_until_stop, timer_precision)
+
+    def play_stream(self, open_stream, total=0, speed=2.0, loop_count=1, run_until_stop=False,
+                    timer_precision=DEFAULT_TIMER_PRECISION):
+        """
+        Reda evenimente pe măsură ce sunt citite (ex: task_jsonl.open_task_stream).
+
+        Args:
+            open_stream: Funcție fără argumente care returnează un iterator nou
+                de evenimente (dict-uri); apelată la fiecare loop, deci memoria
+                rămâne limitată și pentru task-uri foarte mari
+            total: Numărul de evenimente, dacă e cunoscut (pentru progres)
+        """
+        self._begin()
+        backend = self.backend
+        self._play_loop(lambda: iter_compiled(open_stream(), backend), total, speed, loop_count,
+                        run_until_stop, timer_precision)
+
+    def _begin(self):
+        with self._state:
+            self.playing = True
+            self.paused = False
+            self.stop_requested = False
+            self.pause_event.set()  # Setat = nu e pauzat
+            self._wake.clear()
+            self._stop_requested_ns = None
+            self._pause_requested_ns = None
+
+    def _play_loop(self, open_ops, total, speed, loop_count, run_until_stop, timer_precision):
+        """Bucla de redare comună: open_ops() returnează perechi (op, timestamp) pentru un loop"""
+        # Validare viteza
+        speed = max(0.1, min(10.0, speed))
+        backend = self.backend
+        progress = self.progress
+        progress.start(total)
+
+        # ✅ LOGGING ÎNAINTE DE WHILE
+        logger.info(f"🔄 Starting playback loop: loop_count={loop_count}, run_until_stop={run_until_stop}")
+
+        # Ceas cu deadline-uri absolute - întârzierile nu se acumulează între evenimente/loop-uri
+        self.clock = PlaybackClock(speed, sleeper=get_sleeper(timer_precision))
+        clock = self.clock
+
+        loop = 0
+        while True:
+            loop += 1
+
+            # ✅ LOGGING LA FIECARE ITERAȚIE
+            logger.info(f"🔄 Loop iteration {loop}/{loop_count if not run_until_stop else '∞'}")
+
+            if not run_until_stop and loop > loop_count:
+                logger.info(f"✋ Breaking: loop ({loop}) > loop_count ({loop_count})")
+                break
+
+            logger.info(f"▶️ Playing {total or '?'} events (iteration {loop})...")
+            progress.loop = loop
+
+            played = 0
+            for op, timestamp in open_ops():
+                if not played:
+                    if loop == 1:
+                        clock.start(timestamp)
+                    else:
+                        # Următorul loop continuă din deadline-ul ultimului eveniment
+                        clock.rebase(timestamp)
+
+                if not self.playing or self.stop_requested:
+                    logger.warning(f"⚠️ Breaking from event loop: playing={self.playing}, stop_requested={self.stop_requested}")
+                    break
+
+                # Verifică pauză
+                if self.paused:
+                    self._wait_while_paused(clock)
+
+                if not self.playing or self.stop_requested:
+                    logger.warning(f"⚠️ Breaking after pause check: playing={self.playing}, stop_requested={self.stop_requested}")
+                    break
+
+                deadline = clock.deadline_ns(timestamp)
+                if clock.remaining_ns(deadline) > 0:
+                    # Sfârșit de tick: trimite cererile acumulate înainte de așteptare
+                    backend.flush()
+                    # Așteptarea e întreruptă de pause()/stop(), chiar și în mijlocul unei pauze lungi
+                    while not clock.wait_until(deadline, self._wake):
+                        if self.paused:
+                            self._wait_while_paused(clock)
+                        if not self.playing or self.stop_requested:
+                            break
+                        with self._state:
+                            if not self.paused and not self.stop_requested:
+                                self._wake.clear()
+                        # După pauză originea ceasului s-a mutat
+                        deadline = clock.deadline_ns(timestamp)
+                    if not self.playing or self.stop_requested:
+                        logger.warning(f"⚠️ Breaking during wait: playing={self.playing}, stop_requested={self.stop_requested}")
+                        break
+                clock.mark(deadline)
+
+                self.execute_op(op)
+                played += 1
+                progress.index = played
+                progress.timestamp = timestamp
+
+            if played > progress.total:
+                progress.total = played
+
+            if self.stop_requested and self._stop_requested_ns is not None:
+                self.stop_latency_ms = (time.perf_counter_ns() - self._stop_requested_ns) / 1e6
+                self._stop_requested_ns = None
+                logger.info(f"⏹️ Stop latency: {self.stop_latency_ms:.3f}ms")
+
+            backend.flush()
+
+            drift = clock.stats()
+            logger.info(f"✅ Finished playing events (iteration {loop}) - "
+                        f"drift={drift['drift_ms']:.2f}ms, max={drift['max_drift_ms']:.2f}ms, "
+                        f"mean={drift['mean_drift_ms']:.2f}ms")
+
+            # Verifică dacă trebuie să oprească
+            if self.stop_requested:
+                logger.info(f"✋ Breaking: stop_requested={self.stop_requested}")
+                break
+
+            logger.info(f"🔄 End of iteration {loop}, continuing to next iteration...")
+
+        logger.info(f"🏁 Playback loop finished after {loop} iteration(s)")
+        progress.finish()
+
+        self.playing = False
+        self.paused = False
+
+    def execute_event(self, event):
+        """Executa eveniment (compilează și rulează o singură operație)"""
+        try:
+            op = compile_event(event, self.backend)
+        except Exception as e:
+            self.progress.error = f"Eroare: {e}"
+            return
+        self.execute_op(op)
+
+    def execute_op(self, op):
+        """Executa o operație pre-rezolvată din ExecutionPlan"""
+        try:
+            self._dispatch[op[0]](op)
+        except Exception as e:
+            self.progress.error = f"Eroare: {e}"
+
+    def _op_noop(self, op):
+        pass
+
+    def _op_move(self, op):
+        self.backend.move(op[1], op[2])
+
+    def _op_click(self, op):
+        _, x, y, button, pressed = op
+        self.backend.move(x, y)
+        self.backend.button(button, pressed)
+
+    def _op_scroll(self, op):
+        self.backend.scroll(op[1])
+
+    def _op_key_press(self, op):
+        _, modifiers, key = op
+        backend = self.backend
+        if modifiers:
+            # Combinatie (ex: ctrl+a): apasa modificatorii, tasta, apoi elibereaza totul
+            for mod in modifiers:
+                backend.key(mod, True)
+            backend.key(key, True)
+            backend.flush()
+            # Mic delay; pause()/stop() îl scurtează, tastele sunt eliberate oricum
+            self._wake.wait(KEY_COMBO_HOLD)
+            backend.key(key, False)
+            for mod in modifiers:
+                backend.key(mod, False)
+        else:
+            backend.key(key, True)
+
+    def _op_key_release(self, op):
+        _, modifiers, key = op
+        backend = self.backend
+        backend.key(key, False)
+        for mod in modifiers:
+            backend.key(mod, False)
+
+    def parse_key(self, key_str):
+        """Converteste string in tasta nativă a backend-ului"""
+        return self.backend.resolve_key(parse_key(key_str))
+
+    def _wait_while_paused(self, clock):
+        """Blochează bucla de redare cât timp e pe pauză (fără polling)"""
+        clock.pause()
+        with self._state:
+            if self._pause_requested_ns is not None:
+                self.pause_latency_ms = (time.perf_counter_ns() - self._pause_requested_ns) / 1e6
+                self._pause_requested_ns = None
+            while self.paused and self.playing and not self.stop_requested:
+                self._state.wait(PAUSE_WAIT_TIMEOUT)
+        clock.resume()
+
+    def pause(self):
+        """Pune redarea pe pauză"""
+        with self._state:
+            if self.playing and not self.paused:
+                self.paused = True
+                self.pause_event.clear()
+                self._pause_requested_ns = time.perf_counter_ns()
+                self._wake.set()
+
+    def resume(self):
+        """Reia redarea"""
+        with self._state:
+            if self.playing and self.paused:
+                self.paused = False
+                self.pause_event.set()
+                if not self.stop_requested:
+                    self._wake.clear()
+                self._state.notify_all()
+
+    def stop(self):
+        """Opreste redarea"""
+        with self._state:
+            if self.playing and self._stop_requested_ns is None:
+                self._stop_requested_ns = time.perf_counter_ns()
+            self.playing = False
+            self.paused = False
+            self.stop_requested = True
+            self.pause_event.set()
+            self._wake.set()
+            self._state.notify_all()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Progress reporting
+Slot partajat în care thread-ul de redare scrie doar ultima poziție
+(index, total, loop, timestamp). Consumatorii (GUI, CLI) îl citesc la o
+rată fixă, deci formatarea textului și I/O-ul nu mai rulează pe thread-ul
+care injectează evenimentele.
+"""
+
+import threading
+
+
+PROGRESS_SAMPLE_INTERVAL = 0.1  # 10 Hz
+
+
+class ProgressReporter:
+    """
+    Ultima poziție a redării.
+
+    Scrierile sunt simple atribuiri de atribute (atomice sub GIL), fără lock;
+    un consumator poate vedea un snapshot cu câmpuri din evenimente vecine,
+    ceea ce e suficient pentru afișare.
+    """
+
+    __slots__ = ('index', 'total', 'loop', 'timestamp', 'error', 'active')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, total=0):
+        self.index = 0
+        self.total = total
+        self.loop = 0
+        self.timestamp = 0.0
+        self.error = None     # Ultima eroare de injectare (text)
+        self.active = False
+
+    def start(self, total):
+        """Apelat de player la începutul redării"""
+        self.reset(total)
+        self.active = True
+
+    def finish(self):
+        self.active = False
+
+    def snapshot(self):
+        """(index, total, loop, timestamp, error)"""
+        return (self.index, self.total, self.loop, self.timestamp, self.error)
+
+    def percent(self):
+        total = self.total
+        return int(self.index * 100 / total) if total else 0
+
+
+class ProgressSampler:
+    """Thread care citește un ProgressReporter la interval fix și apelează emit() la schimbare"""
+
+    def __init__(self, reporter, emit, interval=PROGRESS_SAMPLE_INTERVAL):
+        self.reporter = reporter
+        self.emit = emit
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._last = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bebe-progress", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        snapshot = self.reporter.snapshot()
+        if snapshot != self._last:
+            self._last = snapshot
+            self.emit(self.reporter)
+
+    def stop(self):
+        """Oprește thread-ul și emite ultima stare, dacă s-a schimbat"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sample()
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Recorder
+Înregistrarea acțiunilor mouse/tastatură (TaskRecorder) prin hook-uri pynput.
+Tastatura vine prin hook-ul comun din hotkeys.py (nu un listener propriu).
+"""
+
+import time
+import logging
+
+from pynput import mouse
+from pynput.keyboard import Key
+
+from capture import (CaptureRing, CaptureConsumer, REC_MOUSE_MOVE, REC_MOUSE_CLICK,
+                     REC_MOUSE_SCROLL, REC_KEY_PRESS, REC_KEY_RELEASE)
+from event_store import EventStore
+from hotkeys import get_hotkey_service
+
+
+STOP_KEYS = (Key.f9, Key.esc)  # Opresc înregistrarea și nu sunt înregistrate
+
+
+class TaskRecorder:
+    """Inregistreaza actiuni mouse si tastatura"""
+
+    def __init__(self, callback=None, hotkeys=None):
+        self.events = EventStore()
+        self.recording = False
+        self.start_time = None
+        self.mouse_listener = None
+        self.hotkeys = hotkeys  # HotkeyService; implicit cel comun al procesului
+        self._hotkey_tokens = []
+        self.stop_requested = False
+        self.callback = callback  # Callback pentru update GUI (apelat din thread-ul consumator)
+
+        # Track taste modificatoare pentru combinatii
+        self.pressed_modifiers = set()  # Set de taste apasate (ctrl, alt, shift)
+
+        # Ring buffer-e între hook-uri și thread-ul consumator (câte unul per listener)
+        self.mouse_ring = None
+        self.keyboard_ring = None
+        self.consumer = None
+        self.capture_stats = {}
+
+    def start_recording(self):
+        """Incepe inregistrarea"""
+        self.events = EventStore()
+        self.recording = True
+        self.stop_requested = False
+        self.start_time = time.perf_counter()
+        self.pressed_modifiers = set()  # Reset modificatori
+
+        self.mouse_ring = CaptureRing()
+        self.keyboard_ring = CaptureRing()
+        self.consumer = CaptureConsumer([self.mouse_ring, self.keyboard_ring], self._process_record)
+        self.consumer.start()
+
+        # Mouse listener
+        self.mouse_listener = mouse.Listener(
+            on_move=self.on_mouse_move,
+            on_click=self.on_mouse_click,
+            on_scroll=self.on_mouse_scroll
+        )
+
+        # Tastatura: observator pe hook-ul comun + F9/ESC pentru stop
+        if self.hotkeys is None:
+            self.hotkeys = get_hotkey_service()
+        self._hotkey_tokens = [self.hotkeys.add_observer(self.on_key_press, self.on_key_release)]
+        self._hotkey_tokens += [self.hotkeys.register(key, self._request_stop) for key in STOP_KEYS]
+
+        self.mouse_listener.start()
+
+    def stop_recording(self):
+        """Opreste inregistrarea"""
+        if not self.recording:
+            return self.events
+
+        self.recording = False
+
+        if self.mouse_listener:
+            self.mouse_listener.stop()
+
+        for token in self._hotkey_tokens:
+            self.hotkeys.unregister(token)
+        self._hotkey_tokens = []
+
+        # Procesează ce a rămas în ring-uri și raportează contoarele
+        if self.consumer:
+            self.consumer.stop()
+            self.capture_stats = self.consumer.stats()
+            self.consumer = None
+            logging.getLogger(__name__).info(
+                f"Capture buffer: captured={self.capture_stats['captured']}, "
+                f"high_water={self.capture_stats['high_water']}, "
+                f"overflow={self.capture_stats['overflow']}")
+
+        return self.events
+
+    def get_timestamp(self, when=None):
+        """Timestamp relativ"""
+        if self.start_time:
+            if when is None:
+                when = time.perf_counter()
+            return when - self.start_time
+        return 0
+
+    # --- Callback-uri hook: doar push în ring buffer ---
+
+    def on_mouse_move(self, x, y):
+        """Inregistreaza miscare mouse"""
+        if self.recording:
+            self.mouse_ring.push((REC_MOUSE_MOVE, time.perf_counter(), x, y, None, None))
+
+    def on_mouse_click(self, x, y, button, pressed):
+        """Inregistreaza click-uri"""
+        if self.recording:
+            self.mouse_ring.push((REC_MOUSE_CLICK, time.perf_counter(), x, y, button, pressed))
+
+    def on_mouse_scroll(self, x, y, dx, dy):
+        """Inregistreaza scroll"""
+        if self.recording:
+            self.mouse_ring.push((REC_MOUSE_SCROLL, time.perf_counter(), x, y, dx, dy))
+
+    def on_key_press(self, key):
+        """Inregistreaza apasare tasta"""
+        if self.recording and key not in STOP_KEYS:
+            self.keyboard_ring.push((REC_KEY_PRESS, time.perf_counter(), key, None, None, None))
+
+    def _request_stop(self):
+        """F9/ESC: thread-ul GUI/CLI observă stop_requested și oprește înregistrarea"""
+        if self.recording:
+            self.stop_requested = True
+
+    def on_key_release(self, key):
+        """Inregistreaza eliberare tasta"""
+        if self.recording and key not in STOP_KEYS:
+            self.keyboard_ring.push((REC_KEY_RELEASE, time.perf_counter(), key, None, None, None))
+
+    # --- Thread consumator: normalizare, filtrare, stocare ---
+
+    def _process_record(self, record):
+        """Transformă o înregistrare din ring în eveniment"""
+        kind, when, a, b, c, d = record
+        timestamp = self.get_timestamp(when)
+        if kind == REC_MOUSE_MOVE:
+            self._store_mouse_move(a, b, timestamp)
+        elif kind == REC_MOUSE_CLICK:
+            self._store_mouse_click(a, b, c, d, timestamp)
+        elif kind == REC_MOUSE_SCROLL:
+            self._store_mouse_scroll(a, b, c, d, timestamp)
+        elif kind == REC_KEY_PRESS:
+            self._store_key_press(a, timestamp)
+        elif kind == REC_KEY_RELEASE:
+            self._store_key_release(a, timestamp)
+
+    def _store_mouse_move(self, x, y, timestamp):
+        if not self.events or (timestamp - self.events[-1]['timestamp']) > 0.1:
+            event = {
+                'type': 'mouse_move',
+                'x': x,
+                'y': y,
+                'timestamp': timestamp
+            }
+            self.events.append(event)
+            if self.callback:
+                self.callback(f"Mouse Move ({x}, {y})")
+
+    def _store_mouse_click(self, x, y, button, pressed, timestamp):
+        button_name = str(button).replace('Button.', '')
+        action = "Press" if pressed else "Release"
+
+        event = {
+            'type': 'mouse_click',
+            'x': x,
+            'y': y,
+            'button': str(button),
+            'pressed': pressed,
+            'timestamp': timestamp
+        }
+        self.events.append(event)
+        if self.callback:
+            self.callback(f"Mouse {action} {button_name} @ ({x}, {y})")
+
+    def _store_mouse_scroll(self, x, y, dx, dy, timestamp):
+        event = {
+            'type': 'mouse_scroll',
+            'x': x,
+            'y': y,
+            'dx': dx,
+            'dy': dy,
+            'timestamp': timestamp
+        }
+        self.events.append(event)
+        direction = "Sus" if dy > 0 else "Jos"
+        if self.callback:
+            self.callback(f"Scroll {direction}")
+
+    def convert_control_char(self, char):
+        """Convertește caractere de control în combinații de taste"""
+        if not char or len(char) != 1:
+            return None
+
+        code = ord(char)
+        # Caractere de control (0x01-0x1F) = Ctrl + literă
+        if 0x01 <= code <= 0x1A:  # Ctrl+A până la Ctrl+Z
+            letter = chr(code + ord('A') - 1)  # 0x01 -> 'A', 0x02 -> 'B', etc.
+            return letter.lower()
+        elif code == 0x1B:  # ESC
+            return 'esc'
+        return None
+
+    def get_key_name(self, key):
+        """Extrage numele tastei pentru salvare"""
+        try:
+            if hasattr(key, 'char') and key.char is not None:
+                return key.char
+            else:
+                # Tasta speciala (Enter, Tab, F4, etc.)
+                key_str = str(key).replace('Key.', '')
+                return key_str
+        except:
+            return str(key)
+
+    def _store_key_press(self, key, timestamp):
+        """Inregistreaza apasare tasta"""
+        # PASUL 1: Detecteaza si marcheaza taste modificatoare (Ctrl, Alt, Shift)
+        # Nu salvam modificatorii separat, doar ii tinem minte
+        if key == Key.ctrl or key == Key.ctrl_l or key == Key.ctrl_r:
+            self.pressed_modifiers.add('ctrl')
+            return  # Nu salva event pentru modificator
+        elif key == Key.alt or key == Key.alt_l or key == Key.alt_r:
+            self.pressed_modifiers.add('alt')
+            return  # Nu salva event pentru modificator
+        elif key == Key.shift or key == Key.shift_l or key == Key.shift_r:
+            self.pressed_modifiers.add('shift')
+            return  # Nu salva event pentru modificator
+
+        # PASUL 2: Proceseaza tasta normala sau speciala
+        key_name = None
+        key_display = None
+
+        try:
+            if hasattr(key, 'char') and key.char is not None:
+                char = key.char
+                # Verifica daca e caracter de control (Ctrl+litera = \x01-\x1A)
+                control_letter = self.convert_control_char(char)
+
+                if control_letter and 'ctrl' in self.pressed_modifiers:
+                    # E o combinatie Ctrl+litera (ex: Ctrl+A = '\x01')
+                    # Verifica daca sunt si alti modificatori (ex: Ctrl+Shift+A)
+                    if 'shift' in self.pressed_modifiers:
+                        key_name = f"ctrl+shift+{control_letter}"
+                        key_display = f"Ctrl + Shift + {control_letter.upper()}"
+                    elif 'alt' in self.pressed_modifiers:
+                        key_name = f"ctrl+alt+{control_letter}"
+                        key_display = f"Ctrl + Alt + {control_letter.upper()}"
+                    else:
+                        key_name = f"ctrl+{control_letter}"
+                        key_display = f"Ctrl + {control_letter.upper()}"
+                else:
+                    # Tasta normala (litera, cifra, caracter)
+                    # Verifica daca sunt modificatori apasati
+                    if self.pressed_modifiers:
+                        # Construieste combinatie cu modificatori
+                        mods = sorted(self.pressed_modifiers)
+                        key_name = '+'.join(mods) + '+' + char
+                        mods_display = ' + '.join(m.capitalize() for m in mods)
+                        key_display = f"{mods_display} + '{char}'"
+                    else:
+                        # Tasta normala fara modificatori
+                        key_name = char
+                        key_display = f"'{char}'"
+            else:
+                # Tasta speciala (Enter, Tab, F4, Arrow keys, etc.)
+                key_str = str(key).replace('Key.', '')
+
+                if self.pressed_modifiers:
+                    # Construieste combinatie cu modificatori (ex: Alt+F4, Ctrl+Tab)
+                    mods = sorted(self.pressed_modifiers)
+                    key_name = '+'.join(mods) + '+' + key_str
+                    mods_display = ' + '.join(m.capitalize() for m in mods)
+                    key_display = f"{mods_display} + {key_str.upper()}"
+                else:
+                    # Tasta speciala fara modificatori
+                    key_name = key_str
+                    key_display = key_str.upper()
+        except Exception as e:
+            # Fallback pentru erori
+            key_name = str(key)
+            key_display = str(key)
+
+        # PASUL 3: Salveaza event-ul
+        if key_name:
+            event = {
+                'type': 'key_press',
+                'key': key_name,
+                'modifiers': list(self.pressed_modifiers),
+                'timestamp': timestamp
+            }
+            self.events.append(event)
+            if self.callback:
+                self.callback(f"Key Press {key_display}")
+
+    def _store_key_release(self, key, timestamp):
+        """Inregistreaza eliberare tasta"""
+        # Elimina modificator din set daca e eliberat
+        # Nu salvam eliberarea modificatorilor separat
+        if key == Key.ctrl or key == Key.ctrl_l or key == Key.ctrl_r:
+            self.pressed_modifiers.discard('ctrl')
+            return
+        elif key == Key.alt or key == Key.alt_l or key == Key.alt_r:
+            self.pressed_modifiers.discard('alt')
+            return
+        elif key == Key.shift or key == Key.shift_l or key == Key.shift_r:
+            self.pressed_modifiers.discard('shift')
+            return
+
+        # Pentru taste normale, salvam eliberarea
+        try:
+            if hasattr(key, 'char') and key.char is not None:
+                char = key.char
+                # Verifica daca e caracter de control
+                control_letter = self.convert_control_char(char)
+
+                if control_letter and 'ctrl' in self.pressed_modifiers:
+                    # E o combinatie Ctrl+litera
+                    if 'shift' in self.pressed_modifiers:
+                        key_name = f"ctrl+shift+{control_letter}"
+                    elif 'alt' in self.pressed_modifiers:
+                        key_name = f"ctrl+alt+{control_letter}"
+                    else:
+                        key_name = f"ctrl+{control_letter}"
+                elif self.pressed_modifiers:
+                    # Tasta normala cu modificatori
+                    mods = sorted(self.pressed_modifiers)
+                    key_name = '+'.join(mods) + '+' + char
+                else:
+                    key_name = char
+            else:
+                # Tasta speciala
+                key_str = str(key).replace('Key.', '')
+                if self.pressed_modifiers:
+                    mods = sorted(self.pressed_modifiers)
+                    key_name = '+'.join(mods) + '+' + key_str
+                else:
+                    key_name = key_str
+        except:
+            key_name = str(key)
+
+        event = {
+            'type': 'key_release',
+            'key': key_name,
+            'timestamp': timestamp
+        }
+        self.events.append(event)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Task executable export
+Exportul ca executabil nu mai rulează PyInstaller pentru fiecare task:
+task_runner.py (programul generic) e compilat o singură dată într-un
+runner păstrat în RUNNER_CACHE_DIR, iar exportul doar copiază runner-ul
+sub numele task-ului și scrie lângă el task-ul (<nume>.bebetask, format
+.bebz). Runner-ul e recompilat doar când se schimbă sursele lui: cheia
+din cache e hash-ul modulelor importate (recursiv) de task_runner.py,
+plus versiunea Python.
+
+Task-ul nu e lipit la finalul executabilului: bootloader-ul PyInstaller
+--onefile își caută arhiva după un "cookie" de la sfârșitul fișierului,
+așa că datele adăugate după el pot face executabilul să nu mai pornească.
+"""
+
+import ast
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import task_io
+from task_packed import PACKED_EXTENSION
+from task_runner import PAYLOAD_EXTENSION
+
+
+RUNNER_SCRIPT = 'task_runner.py'
+RUNNER_NAME = 'bebe_runner'
+SOURCE_DIR = Path(__file__).resolve().parent
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir():
+    """
+    Cache-ul runner-elor, per utilizator (%LOCALAPPDATA% pe Windows, altfel
+    $XDG_CACHE_HOME sau ~/.cache): nu depinde de folderul din care e pornit
+    programul și e comun GUI-ului rulat din surse și celui compilat.
+    """
+    base = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+    base = Path(base) if base else Path.home() / '.cache'
+    return base / 'BEBE Task Recorder' / 'runner_cache'
+
+
+RUNNER_CACHE_DIR = default_cache_dir()
+
+
+def runner_sources(source_dir=SOURCE_DIR):
+    """Modulele locale de care depinde task_runner.py (inclusiv el), sortate"""
+    pending = [source_dir / RUNNER_SCRIPT]
+    found = set()
+    while pending:
+        path = pending.pop()
+        if path in found or not path.exists():
+            continue
+        found.add(path)
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = source_dir / f"{name.split('.')[0]}.py"
+                if candidate.exists():
+                    pending.append(candidate)
+    return sorted(found)
+
+
+def runner_key(source_dir=SOURCE_DIR):
+    """Hash-ul surselor runner-ului (și al versiunii Python): se schimbă doar când runner-ul trebuie recompilat"""
+    digest = hashlib.sha256(sys.version.encode('utf-8'))
+    for path in runner_sources(source_dir):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def runner_suffix():
+    return '.exe' if sys.platform == 'win32' else ''
+
+
+def cached_runner_path(key, cache_dir=RUNNER_CACHE_DIR):
+    return Path(cache_dir) / f"{RUNNER_NAME}-{key}{runner_suffix()}"
+
+
+def cached_runners(cache_dir=RUNNER_CACHE_DIR):
+    """Runner-ele compilate din cache, cel mai nou ultimul"""
+    paths = [path for path in Path(cache_dir).glob(f"{RUNNER_NAME}-*{runner_suffix()}")
+             if not path.name.endswith('.partial')]
+    return sorted(paths, key=os.path.getmtime)
+
+
+def find_python():
+    """Interpretorul cu care rulează PyInstaller (din PATH dacă GUI-ul e el însuși un executabil)"""
+    if getattr(sys, 'frozen', False):
+        python_exe = shutil.which('python') or shutil.which('python3')
+        if not python_exe:
+            raise RuntimeError("Python nu a fost gasit in PATH. Instaleaza Python si adauga-l in PATH.")
+        return python_exe
+    return sys.executable
+
+
+def build_runner(target, python_exe=None, source_dir=SOURCE_DIR):
+    """Compilează task_runner.py cu PyInstaller --onefile în `target` (durează minute)"""
+    python_exe = python_exe or find_python()
+    target = Path(target)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = Path(temp_dir)
+        cmd = [
+            python_exe,
+            "-m",
+            "PyInstaller",
+            "--onefile",
+            "--noconsole",
+            "--clean",
+            "--uac-admin",
+            f"--name={RUNNER_NAME}",
+            f"--paths={source_dir}",
+            f"--distpath={temp_dir_path / 'dist'}",
+            f"--workpath={temp_dir_path / 'build'}",
+            f"--specpath={temp_dir_path}",
+            str(source_dir / RUNNER_SCRIPT)
+        ]
+        logger.info("Rulez PyInstaller pentru runner-ul comun (o singura data per versiune)")
+        logger.debug("Comanda PyInstaller: %s", " ".join(cmd))
+        result = subprocess.run(cmd, cwd=temp_dir, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            error_output = result.stderr or result.stdout or "PyInstaller a esuat fara mesaje."
+            logger.error("PyInstaller error output: %s", error_output)
+            raise RuntimeError(error_output)
+        built = temp_dir_path / 'dist' / f"{RUNNER_NAME}{runner_suffix()}"
+        if not built.exists():
+            raise FileNotFoundError("PyInstaller nu a generat executabilul asteptat.")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Copiat lângă țintă și redenumit atomic: un build întrerupt nu lasă un runner stricat în cache
+        partial = target.with_name(target.name + '.partial')
+        shutil.copy2(built, partial)
+        os.replace(partial, target)
+    return target
+
+
+def get_runner(cache_dir=RUNNER_CACHE_DIR, python_exe=None, source_dir=SOURCE_DIR):
+    """Runner-ul din cache pentru sursele curente, compilat acum dacă lipsește"""
+    cache_dir = Path(cache_dir)
+    if not (Path(source_dir) / RUNNER_SCRIPT).exists():
+        # GUI-ul rulează dintr-un executabil fără surse: se folosește ultimul runner compilat
+        cached = cached_runners(cache_dir)
+        if not cached:
+            raise RuntimeError(f"Sursele runner-ului ({RUNNER_SCRIPT}) nu au fost gasite si nu exista "
+                               f"niciun runner compilat in {cache_dir}.")
+        return cached[-1]
+    runner = cached_runner_path(runner_key(source_dir), cache_dir)
+    if runner.exists():
+        return runner
+    build_runner(runner, python_exe, source_dir)
+    # Runner-ele vechi (alte versiuni ale surselor) nu mai sunt folosite
+    for old in cached_runners(cache_dir):
+        if old != runner:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return runner
+
+
+def export_task_executable(exe_path, task_data, cache_dir=RUNNER_CACHE_DIR, python_exe=None):
+    """
+    Exportă task-ul ca executabil: runner-ul din cache copiat ca `exe_path`
+    plus <exe_path>.bebetask. Returnează calea fișierului cu task-ul.
+    """
+    exe_path = Path(exe_path)
+    runner = get_runner(cache_dir, python_exe)
+    exe_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = exe_path.with_suffix(PAYLOAD_EXTENSION)
+    task_io.save_task(payload, task_data, suffix=PACKED_EXTENSION)
+    if exe_path.exists():
+        exe_path.unlink()
+    shutil.copy2(runner, exe_path)
+    return payload
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Scheduler state
+Starea programărilor păstrată între reporniri, într-un SQLite din folderul
+task-urilor (STORE_FILENAME):
+
+    job_state   un rând per programare: ultima rulare (regula de cel mult o
+                rulare pe minut) și ultima dată când scheduler-ul rula cu
+                programarea activă (de aici se calculează ferestrele ratate)
+    runs        istoricul rulărilor: momentul planificat, pornirea, întârzierea,
+                sfârșitul și rezultatul
+
+La pornire se citește doar rândul din job_state al fiecărei programări;
+istoricul e doar adăugat (și curățat după HISTORY_RETENTION_DAYS).
+Spre deosebire de indexul bibliotecii, starea nu e un cache: ștergerea
+fișierului pierde istoricul și recuperarea rulărilor ratate.
+
+GUI-ul și daemon-ul pot folosi același fișier, deci rândurile au un
+proprietar ('owner' = pid:sesiune): o rulare rămasă 'running' devine
+'interrupted' doar dacă procesul care a pornit-o nu mai există, iar
+forget() nu șterge starea unei programări creată de alt proces în viață.
+"""
+
+import os
+import secrets
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import task_io
+
+
+STORE_FILENAME = '.bebe_scheduler.sqlite'
+SCHEMA_VERSION = 2
+HISTORY_RETENTION_DAYS = 90
+BUSY_TIMEOUT = 5.0      # GUI-ul și daemon-ul pot folosi același fișier
+
+# Rezultatul unei rulări (coloana runs.outcome)
+OUTCOME_RUNNING = 'running'
+OUTCOME_COMPLETED = 'completed'
+OUTCOME_STOPPED = 'stopped'
+OUTCOME_FAILED = 'failed'
+OUTCOME_INTERRUPTED = 'interrupted'     # Procesul s-a oprit în timpul rulării
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_state (
+    key         TEXT PRIMARY KEY,
+    last_fire   TEXT,
+    last_seen   TEXT NOT NULL,
+    owner       TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    key         TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    planned     TEXT,
+    started     TEXT NOT NULL,
+    latency_ms  REAL,
+    finished    TEXT,
+    outcome     TEXT NOT NULL,
+    catch_up    INTEGER NOT NULL DEFAULT 0,
+    error       TEXT,
+    owner       TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started);
+CREATE INDEX IF NOT EXISTS runs_key ON runs (key, started);
+"""
+
+
+def _to_text(when):
+    return when.isoformat() if when is not None else None
+
+
+def _from_text(text):
+    return datetime.fromisoformat(text) if text else None
+
+
+def process_alive(pid):
+    """True dacă există un proces cu acest pid (un pid refolosit e raportat ca viu)"""
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)   # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return kernel32.GetLastError() == 5             # ERROR_ACCESS_DENIED: există
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == 259                   # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class ScheduleStore:
+    """
+    Starea scheduler-ului pentru un folder de task-uri.
+
+    Metodele pot fi apelate din orice thread (scheduler, precompilare, GUI).
+    """
+
+    def __init__(self, tasks_dir=task_io.DEFAULT_TASKS_DIR, db_path=None, now=datetime.now):
+        self.db_path = Path(db_path) if db_path else Path(tasks_dir) / STORE_FILENAME
+        self._now = now
+        self.owner = f"{os.getpid()}:{secrets.token_hex(4)}"   # Rândurile scrise de acest proces
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT,
+                                     check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+            for table in ('job_state', 'runs'):
+                # Fișier din versiunea 1: fără proprietar (rândurile vechi sunt ale nimănui)
+                columns = {row['name'] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+                if 'owner' not in columns:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN owner TEXT")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # O rulare rămasă 'running' al cărei proces nu mai există a fost întreruptă;
+            # cele ale altui proces în viață (ex: daemon-ul, pentru GUI) rulează încă
+            running = self._conn.execute("SELECT id, owner FROM runs WHERE outcome = ?",
+                                         (OUTCOME_RUNNING,)).fetchall()
+            self._conn.executemany("UPDATE runs SET outcome = ? WHERE id = ?",
+                                   [(OUTCOME_INTERRUPTED, row['id']) for row in running
+                                    if not self.owner_alive(row['owner'])])
+            cutoff = self._now() - timedelta(days=HISTORY_RETENTION_DAYS)
+            self._conn.execute("DELETE FROM runs WHERE started < ?", (_to_text(cutoff),))
+            self._conn.commit()
+
+    def owner_alive(self, owner):
+        """True dacă procesul care a scris rândul (coloana 'owner') rulează încă"""
+        if owner == self.owner:
+            return True
+        try:
+            pid = int(str(owner).split(':', 1)[0])
+        except ValueError:
+            return False
+        # Același pid cu altă sesiune: un proces vechi al cărui pid a fost refolosit
+        return pid != os.getpid() and process_alive(pid)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # === Starea programărilor ===
+
+    def job_state(self, key):
+        """(last_fire, last_seen) salvate pentru programare, sau (None, None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT last_fire, last_seen FROM job_state WHERE key = ?",
+                                     (key,)).fetchone()
+        if row is None:
+            return None, None
+        return _from_text(row['last_fire']), _from_text(row['last_seen'])
+
+    def touch(self, keys, when=None):
+        """Programările `keys` sunt active la momentul `when` (heartbeat)"""
+        when = _to_text(when or self._now())
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO job_state (key, last_seen, owner) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen",
+                [(key, when, self.owner) for key in keys])
+            self._conn.commit()
+
+    def forget(self, key):
+        """
+        Programarea a fost ștearsă: nu mai există ferestre ratate de recuperat.
+        Rândul creat de alt proces în viață (care poate programa încă aceeași
+        cheie) rămâne; returnează True dacă rândul a fost șters.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT owner FROM job_state WHERE key = ?", (key,)).fetchone()
+            if row is None or row['owner'] == self.owner or not self.owner_alive(row['owner']):
+                self._conn.execute("DELETE FROM job_state WHERE key = ?", (key,))
+                self._conn.commit()
+                return True
+            return False
+
+    # === Istoric ===
+
+    def record_start(self, key, name, planned, started, catch_up=False):
+        """Rulare pornită; actualizează și ultima rulare a programării. Returnează id-ul"""
+        latency_ms = (started - planned).total_seconds() * 1000 if planned is not None else None
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (key, name, planned, started, latency_ms, outcome, catch_up, owner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, name, _to_text(planned), _to_text(started), latency_ms,
+                 OUTCOME_RUNNING, int(catch_up), self.owner))
+            self._conn.execute(
+                "INSERT INTO job_state (key, last_fire, last_seen, owner) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_fire = excluded.last_fire, "
+                "last_seen = excluded.last_seen",
+                (key, _to_text(started), _to_text(started), self.owner))
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def record_finish(self, run_id, outcome, error=None, finished=None):
+        with self._lock:
+            self._conn.execute("UPDATE runs SET finished = ?, outcome = ?, error = ? WHERE id = ?",
+                               (_to_text(finished or self._now()), outcome, error, run_id))
+            self._conn.commit()
+
+    def recent_runs(self, limit=20, key=None):
+        """Ultimele rulări (cele mai noi primele), ca dict-uri"""
+        query = "SELECT * FROM runs"
+        params = []
+        if key is not None:
+            query += " WHERE key = ?"
+            params.append(key)
+        query += " ORDER BY started DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        result = []
+        for row in rows:
+            run = dict(row)
+            run['catch_up'] = bool(run['catch_up'])
+            result.append(run)
+        return result
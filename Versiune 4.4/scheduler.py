@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Scheduler
+Programările (zile + interval orar opțional, ca în ScheduleDialog) sunt
+parsate o singură dată; pentru fiecare se calculează momentul următoarei
+rulări, iar thread-ul scheduler-ului doarme pe un Condition până atunci
+(ultimele milisecunde cu HybridSleeper din timing.py).
+
+Semantica e cea a buclei vechi cu verificare la 10 s:
+    - ziua curentă trebuie să fie în 'days' (pentru intervalele peste
+      miezul nopții, partea de după miezul nopții ține de ziua curentă)
+    - 'time_from' <= ora <= 'time_to' (inclusiv); dacă time_from > time_to
+      intervalul trece peste miezul nopții
+    - cel mult o rulare pe minut; cu 'run_until_stop' task-ul e repornit
+      imediat ce player-ul devine liber (wake())
+    - dacă player-ul e ocupat, rularea se reîncearcă la wake() (apelat la
+      terminarea redării) sau cel târziu după MAX_WAIT
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, time as dt_time
+
+from timing import NS_PER_SEC, get_sleeper
+
+
+DAY_KEYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+MAX_WAIT = 60.0         # Ceasul de perete e reverificat cel puțin o dată pe minut (schimbări de oră, hibernare)
+FINE_WAIT = 0.05        # Ultimele 50 ms sunt așteptate cu HybridSleeper (precizie de ~1 ms)
+LATENCY_HISTORY = 100   # Întârzieri păstrate pentru latency_stats()
+MAX_MISSED_DAYS = 7     # missed_windows() caută cel mult atâtea zile în urmă
+
+_END_OF_DAY = dt_time(23, 59, 59, 999999)
+_ONE_MINUTE = timedelta(minutes=1)
+
+logger = logging.getLogger(__name__)
+
+
+class Schedule:
+    """
+    Programare parsată: zilele permise și intervalele orare din fiecare zi.
+
+    Args:
+        config: dict-ul salvat în task ('days', 'time_interval_enabled',
+            'time_from', 'time_to', 'playback')
+    """
+
+    __slots__ = ('days', 'intervals', 'run_until_stop', 'error')
+
+    def __init__(self, config):
+        config = config or {}
+        self.days = frozenset(DAY_KEYS.index(day) for day in config.get('days', ()) if day in DAY_KEYS)
+        self.run_until_stop = bool((config.get('playback') or {}).get('run_until_stop', False))
+        self.error = None
+        self.intervals = ((dt_time(0, 0), _END_OF_DAY),)
+        if config.get('time_interval_enabled', False):
+            time_from = config.get('time_from')
+            time_to = config.get('time_to')
+            try:
+                if not (time_from and time_to):
+                    raise ValueError("Time interval enabled but times not set")
+                start = datetime.strptime(time_from, "%H:%M").time()
+                end = datetime.strptime(time_to, "%H:%M").time()
+            except ValueError as e:
+                # Ca în bucla veche: interval invalid = nu rulează niciodată
+                self.error = str(e)
+                self.intervals = ()
+            else:
+                if start <= end:
+                    self.intervals = ((start, end),)
+                else:
+                    # Peste miezul nopții: dimineața zilei curente + seara
+                    self.intervals = ((dt_time(0, 0), end), (start, _END_OF_DAY))
+
+    def allows(self, when):
+        """True dacă programarea permite rularea la momentul `when`"""
+        if when.weekday() not in self.days:
+            return False
+        moment = when.time()
+        return any(start <= moment <= end for start, end in self.intervals)
+
+    def next_fire(self, after):
+        """Primul moment >= `after` permis de programare, sau None dacă nu există"""
+        if not self.days or not self.intervals:
+            return None
+        day = after.date()
+        for offset in range(8):
+            current = day + timedelta(days=offset)
+            if current.weekday() not in self.days:
+                continue
+            for start, end in self.intervals:
+                if datetime.combine(current, end) < after:
+                    continue
+                return max(datetime.combine(current, start), after)
+        return None
+
+    def windows(self, since, until):
+        """
+        Ferestrele (început, sfârșit) care se suprapun cu [since, until], în
+        ordine; un interval peste miezul nopții e o singură fereastră.
+        """
+        result = []
+        if not self.days or not self.intervals:
+            return result
+        overnight = len(self.intervals) == 2
+        day = since.date() - timedelta(days=1)
+        while day <= until.date():
+            if day.weekday() in self.days:
+                for start, end in self.intervals:
+                    window_start = datetime.combine(day, start)
+                    window_end = datetime.combine(day, end)
+                    if (overnight and result and start == dt_time(0, 0)
+                            and window_start - result[-1][1] <= timedelta(seconds=1)):
+                        # Dimineața continuă fereastra din seara precedentă
+                        result[-1] = (result[-1][0], window_end)
+                    else:
+                        result.append((window_start, window_end))
+            day += timedelta(days=1)
+        return [(start, end) for start, end in result if end >= since and start <= until]
+
+    def missed_windows(self, since, until, last_fire=None):
+        """
+        Ferestrele încheiate între `since` (ultima dată când scheduler-ul
+        rula) și `until` în care nu a existat nicio rulare (last_fire), cel
+        mult MAX_MISSED_DAYS în urmă; pentru fiecare, momentul de la care ar
+        fi trebuit să ruleze.
+        """
+        since = max(since, until - timedelta(days=MAX_MISSED_DAYS))
+        return [max(start, since) for start, end in self.windows(since, until)
+                if end < until and (last_fire is None or last_fire < start)]
+
+
+class ScheduledJob:
+    """O programare din scheduler: callback(job) -> True dacă a pornit rularea, False dacă e ocupat"""
+
+    def __init__(self, key, schedule, callback, priority=0):
+        self.key = key
+        self.schedule = schedule
+        self.callback = callback
+        self.priority = priority  # La același moment, prioritatea mai mare e declanșată prima
+        self.next_fire = None   # datetime sau None (nu mai rulează / așteaptă wake())
+        self.last_fire = None
+        self.busy = False       # Ultima încercare a găsit player-ul ocupat
+        self.fire_count = 0
+        self._generation = 0    # Intrările vechi din heap sunt ignorate
+
+    def _after_fire(self, fired_at, started):
+        """Momentul de la care se caută următoarea rulare"""
+        if not started:
+            self.busy = True
+            return fired_at + timedelta(seconds=MAX_WAIT)
+        self.busy = False
+        self.last_fire = fired_at
+        self.fire_count += 1
+        if self.schedule.run_until_stop:
+            # Repornit la wake() (redare terminată); altfel reîncercat după MAX_WAIT
+            return fired_at + timedelta(seconds=MAX_WAIT)
+        # Cel mult o rulare pe minut
+        return fired_at.replace(second=0, microsecond=0) + _ONE_MINUTE
+
+
+class Scheduler:
+    """
+    Programări ținute într-un min-heap după (momentul următoarei rulări,
+    -prioritate).
+
+    Callback-urile rulează pe thread-ul scheduler-ului și trebuie să fie
+    scurte (ex: root.after); add/remove/wake pot fi apelate din orice thread.
+    """
+
+    def __init__(self, now=datetime.now):
+        self._now = now
+        self._cond = threading.Condition()
+        self._heap = []
+        self._jobs = {}
+        self._sequence = itertools.count()
+        self._thread = None
+        self._running = False
+        self._latencies = deque(maxlen=LATENCY_HISTORY)
+
+    # === Programări ===
+
+    def add(self, key, config, callback, priority=0, last_fire=None):
+        """
+        Adaugă sau înlocuiește programarea `key`; returnează ScheduledJob.
+        `last_fire` (ex: restaurat după repornire) păstrează regula de cel
+        mult o rulare pe minut.
+        """
+        schedule = Schedule(config)
+        if schedule.error:
+            logger.warning(f"Schedule {key!r}: {schedule.error}")
+        job = ScheduledJob(key, schedule, callback, priority)
+        with self._cond:
+            old = self._jobs.get(key)
+            if old is not None:
+                old._generation += 1  # Intrările din heap ale versiunii vechi devin invalide
+                job.last_fire = old.last_fire
+            elif last_fire is not None:
+                job.last_fire = last_fire
+            self._jobs[key] = job
+            after = self._now()
+            if job.last_fire is not None and not schedule.run_until_stop:
+                after = max(after, job.last_fire.replace(second=0, microsecond=0) + _ONE_MINUTE)
+            self._push(job, schedule.next_fire(after))
+            self._cond.notify()
+        logger.info(f"Schedule {key!r}: next run {job.next_fire}")
+        return job
+
+    def remove(self, key):
+        with self._cond:
+            job = self._jobs.pop(key, None)
+            if job is not None:
+                job._generation += 1
+                job.next_fire = None
+                self._cond.notify()
+        return job is not None
+
+    def get(self, key):
+        return self._jobs.get(key)
+
+    def jobs(self):
+        """Programările, în ordinea următoarei rulări"""
+        with self._cond:
+            jobs = list(self._jobs.values())
+        return sorted(jobs, key=lambda job: (job.next_fire is None, job.next_fire or datetime.max))
+
+    def wake(self):
+        """Player-ul a devenit liber: programările ocupate / continue sunt reevaluate imediat"""
+        with self._cond:
+            now = self._now()
+            for job in self._jobs.values():
+                if job.busy or (job.schedule.run_until_stop and job.last_fire is not None):
+                    self._push(job, job.schedule.next_fire(now))
+            self._cond.notify()
+
+    def _push(self, job, when):
+        job._generation += 1
+        job.next_fire = when
+        if when is not None:
+            heapq.heappush(self._heap, (when, -job.priority, next(self._sequence), job, job._generation))
+
+    # === Thread ===
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="bebe-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(1.0)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def _next_due(self):
+        """Următoarea intrare validă când mai sunt cel mult FINE_WAIT secunde; altfel doarme (sub lock)"""
+        while self._running:
+            heap = self._heap
+            while heap and heap[0][4] != heap[0][3]._generation:
+                heapq.heappop(heap)
+            if not heap:
+                self._cond.wait()
+                continue
+            when = heap[0][0]
+            delay = (when - self._now()).total_seconds()
+            if delay > FINE_WAIT:
+                self._cond.wait(min(delay - FINE_WAIT, MAX_WAIT))
+                continue
+            _, _, _, job, generation = heapq.heappop(heap)
+            return job, generation, when, delay
+        return None
+
+    def _run(self):
+        sleeper = get_sleeper('balanced')
+        while True:
+            with self._cond:
+                due = self._next_due()
+            if due is None:
+                return
+            job, generation, when, delay = due
+            if delay > 0:
+                sleeper.sleep_until(time.perf_counter_ns() + int(delay * NS_PER_SEC))
+            if job._generation != generation:
+                continue  # Înlocuită / ștearsă între timp
+            fired_at = self._now()
+            latency_ms = (fired_at - when).total_seconds() * 1000
+            try:
+                started = bool(job.callback(job))
+            except Exception:
+                logger.exception(f"Schedule {job.key!r}: callback failed")
+                started = False
+            if started:
+                self._latencies.append(latency_ms)
+                logger.info(f"Schedule {job.key!r} triggered at {fired_at:%H:%M:%S.%f} "
+                            f"(planned {when:%H:%M:%S.%f}, latency {latency_ms:.1f}ms)")
+            with self._cond:
+                if job._generation == generation:
+                    self._push(job, job.schedule.next_fire(job._after_fire(fired_at, started)))
+
+    # === Metrici ===
+
+    def latency_stats(self):
+        """Întârzierea declanșărilor față de momentul planificat (ms): count, mean, max, last"""
+        latencies = list(self._latencies)
+        if not latencies:
+            return {'count': 0, 'mean': 0.0, 'max': 0.0, 'last': 0.0}
+        return {'count': len(latencies), 'mean': sum(latencies) / len(latencies),
+                'max': max(latencies), 'last': latencies[-1]}
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Binary task format (.bebt)
+Format binar versionat, citit prin mmap fără a crea obiecte Python per
+eveniment.
+
+Structură (little-endian):
+    header      MAGIC, versiune, număr coloane, număr evenimente,
+                offset/lungime secțiune meta
+    director    pentru fiecare coloană: typecode + offset
+    meta        JSON UTF-8: câmpurile task-ului (fără 'events'), tabela de
+                string-uri și evenimentele ne-canonice ('extras')
+    coloane     câte un bloc de valori cu lățime fixă per câmp (vezi
+                event_store.COLUMNS), aliniat la 8 octeți
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from event_store import EventStore, COLUMNS, decode_row
+
+
+MAGIC = b'BEBT'
+FORMAT_VERSION = 1
+BINARY_EXTENSION = '.bebt'
+
+HEADER = struct.Struct('<4sHHQQQ')       # magic, versiune, coloane, evenimente, meta_offset, meta_length
+COLUMN_ENTRY = struct.Struct('<c7xQ')    # typecode, offset
+ALIGNMENT = 8
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+class BinaryTaskError(ValueError):
+    """Fișier .bebt invalid sau cu versiune necunoscută"""
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def is_binary_task(path):
+    """True dacă fișierul începe cu semnătura formatului binar"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary_task(path, data):
+    """Scrie task-ul (dict cu 'events' ca EventStore sau listă de dict-uri) în format .bebt"""
+    events = data.get('events', [])
+    store = events if isinstance(events, EventStore) else EventStore.from_dicts(events)
+
+    meta = {key: value for key, value in data.items() if key != 'events'}
+    meta['strings'] = store.strings
+    meta['extras'] = {str(index): event for index, event in store.extras.items()}
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+
+    count = len(store)
+    meta_offset = HEADER.size + COLUMN_ENTRY.size * len(COLUMNS)
+    offset = _align(meta_offset + len(meta_bytes))
+    directory = []
+    for name, typecode in COLUMNS:
+        directory.append((typecode, offset))
+        offset = _align(offset + getattr(store, name).itemsize * count)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(COLUMNS), count, meta_offset, len(meta_bytes)))
+        for typecode, column_offset in directory:
+            f.write(COLUMN_ENTRY.pack(typecode.encode('ascii'), column_offset))
+        f.write(meta_bytes)
+        for (name, _), (_, column_offset) in zip(COLUMNS, directory):
+            f.write(b'\0' * (column_offset - f.tell()))
+            column = getattr(store, name)
+            if not _LITTLE_ENDIAN and column.itemsize > 1:
+                column = array(column.typecode, column)
+                column.byteswap()
+            column.tofile(f)
+
+
+class BinaryTask:
+    """
+    Task .bebt deschis prin mmap.
+
+    `columns` conține memoryview-uri tipizate direct peste fișierul mapat
+    (zero-copy); evenimentele individuale sunt decodate doar la cerere.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BinaryTaskError(f"Fișier gol: {path}")
+        self.columns = {}
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        buffer = self._mmap
+        if len(buffer) < HEADER.size:
+            raise BinaryTaskError("Header incomplet")
+        magic, version, column_count, count, meta_offset, meta_length = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise BinaryTaskError("Nu este un fișier task binar BEBE")
+        if version != FORMAT_VERSION:
+            raise BinaryTaskError(f"Versiune format necunoscută: {version}")
+        if column_count != len(COLUMNS):
+            raise BinaryTaskError(f"Număr de coloane neașteptat: {column_count}")
+        self.version = version
+        self.count = count
+        self.meta = json.loads(bytes(buffer[meta_offset:meta_offset + meta_length]).decode('utf-8'))
+        self.strings = self.meta.pop('strings', [])
+        self.extras = {int(index): event for index, event in self.meta.pop('extras', {}).items()}
+
+        view = memoryview(buffer)
+        for index, (name, typecode) in enumerate(COLUMNS):
+            stored_typecode, offset = COLUMN_ENTRY.unpack_from(buffer, HEADER.size + index * COLUMN_ENTRY.size)
+            if stored_typecode.decode('ascii') != typecode:
+                raise BinaryTaskError(f"Tip neașteptat pentru coloana {name}")
+            size = array(typecode).itemsize * count
+            if offset + size > len(buffer):
+                raise BinaryTaskError(f"Coloana {name} depășește fișierul")
+            self.columns[name] = view[offset:offset + size].cast(typecode)
+            setattr(self, name, self.columns[name])
+        view.release()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def task_data(self):
+        """Câmpurile task-ului fără evenimente (version, created, schedule, playback, ...)"""
+        return dict(self.meta)
+
+    def to_store(self):
+        """EventStore cu coloanele copiate în bloc (fără obiecte per eveniment)"""
+        if not _LITTLE_ENDIAN:
+            columns = {}
+            for name, typecode in COLUMNS:
+                column = array(typecode)
+                with self.columns[name].cast('B') as raw:
+                    column.frombytes(raw)
+                column.byteswap()
+                columns[name] = column
+            return EventStore.from_columns(columns, self.strings, self.extras)
+        return EventStore.from_columns(self.columns, self.strings, self.extras)
+
+    def event(self, index):
+        """Un singur eveniment ca dict, decodat la cerere din coloanele mapate"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("BinaryTask index out of range")
+        return decode_row(self, index)
+
+    def iter_dicts(self):
+        """Evenimentele pe rând (ex: pentru compile_events), fără a copia coloanele"""
+        for index in range(self.count):
+            yield decode_row(self, index)
+
+    def close(self):
+        for name, column in self.columns.items():
+            column.release()
+            setattr(self, name, None)
+        self.columns = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_binary_task(path):
+    """Task-ul ca dict (ca la JSON), cu 'events' ca EventStore"""
+    with BinaryTask(path) as task:
+        data = task.task_data()
+        data['events'] = task.to_store()
+    return data
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Task I/O
+Citire, validare, salvare și statistici pentru fișierele task, fără
+dependențe grele (Tk, pyautogui, pynput) - folosit de CLI și de GUI.
+"""
+
+import itertools
+import json
+import tempfile
+from pathlib import Path
+
+from event_store import EventStore, EVENT_TYPES, as_event_dicts, T_SCROLL, T_CLICK
+from task_binary import (BINARY_EXTENSION, BinaryTask, BinaryTaskError, is_binary_task,
+                         load_binary_task, write_binary_task)
+from task_packed import (PACKED_EXTENSION, PackedTask, PackedTaskError, is_packed_task,
+                         load_packed_task, write_packed_task)
+from task_jsonl import (JSONL_EXTENSION, JsonlTaskError, is_jsonl_task, iter_legacy_json,
+                        load_jsonl_task, open_task_stream, read_jsonl_header, write_jsonl_task)
+
+
+TASK_EXTENSIONS = ('.json', BINARY_EXTENSION, JSONL_EXTENSION, PACKED_EXTENSION)
+DEFAULT_TASKS_DIR = Path("tasks")
+
+# Fișierele JSON salvate au evenimentele la final, câte unul pe linie, după
+# acest marcaj; 'chunks' din header dă offset-ul (în octeți, relativ la
+# sfârșitul marcajului) fiecărui al CHUNK_SIZE-lea eveniment
+EVENTS_MARKER = b'\n  "events": [\n'
+CHUNK_SIZE = 1024
+HEADER_READ_SIZE = 1 << 16
+
+
+class TaskFormatError(ValueError):
+    """Fișierul nu are structura unui task BEBE"""
+
+
+def validate_task(data):
+    """Verifică structura minimă a unui task; ridică TaskFormatError"""
+    if not isinstance(data, dict):
+        raise TaskFormatError("Task-ul trebuie să fie un obiect JSON")
+    if 'events' not in data:
+        raise TaskFormatError("Lipsește cheia 'events'")
+    events = data['events']
+    if not hasattr(events, '__len__') or isinstance(events, (str, dict)):
+        raise TaskFormatError("'events' trebuie să fie o listă")
+    return data
+
+
+def load_task(path, validate=True):
+    """
+    Încarcă un task (dict cu 'events', 'schedule', 'playback', ...).
+
+    Fișierele .bebt sunt citite prin mmap, cele .jsonl în flux și cele .bebz
+    bloc cu bloc, toate cu 'events' ca EventStore; fișierele JSON au
+    'events' ca listă de dict-uri.
+    """
+    if is_binary_task(path):
+        try:
+            return load_binary_task(path)
+        except BinaryTaskError as e:
+            raise TaskFormatError(str(e))
+    if is_packed_task(path):
+        try:
+            return load_packed_task(path)
+        except PackedTaskError as e:
+            raise TaskFormatError(str(e))
+    if is_jsonl_task(path):
+        try:
+            return load_jsonl_task(path)
+        except JsonlTaskError as e:
+            raise TaskFormatError(str(e))
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if validate:
+        validate_task(data)
+    return data
+
+
+def save_task(path, data, suffix=None):
+    """
+    Salvează task-ul ca JSON, .bebt, .jsonl sau .bebz, după extensie sau după
+    `suffix` (ex: .bebetask scris ca .bebz); acceptă și EventStore în 'events'.
+    Se adaugă 'summary' (vezi task_summary); JSON-ul primește și tabela
+    'chunks' pentru read_event_range.
+    """
+    data = dict(data)
+    data['event_count'] = len(data.get('events', []))
+    data['summary'] = task_summary(data)
+    data.pop('chunks', None)
+    suffix = (suffix or Path(path).suffix).lower()
+    if suffix == BINARY_EXTENSION:
+        write_binary_task(path, data)
+        return
+    if suffix == JSONL_EXTENSION:
+        write_jsonl_task(path, data)
+        return
+    if suffix == PACKED_EXTENSION:
+        write_packed_task(path, data)
+        return
+    _write_chunked_json(path, data)
+
+
+def _write_chunked_json(path, data):
+    """
+    JSON valid (citibil cu json.load), dar cu header-ul (metadate, summary,
+    chunks) înaintea evenimentelor, iar evenimentele câte unul pe linie.
+    """
+    events = data.pop('events', [])
+    rows = events.iter_dicts() if hasattr(events, 'iter_dicts') else as_event_dicts(events)
+    offsets = []
+    with tempfile.TemporaryFile() as body:
+        # Offset-urile nu depind de header, deci evenimentele se scriu întâi separat
+        offset = 0
+        for index, event in enumerate(rows):
+            if index:
+                body.write(b',\n')
+                offset += 2
+            if index % CHUNK_SIZE == 0:
+                offsets.append(offset)
+            line = json.dumps(event, ensure_ascii=False).encode('utf-8')
+            body.write(line)
+            offset += len(line)
+        data['chunks'] = {'size': CHUNK_SIZE, 'offsets': offsets}
+        header = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        body.seek(0)
+        with open(path, 'wb') as f:
+            f.write(header[:-2])  # fără '\n}' de la final
+            f.write(b',')
+            f.write(EVENTS_MARKER)
+            for chunk in iter(lambda: body.read(HEADER_READ_SIZE), b''):
+                f.write(chunk)
+            f.write(b'\n  ]\n}')
+
+
+def task_summary(data):
+    """Rezumat precalculat: durată, tipuri, zona ecranului, taste/click-uri, setări loop"""
+    events = data.get('events', [])
+    stats = task_stats(data)
+    if isinstance(events, EventStore):
+        click_count = sum(1 for event_type, pressed in zip(events.types, events.b)
+                          if event_type == T_CLICK and pressed)
+        click_count += sum(1 for event in events.extras.values()
+                           if event.get('type') == 'mouse_click' and event.get('pressed'))
+    else:
+        click_count = sum(1 for event in events
+                          if event.get('type') == 'mouse_click' and event.get('pressed'))
+    playback = data.get('playback') or {}
+    return {
+        'duration': stats['duration'],
+        'type_counts': stats['type_counts'],
+        'bbox': stats['bbox'],
+        'key_count': stats['type_counts'].get('key_press', 0),
+        'click_count': click_count,
+        'loop': {key: playback[key] for key in ('loop', 'loop_count', 'run_until_stop') if key in playback},
+    }
+
+
+def header_stats(header):
+    """task_stats din 'summary'-ul unui header (None dacă task-ul nu are rezumat)"""
+    summary = header.get('summary')
+    if not isinstance(summary, dict) or 'event_count' not in header:
+        return None
+    bbox = summary.get('bbox')
+    return {
+        'event_count': header['event_count'],
+        'duration': summary.get('duration', 0.0),
+        'type_counts': summary.get('type_counts', {}),
+        'bbox': tuple(bbox) if bbox else None,
+        'created': header.get('created'),
+        'schedule': header.get('schedule'),
+        'playback': header.get('playback'),
+    }
+
+
+def read_task_stats(path):
+    """task_stats pentru un fișier: din rezumatul din header dacă există, altfel citind tot task-ul"""
+    if is_binary_task(path) or is_packed_task(path) or is_jsonl_task(path):
+        header = read_task_header(path)
+    else:
+        header, _ = _read_json_prefix(path)  # Fără rezumat: un singur parcurs, prin load_task
+    stats = header_stats(header) if header else None
+    if stats is None:
+        stats = task_stats(load_task(path))
+    return stats
+
+
+def read_task_header(path):
+    """
+    Câmpurile task-ului fără evenimente ('event_count', 'summary', 'chunks',
+    'schedule', 'playback', ...), citind doar începutul fișierului.
+
+    Pentru JSON salvat de versiuni mai vechi (fără marcaj) fișierul e citit
+    în flux, fără a păstra evenimentele.
+    """
+    if is_binary_task(path) or is_packed_task(path):
+        with (BinaryTask(path) if is_binary_task(path) else PackedTask(path)) as task:
+            meta = task.task_data()
+            meta['event_count'] = len(task)
+            return meta
+    if is_jsonl_task(path):
+        return read_jsonl_header(path)
+    header, _ = _read_json_prefix(path)
+    if header is not None:
+        return header
+    meta = {}
+    count = sum(1 for _ in iter_legacy_json(path, meta))
+    meta.setdefault('event_count', count)
+    return meta
+
+
+def _read_json_prefix(path):
+    """(header, offset-ul primului eveniment) sau (None, None) dacă fișierul nu are marcajul"""
+    prefix = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(HEADER_READ_SIZE)
+            if not chunk:
+                return None, None
+            search_from = max(0, len(prefix) - len(EVENTS_MARKER))
+            prefix += chunk
+            position = prefix.find(EVENTS_MARKER, search_from)
+            if position >= 0:
+                break
+            if len(prefix) > 64 * HEADER_READ_SIZE:
+                return None, None
+    try:
+        header = json.loads(prefix[:position].rstrip(b',').decode('utf-8') + '}')
+    except ValueError:
+        return None, None
+    if 'chunks' not in header:
+        # JSON indentat clasic: după 'events' pot urma alte câmpuri
+        return None, None
+    return header, position + len(EVENTS_MARKER)
+
+
+def read_event_range(path, start, stop):
+    """
+    Evenimentele [start, stop) ca listă de dict-uri. Pentru JSON cu tabela
+    'chunks' se sare direct la chunk-ul care conține `start`; altfel se
+    citește în flux până la `stop`.
+    """
+    if start < 0 or stop < start:
+        raise ValueError("Interval invalid")
+    if is_binary_task(path):
+        with BinaryTask(path) as task:
+            return [task.event(index) for index in range(start, min(stop, len(task)))]
+    if is_jsonl_task(path) or is_packed_task(path):
+        header, base = None, None
+    else:
+        header, base = _read_json_prefix(path)
+    chunks = (header or {}).get('chunks')
+    if not chunks or not chunks.get('offsets'):
+        _, events = open_task_stream(path)
+        try:
+            return list(itertools.islice(events, start, stop))
+        finally:
+            events.close()
+    chunk_index = min(start // chunks['size'], len(chunks['offsets']) - 1)
+    first = chunk_index * chunks['size']
+    events = []
+    with open(path, 'rb') as f:
+        f.seek(base + chunks['offsets'][chunk_index])
+        for index, line in enumerate(f, first):
+            if index >= stop:
+                break
+            line = line.rstrip().rstrip(b',')
+            if not line.startswith(b'{'):
+                break  # Sfârșitul listei ('  ]')
+            if index >= start:
+                events.append(json.loads(line))
+    return events
+
+
+def list_task_files(tasks_dir=DEFAULT_TASKS_DIR):
+    """Fișierele task din folder, sortate după nume"""
+    tasks_dir = Path(tasks_dir)
+    if not tasks_dir.exists():
+        return []
+    return sorted((path for path in tasks_dir.iterdir()
+                   if path.is_file() and path.suffix.lower() in TASK_EXTENSIONS),
+                  key=lambda path: path.stem)
+
+
+def find_task_file(tasks_dir, name):
+    """
+    Fișierul task cu numele dat: numele complet al fișierului (t.bebt) sau
+    doar numele task-ului (prima extensie existentă, implicit .json)
+    """
+    tasks_dir = Path(tasks_dir)
+    if Path(name).suffix.lower() in TASK_EXTENSIONS and (tasks_dir / name).exists():
+        return tasks_dir / name
+    for extension in TASK_EXTENSIONS:
+        path = tasks_dir / f"{name}{extension}"
+        if path.exists():
+            return path
+    return tasks_dir / f"{name}{TASK_EXTENSIONS[0]}"
+
+
+def _store_stats(store):
+    """task_stats pe coloanele unui EventStore (fără vederi per eveniment)"""
+    type_counts = {}
+    for event_type in set(store.types):
+        if event_type < len(EVENT_TYPES):
+            type_counts[EVENT_TYPES[event_type]] = store.types.count(event_type)
+    for event in store.extras.values():
+        event_type = event.get('type', 'unknown')
+        type_counts[event_type] = type_counts.get(event_type, 0) + 1
+    mouse_xs = [x for x, t in zip(store.xs, store.types) if t <= T_SCROLL]
+    mouse_ys = [y for y, t in zip(store.ys, store.types) if t <= T_SCROLL]
+    timestamps = store.timestamps
+    return {
+        'event_count': len(store),
+        'duration': (timestamps[-1] - timestamps[0]) if timestamps else 0.0,
+        'type_counts': type_counts,
+        'bbox': (min(mouse_xs), min(mouse_ys), max(mouse_xs), max(mouse_ys)) if mouse_xs else None,
+    }
+
+
+def task_stats(data):
+    """Statistici rapide: număr evenimente, durată, tipuri, zona ecranului folosită"""
+    events = data.get('events', [])
+    if isinstance(events, EventStore):
+        stats = _store_stats(events)
+        stats.update(created=data.get('created'), schedule=data.get('schedule'),
+                     playback=data.get('playback'))
+        return stats
+    type_counts = {}
+    min_x = min_y = max_x = max_y = None
+    first_ts = last_ts = None
+    for event in events:
+        event_type = event.get('type', 'unknown')
+        type_counts[event_type] = type_counts.get(event_type, 0) + 1
+        timestamp = event.get('timestamp')
+        if isinstance(timestamp, (int, float)):
+            if first_ts is None:
+                first_ts = timestamp
+            last_ts = timestamp
+        x = event.get('x')
+        y = event.get('y')
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            if min_x is None:
+                min_x = max_x = x
+                min_y = max_y = y
+            else:
+                min_x = min(min_x, x)
+                max_x = max(max_x, x)
+                min_y = min(min_y, y)
+                max_y = max(max_y, y)
+    return {
+        'event_count': len(events),
+        'duration': (last_ts - first_ts) if first_ts is not None else 0.0,
+        'type_counts': type_counts,
+        'bbox': (min_x, min_y, max_x, max_y) if min_x is not None else None,
+        'created': data.get('created'),
+        'schedule': data.get('schedule'),
+        'playback': data.get('playback'),
+    }
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - JSON-Lines task format (.jsonl)
+Format text pentru citire în flux: prima linie e header-ul (câmpurile
+task-ului fără 'events'), apoi câte un eveniment JSON pe linie.
+
+    {"format": "bebe-jsonl", "version": 1, "event_count": 2, "playback": {...}}
+    {"type": "mouse_move", "x": 10, "y": 20, "timestamp": 0.0}
+    {"type": "mouse_click", "x": 10, "y": 20, "button": "Button.left", "pressed": true, "timestamp": 0.1}
+
+Cititorii sunt generatoare: redarea poate începe după primele evenimente,
+iar memoria rămâne limitată indiferent de mărimea fișierului. Fișierele
+.json vechi sunt citite tot în flux (vezi iter_legacy_json).
+"""
+
+import os
+import json
+from pathlib import Path
+
+from event_store import EventStore, as_event_dicts
+from task_binary import BinaryTask, is_binary_task
+from task_packed import PackedTask, is_packed_task
+
+
+JSONL_EXTENSION = '.jsonl'
+JSONL_FORMAT = 'bebe-jsonl'
+JSONL_VERSION = 1
+
+READ_CHUNK_SIZE = 1 << 16  # Octeți citiți odată din fișierele .json vechi
+
+_decoder = json.JSONDecoder()
+
+
+class JsonlTaskError(ValueError):
+    """Fișier .jsonl invalid sau cu versiune necunoscută"""
+
+
+def is_jsonl_task(path):
+    return Path(path).suffix.lower() == JSONL_EXTENSION
+
+
+def write_jsonl_task(path, data):
+    """Scrie task-ul ca header + un eveniment pe linie (acceptă și EventStore în 'events')"""
+    events = data.get('events', [])
+    header = _build_header(data, len(events))
+    rows = events.iter_dicts() if hasattr(events, 'iter_dicts') else as_event_dicts(events)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False))
+        f.write('\n')
+        for event in rows:
+            f.write(json.dumps(event, ensure_ascii=False))
+            f.write('\n')
+
+
+def _build_header(data, count):
+    """Header-ul .jsonl: câmpurile task-ului, cu versiunea task-ului mutată în 'task_version'"""
+    header = {'format': JSONL_FORMAT, 'version': JSONL_VERSION}
+    header.update((key, value) for key, value in data.items()
+                  if key not in ('events', 'format', 'version', 'event_count'))
+    if 'version' in data:
+        header['task_version'] = data['version']
+    header['event_count'] = count
+    return header
+
+
+def _parse_header(line, path):
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise JsonlTaskError(f"Header invalid în {path}: {e}")
+    if not isinstance(header, dict) or header.get('format') != JSONL_FORMAT:
+        raise JsonlTaskError(f"Nu este un fișier task JSON-Lines BEBE: {path}")
+    if header.get('version') != JSONL_VERSION:
+        raise JsonlTaskError(f"Versiune format necunoscută: {header.get('version')}")
+    return header
+
+
+def _task_meta(header):
+    """Câmpurile task-ului din header (cu 'version' restaurat la versiunea task-ului)"""
+    meta = {key: value for key, value in header.items() if key not in ('format', 'task_version')}
+    if 'task_version' in header:
+        meta['version'] = header['task_version']
+    return meta
+
+
+def read_jsonl_header(path):
+    """Doar prima linie: câmpurile task-ului + 'event_count', fără a citi evenimentele"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return _task_meta(_parse_header(f.readline(), path))
+
+
+def iter_jsonl_events(path):
+    """Generator: evenimentele din .jsonl, câte unul, pe măsură ce sunt citite"""
+    with open(path, 'r', encoding='utf-8') as f:
+        _parse_header(f.readline(), path)
+        for line_number, line in enumerate(f, 2):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise JsonlTaskError(f"Linia {line_number} invalidă în {path}: {e}")
+
+
+def iter_legacy_json(path, meta=None):
+    """
+    Generator: evenimentele dintr-un task .json clasic, fără a încărca tot
+    fișierul. Câmpurile din afara listei 'events' sunt puse în `meta` pe
+    măsură ce sunt întâlnite (cele de după 'events' sunt complete abia la
+    sfârșitul iterării).
+    """
+    if meta is None:
+        meta = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        scanner = _JsonScanner(f)
+        scanner.expect('{')
+        if scanner.peek() == '}':
+            return
+        while True:
+            key = scanner.value()
+            scanner.expect(':')
+            if key == 'events' and scanner.peek() == '[':
+                scanner.expect('[')
+                if scanner.peek() != ']':
+                    while True:
+                        yield scanner.value()
+                        if scanner.expect(',]') == ']':
+                            break
+                else:
+                    scanner.expect(']')
+            else:
+                meta[key] = scanner.value()
+            if scanner.expect(',}') == '}':
+                break
+
+
+class _JsonScanner:
+    """Citește valori JSON succesive dintr-un fișier text, pe bucăți"""
+
+    def __init__(self, f):
+        self._file = f
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        chunk = self._file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Următorul caracter non-spațiu (fără a-l consuma)"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                raise JsonlTaskError("Sfârșit neașteptat al fișierului JSON")
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise JsonlTaskError(f"JSON invalid: așteptat {chars!r}, găsit {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Următoarea valoare JSON completă"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof or not self._fill():
+                    raise JsonlTaskError("JSON invalid sau trunchiat")
+                continue
+            # Un număr la capătul buffer-ului poate continua în bucata următoare
+            if end < len(self._buffer) or self._eof:
+                self._pos = end
+                return value
+            if not self._fill():
+                self._pos = end
+                return value
+
+
+def open_task_stream(path):
+    """
+    (meta, iterator de evenimente) pentru orice format de task: .jsonl și
+    .json citite în flux, .bebt decodat din coloanele mapate, .bebz bloc cu bloc.
+
+    Pentru .json, `meta` se completează în timpul iterării.
+    """
+    if is_binary_task(path) or is_packed_task(path):
+        task = BinaryTask(path) if is_binary_task(path) else PackedTask(path)
+        meta = task.task_data()
+        meta['event_count'] = len(task)
+
+        def iter_task():
+            try:
+                yield from task.iter_dicts()
+            finally:
+                task.close()
+        return meta, iter_task()
+    if is_jsonl_task(path):
+        return read_jsonl_header(path), iter_jsonl_events(path)
+    meta = {}
+    return meta, iter_legacy_json(path, meta)
+
+
+def load_jsonl_task(path):
+    """Task-ul ca dict (ca la JSON), cu 'events' ca EventStore construit în flux"""
+    data = read_jsonl_header(path)
+    data.pop('event_count', None)
+    data['events'] = EventStore.from_dicts(iter_jsonl_events(path))
+    return data
+
+
+class _EventLines:
+    """Evenimentele dintr-un fișier cu câte unul pe linie, recitite la fiecare iterare"""
+
+    def __init__(self, path, count):
+        self.path = path
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def convert_json_to_jsonl(source, target):
+    """Convertește un task .json (sau .bebt) în .jsonl fără a-l încărca în memorie"""
+    meta, events = open_task_stream(source)
+    tmp_path = Path(f"{target}.tmp")
+    # Fișierul final se scrie alături și înlocuiește ținta abia la sfârșit:
+    # o conversie eșuată nu lasă nici ținta trunchiată, nici fișiere temporare
+    out_path = Path(f"{target}.part")
+    try:
+        count = 0
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # Numărul de evenimente nu e cunoscut dinainte: header-ul se scrie la final
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False))
+                f.write('\n')
+                count += 1
+        # 'chunks' sunt offset-uri în fișierul sursă, iar 'summary' poate fi vechi:
+        # rezumatul se recalculează din evenimentele scrise, ca la task_io.save_task
+        from task_io import task_summary
+        meta = dict(meta)
+        meta.pop('chunks', None)
+        meta['summary'] = task_summary(dict(meta, events=_EventLines(tmp_path, count)))
+        header = _build_header(meta, count)
+        with open(out_path, 'w', encoding='utf-8') as out, open(tmp_path, 'r', encoding='utf-8') as f:
+            out.write(json.dumps(header, ensure_ascii=False))
+            out.write('\n')
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+        os.replace(out_path, target)
+    finally:
+        for path in (tmp_path, out_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    return count
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Task library index
+Index SQLite cu metadatele fiecărui task din folder (număr evenimente,
+durată, tipuri, zona ecranului, schedule, playback), actualizat incremental:
+un fișier e recitit doar dacă i s-au schimbat mtime/mărimea, iar dacă
+hash-ul conținutului e același nu se mai calculează statisticile. Pentru
+task-urile cu 'summary' se citește doar header-ul.
+
+Indexul stă în folderul task-urilor (INDEX_FILENAME) și poate fi șters
+oricând - se reconstruiește la următorul refresh.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import task_io
+
+
+INDEX_FILENAME = '.bebe_library.sqlite'
+SCHEMA_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    filename    TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    sha256      TEXT NOT NULL,
+    event_count INTEGER NOT NULL,
+    duration    REAL NOT NULL,
+    bbox        TEXT,
+    type_counts TEXT NOT NULL,
+    created     TEXT,
+    schedule    TEXT,
+    playback    TEXT,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_name ON tasks (name);
+"""
+
+_COLUMNS = ('filename', 'name', 'mtime_ns', 'size', 'sha256', 'event_count', 'duration',
+            'bbox', 'type_counts', 'created', 'schedule', 'playback', 'error')
+_JSON_COLUMNS = ('bbox', 'type_counts', 'schedule', 'playback')
+
+
+def file_sha256(path):
+    """Hash-ul conținutului, citit pe bucăți"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TaskLibrary:
+    """
+    Indexul task-urilor dintr-un folder.
+
+    Rândurile returnate sunt dict-uri cu aceleași chei ca task_io.task_stats,
+    plus 'name', 'path', 'size', 'mtime_ns', 'sha256' și 'error' (task-uri
+    care nu au putut fi citite rămân în listă, cu mesajul de eroare).
+    """
+
+    def __init__(self, tasks_dir=task_io.DEFAULT_TASKS_DIR, db_path=None):
+        self.tasks_dir = Path(tasks_dir)
+        self.db_path = Path(db_path) if db_path else self.tasks_dir / INDEX_FILENAME
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Indexul e doar un cache: la schimbarea schemei se reconstruiește
+            self._conn.execute("DROP TABLE IF EXISTS tasks")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def refresh(self):
+        """
+        Sincronizează indexul cu folderul; returnează (adăugate, actualizate, șterse).
+        Fișierele nemodificate (mtime + mărime) nu sunt deschise deloc.
+        """
+        known = {row['filename']: row for row in self._conn.execute(
+            "SELECT filename, mtime_ns, size, sha256 FROM tasks")}
+        added = updated = 0
+        seen = set()
+        for path in task_io.list_task_files(self.tasks_dir):
+            seen.add(path.name)
+            row = known.get(path.name)
+            if row is None:
+                added += self._index_file(path, None)
+            else:
+                updated += self._index_file(path, row)
+        removed = [name for name in known if name not in seen]
+        self._conn.executemany("DELETE FROM tasks WHERE filename = ?", [(name,) for name in removed])
+        self._conn.commit()
+        return added, updated, len(removed)
+
+    def _index_file(self, path, row):
+        """Actualizează rândul unui fișier dacă s-a schimbat; returnează 1 dacă a fost re-indexat"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0
+        if row is not None and row['mtime_ns'] == stat.st_mtime_ns and row['size'] == stat.st_size:
+            return 0
+        sha256 = file_sha256(path)
+        if row is not None and row['sha256'] == sha256:
+            # Doar atins (ex: copiat) - statisticile rămân valabile
+            self._conn.execute("UPDATE tasks SET mtime_ns = ?, size = ? WHERE filename = ?",
+                               (stat.st_mtime_ns, stat.st_size, path.name))
+            return 0
+
+        values = dict.fromkeys(_COLUMNS)
+        values.update(filename=path.name, name=path.stem, mtime_ns=stat.st_mtime_ns,
+                      size=stat.st_size, sha256=sha256, event_count=0, duration=0.0, type_counts={})
+        try:
+            stats = task_io.read_task_stats(path)
+        except Exception as e:
+            values['error'] = str(e)
+        else:
+            for key in ('event_count', 'duration', 'bbox', 'type_counts', 'created', 'schedule', 'playback'):
+                values[key] = stats[key]
+        for key in _JSON_COLUMNS:
+            if values[key] is not None:
+                values[key] = json.dumps(values[key], ensure_ascii=False)
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO tasks ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            [values[key] for key in _COLUMNS])
+        return 1
+
+    def _row_to_dict(self, row):
+        entry = dict(row)
+        for key in _JSON_COLUMNS:
+            if entry[key] is not None:
+                entry[key] = json.loads(entry[key])
+        if entry['bbox'] is not None:
+            entry['bbox'] = tuple(entry['bbox'])
+        entry['path'] = self.tasks_dir / entry.pop('filename')
+        return entry
+
+    def list_tasks(self):
+        """Toate task-urile indexate, sortate după nume (fără refresh)"""
+        rows = self._conn.execute("SELECT * FROM tasks ORDER BY name, filename")
+        return [self._row_to_dict(row) for row in rows]
+
+    def names(self):
+        """
+        Fișierele task-urilor (pentru dropdown), în ordinea list_task_files.
+        Cu extensie: t.json, t.bebt și t.bebz sunt task-uri diferite.
+        """
+        return [row[0] for row in self._conn.execute("SELECT filename FROM tasks ORDER BY name, filename")]
+
+    def get(self, path):
+        """Intrarea unui fișier din folder, re-indexat doar dacă s-a schimbat (None dacă nu există)"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        row = self._conn.execute("SELECT mtime_ns, size, sha256 FROM tasks WHERE filename = ?",
+                                 (path.name,)).fetchone()
+        self._index_file(self.tasks_dir / path.name, row)
+        self._conn.commit()
+        row = self._conn.execute("SELECT * FROM tasks WHERE filename = ?", (path.name,)).fetchone()
+        return self._row_to_dict(row) if row is not None else None
+
+
+def task_info(path, tasks_dir=task_io.DEFAULT_TASKS_DIR):
+    """
+    Statisticile unui task. Pentru fișierele din `tasks_dir` se folosește
+    indexul; celelalte (sau dacă indexul nu poate fi folosit, ex: folder
+    read-only) sunt citite direct, fără să se scrie nimic pe disc.
+    """
+    path = Path(path)
+    entry = None
+    if Path(tasks_dir).is_dir() and path.resolve().parent == Path(tasks_dir).resolve():
+        try:
+            with TaskLibrary(tasks_dir) as library:
+                entry = library.get(path)
+        except (sqlite3.Error, OSError):
+            pass
+    if entry is None or entry['error']:
+        return task_io.read_task_stats(path)
+    return entry
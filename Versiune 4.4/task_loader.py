@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Background task loading
+Încărcarea unui task într-un thread separat: primele rânduri (preview),
+citirea completă, conversia în EventRope și compilarea planului de execuție.
+Thread-ul doar scrie starea în atributele job-ului; GUI-ul o citește
+periodic (ca la ProgressReporter), deci Tk rămâne pe thread-ul principal.
+
+Anularea (cancel) e verificată între etape și între loturile de evenimente;
+o citire de fișier deja începută se termină, dar rezultatul e ignorat.
+"""
+
+import itertools
+import threading
+
+import task_io
+from event_history import EventRope
+from event_store import EventStore
+from plan import compile_events
+from task_jsonl import is_jsonl_task, read_jsonl_header, iter_jsonl_events
+
+
+PREVIEW_ROWS = 200      # Rânduri afișate imediat, înainte de încărcarea completă
+BATCH_SIZE = 8192       # Evenimente convertite între două verificări de cancel
+
+# Etapele job-ului (atributul `stage`)
+STAGE_PREVIEW = 'preview'
+STAGE_READING = 'reading'
+STAGE_CONVERTING = 'converting'
+STAGE_COMPILING = 'compiling'
+STAGE_DONE = 'done'
+STAGE_ERROR = 'error'
+STAGE_CANCELLED = 'cancelled'
+
+FINAL_STAGES = (STAGE_DONE, STAGE_ERROR, STAGE_CANCELLED)
+
+
+class LoadCancelled(Exception):
+    """Încărcarea a fost anulată"""
+
+
+class TaskLoadJob:
+    """
+    Încarcă un task în fundal.
+
+    Atribute citite de GUI (scrise doar de thread-ul job-ului):
+        stage       etapa curentă (STAGE_*)
+        preview     primele PREVIEW_ROWS evenimente (listă de dict-uri) sau None
+        loaded      evenimente convertite până acum
+        total       numărul total de evenimente, 0 cât timp nu e cunoscut
+        data        dict-ul task-ului (fără 'events') când stage == STAGE_DONE
+        events      EventRope cu toate evenimentele
+        plan        ExecutionPlan compilat pentru `backend`
+        error       excepția, când stage == STAGE_ERROR
+    """
+
+    def __init__(self, path, backend):
+        self.path = path
+        self.backend = backend
+        self.stage = STAGE_PREVIEW
+        self.preview = None
+        self.loaded = 0
+        self.total = 0
+        self.data = None
+        self.events = None
+        self.plan = None
+        self.error = None
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="bebe-task-load", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def finished(self):
+        return self.stage in FINAL_STAGES
+
+    def percent(self):
+        """Progresul aproximativ (0-100): citire + conversie, compilarea la final"""
+        if self.stage == STAGE_DONE:
+            return 100
+        if self.stage == STAGE_COMPILING:
+            return 95
+        total = self.total
+        return min(90, int(self.loaded * 90 / total)) if total else 0
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _check_cancel(self):
+        if self._cancel.is_set():
+            raise LoadCancelled()
+
+    def _run(self):
+        try:
+            self._load()
+        except LoadCancelled:
+            self.stage = STAGE_CANCELLED
+        except Exception as e:
+            self.error = e
+            self.stage = STAGE_ERROR
+        else:
+            self.stage = STAGE_CANCELLED if self._cancel.is_set() else STAGE_DONE
+
+    def _load(self):
+        path = self.path
+        # Primele rânduri: .bebt și JSON cu 'chunks' le citesc direct, restul în flux.
+        # Erorile de format sunt raportate de citirea completă, cu mesajul potrivit.
+        try:
+            self.preview = task_io.read_event_range(path, 0, PREVIEW_ROWS)
+        except (OSError, ValueError):
+            self.preview = []
+        self._check_cancel()
+
+        self.stage = STAGE_READING
+        if is_jsonl_task(path):
+            # .jsonl se citește oricum în flux: conversia se face pe loturi
+            data = read_jsonl_header(path)
+            self.total = data.pop('event_count', 0) or 0
+            events = iter_jsonl_events(path)
+            try:
+                self.stage = STAGE_CONVERTING
+                store = self._convert(events)
+            finally:
+                events.close()
+        else:
+            data = task_io.load_task(path, validate=False)
+            task_io.validate_task(data)
+            events = data.pop('events')
+            self._check_cancel()
+            self.stage = STAGE_CONVERTING
+            if isinstance(events, EventStore):
+                # .bebt / .bebz vin deja ca EventStore
+                store = events
+                self.loaded = self.total = len(store)
+            else:
+                self.total = len(events)
+                store = self._convert(iter(events))
+        self._check_cancel()
+
+        self.stage = STAGE_COMPILING
+        rope = EventRope.from_events(store)
+        self.plan = compile_events(rope, self.backend)
+        self.data = data
+        self.events = rope
+
+    def _convert(self, events):
+        """EventStore construit pe loturi, cu progres și verificare de cancel"""
+        store = EventStore()
+        while True:
+            batch = list(itertools.islice(events, BATCH_SIZE))
+            if not batch:
+                break
+            store.extend(batch)
+            self.loaded += len(batch)
+            self._check_cancel()
+        if self.loaded > self.total:
+            self.total = self.loaded
+        return store
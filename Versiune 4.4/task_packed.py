@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Compressed task format (.bebz)
+Coloanele EventStore, delta-codate și comprimate (zlib sau lzma) în blocuri
+independente de BLOCK_SIZE evenimente, decodate bloc cu bloc la citire.
+
+    timestamp   microsecunde întregi, diferența față de evenimentul anterior;
+                octeții valorilor sunt regrupați pe planuri (byte shuffle),
+                ceea ce comprimă mult mai bine diferențe aproape constante
+    x, y        diferența față de ultima poziție a mouse-ului (rândurile de
+                tastatură repetă poziția anterioară, deci diferența e 0)
+    restul      valorile coloanelor ca atare (tip, buton/dx, pressed/dy, tastă)
+
+Diferențele sunt salvate în cel mai mic tip întreg cu semn care le cuprinde
+(8/16/32/64 biți), ales per bloc.
+
+Structură (little-endian):
+    header      MAGIC, versiune, codec, mărime bloc, număr evenimente,
+                lungime meta
+    meta        JSON UTF-8 comprimat: câmpurile task-ului, tabela de
+                string-uri, evenimentele ne-canonice ('extras')
+    blocuri     număr evenimente, typecode + lungimea fiecărei coloane
+                comprimate, apoi coloanele
+
+Timestamp-urile sunt rotunjite la microsecundă; evenimentele ne-canonice
+sunt păstrate integral în meta.
+"""
+
+import json
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate, chain
+from operator import sub
+from types import SimpleNamespace
+
+from event_store import EventStore, COLUMNS, T_SCROLL, decode_row
+
+
+MAGIC = b'BEBZ'
+FORMAT_VERSION = 1
+PACKED_EXTENSION = '.bebz'
+BLOCK_SIZE = 65536
+
+CODECS = {
+    # Nivelul 9 e de ~10x mai lent pe diferențe mici, pentru câțiva % în plus
+    'zlib': (1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (2, lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+DEFAULT_CODEC = 'zlib'
+_CODEC_BY_ID = {codec_id: (name, decompress) for name, (codec_id, _, decompress) in CODECS.items()}
+
+HEADER = struct.Struct('<4sHHIQI')      # magic, versiune, codec, bloc, evenimente, meta_length
+BLOCK_HEADER = struct.Struct(f'<I{len(COLUMNS)}s{len(COLUMNS)}I')  # evenimente, typecode-uri, lungimi
+
+DELTA_COLUMNS = ('timestamps', 'xs', 'ys')
+SHUFFLED_COLUMNS = ('timestamps',)
+DELTA_TYPECODES = ('b', 'h', 'i', 'q')
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+class PackedTaskError(ValueError):
+    """Fișier .bebz invalid sau cu versiune/codec necunoscut"""
+
+
+def is_packed_task(path):
+    """True dacă fișierul începe cu semnătura formatului comprimat"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _to_bytes(column):
+    if not _LITTLE_ENDIAN and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_bytes(typecode, data):
+    column = array(typecode)
+    column.frombytes(data)
+    if not _LITTLE_ENDIAN and column.itemsize > 1:
+        column.byteswap()
+    return column
+
+
+def _deltas(values):
+    """Diferențele succesive, în cel mai mic typecode cu semn care le cuprinde"""
+    deltas = list(map(sub, values, chain((0,), values)))
+    low = min(deltas, default=0)
+    high = max(deltas, default=0)
+    for typecode in DELTA_TYPECODES:
+        limit = 1 << (8 * array(typecode).itemsize - 1)
+        if -limit <= low and high < limit:
+            return array(typecode, deltas)
+    raise PackedTaskError("Diferență prea mare pentru 64 biți")
+
+
+def _shuffle(raw, itemsize):
+    """Octeții valorilor regrupați pe planuri: toți octeții 0, apoi toți octeții 1, ..."""
+    return b''.join(raw[plane::itemsize] for plane in range(itemsize))
+
+
+def _unshuffle(raw, itemsize):
+    count = len(raw) // itemsize
+    result = bytearray(len(raw))
+    for plane in range(itemsize):
+        result[plane::itemsize] = raw[plane * count:(plane + 1) * count]
+    return result
+
+
+def _encode_block(store, start, stop, compress):
+    types = store.types[start:stop]
+    micros = [round(timestamp * 1e6) for timestamp in store.timestamps[start:stop]]
+    # Rândurile fără poziție (tastatură, ne-canonice) repetă ultima poziție a mouse-ului
+    xs = store.xs[start:stop]
+    ys = store.ys[start:stop]
+    last_x = last_y = 0
+    for index, event_type in enumerate(types):
+        if event_type <= T_SCROLL:
+            last_x = xs[index]
+            last_y = ys[index]
+        else:
+            xs[index] = last_x
+            ys[index] = last_y
+
+    typecodes = []
+    payloads = []
+    for name, _ in COLUMNS:
+        if name == 'timestamps':
+            column = _deltas(micros)
+        elif name in ('xs', 'ys'):
+            column = _deltas(xs if name == 'xs' else ys)
+        else:
+            column = getattr(store, name)[start:stop]
+        raw = _to_bytes(column)
+        if name in SHUFFLED_COLUMNS:
+            raw = _shuffle(raw, column.itemsize)
+        typecodes.append(column.typecode)
+        payloads.append(compress(raw))
+    return (BLOCK_HEADER.pack(stop - start, ''.join(typecodes).encode('ascii'),
+                              *(len(payload) for payload in payloads))
+            + b''.join(payloads))
+
+
+def write_packed_task(path, data, codec=DEFAULT_CODEC):
+    """Scrie task-ul (dict cu 'events' ca EventStore sau listă de dict-uri) în format .bebz"""
+    if codec not in CODECS:
+        raise PackedTaskError(f"Codec necunoscut: {codec}")
+    codec_id, compress, _ = CODECS[codec]
+    events = data.get('events', [])
+    store = events if isinstance(events, EventStore) else EventStore.from_dicts(events)
+
+    meta = {key: value for key, value in data.items() if key != 'events'}
+    meta['strings'] = store.strings
+    meta['extras'] = {str(index): event for index, event in store.extras.items()}
+    meta_bytes = compress(json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    count = len(store)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, codec_id, BLOCK_SIZE, count, len(meta_bytes)))
+        f.write(meta_bytes)
+        for start in range(0, count, BLOCK_SIZE):
+            f.write(_encode_block(store, start, min(start + BLOCK_SIZE, count), compress))
+
+
+class PackedTask:
+    """
+    Task .bebz deschis pentru citire: header-ul și meta sunt citite imediat,
+    blocurile de evenimente la cerere (iter_blocks / iter_dicts).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        raw = self._file.read(HEADER.size)
+        if len(raw) < HEADER.size:
+            raise PackedTaskError("Header incomplet")
+        magic, version, codec_id, block_size, count, meta_length = HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise PackedTaskError("Nu este un fișier task comprimat BEBE")
+        if version != FORMAT_VERSION:
+            raise PackedTaskError(f"Versiune format necunoscută: {version}")
+        if codec_id not in _CODEC_BY_ID:
+            raise PackedTaskError(f"Codec necunoscut: {codec_id}")
+        self.codec, self._decompress = _CODEC_BY_ID[codec_id]
+        self.block_size = block_size
+        self.count = count
+        self.meta = json.loads(self._decompress(self._file.read(meta_length)).decode('utf-8'))
+        self.strings = self.meta.pop('strings', [])
+        self.extras = {int(index): event for index, event in self.meta.pop('extras', {}).items()}
+        self._blocks_offset = HEADER.size + meta_length
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def task_data(self):
+        """Câmpurile task-ului fără evenimente"""
+        return dict(self.meta)
+
+    def iter_blocks(self):
+        """Generator: (index primul eveniment, dict nume coloană -> array) pentru fiecare bloc"""
+        f = self._file
+        f.seek(self._blocks_offset)
+        start = 0
+        while start < self.count:
+            raw = f.read(BLOCK_HEADER.size)
+            if len(raw) < BLOCK_HEADER.size:
+                raise PackedTaskError("Bloc incomplet")
+            block_count, typecodes, *lengths = BLOCK_HEADER.unpack(raw)
+            columns = {}
+            for (name, typecode), stored_typecode, length in zip(COLUMNS, typecodes.decode('ascii'), lengths):
+                try:
+                    payload = self._decompress(f.read(length))
+                except (zlib.error, lzma.LZMAError) as e:
+                    raise PackedTaskError(f"Bloc corupt: {e}")
+                if name in SHUFFLED_COLUMNS:
+                    payload = _unshuffle(payload, array(stored_typecode).itemsize)
+                values = _from_bytes(stored_typecode, payload)
+                if name not in DELTA_COLUMNS:
+                    columns[name] = values
+                elif name == 'timestamps':
+                    columns[name] = array('d', [value / 1e6 for value in accumulate(values)])
+                else:
+                    columns[name] = array(typecode, accumulate(values))
+            if any(len(column) != block_count for column in columns.values()):
+                raise PackedTaskError("Bloc corupt")
+            yield start, columns
+            start += block_count
+
+    def iter_dicts(self):
+        """Evenimentele pe rând, decodate bloc cu bloc (memorie limitată la un bloc)"""
+        for start, columns in self.iter_blocks():
+            block = SimpleNamespace(strings=self.strings, **columns)
+            block.extras = {index - start: event for index, event in self.extras.items()
+                            if start <= index < start + len(block.types)}
+            for index in range(len(block.types)):
+                yield decode_row(block, index)
+
+    def to_store(self):
+        """EventStore cu toate blocurile decodate"""
+        columns = {name: array(typecode) for name, typecode in COLUMNS}
+        for _, block in self.iter_blocks():
+            for name, column in block.items():
+                columns[name].extend(column)
+        return EventStore.from_columns(columns, self.strings, self.extras)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_packed_task(path):
+    """Task-ul ca dict (ca la JSON), cu 'events' ca EventStore"""
+    with PackedTask(path) as task:
+        data = task.task_data()
+        data['events'] = task.to_store()
+    return data
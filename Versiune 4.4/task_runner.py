@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Task runner
+Programul din executabilele exportate. E același pentru toate task-urile
+(compilat o singură dată de runner_build.py); task-ul e citit la pornire
+din fișierul de lângă executabil, cu același nume și extensia .bebetask
+(un .bebz - vezi task_packed.py).
+
+Rulare din surse:  python task_runner.py tasks/demo.bebetask
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import task_io
+from plan import compile_events
+from scheduler import Schedule
+from task_scheduler import playback_loop_count
+from timing import TIMER_PRECISIONS, DEFAULT_TIMER_PRECISION
+
+
+PAYLOAD_EXTENSION = '.bebetask'
+START_DELAY = 3.0       # Secunde între mesajul de start și redare
+
+
+def payload_path(argv=None):
+    """Task-ul de rulat: argumentul din linia de comandă sau <executabil>.bebetask"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return Path(argv[0])
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).with_suffix(PAYLOAD_EXTENSION)
+    return Path(__file__).with_suffix(PAYLOAD_EXTENSION)
+
+
+def show_message(title, message):
+    try:
+        import ctypes
+        ctypes.windll.user32.MessageBoxW(None, message, title, 0)
+    except Exception:
+        print(f"{title}: {message}")
+
+
+def main(argv=None):
+    path = payload_path(argv)
+    title = f"{path.stem} - BEBE Task Runner"
+    try:
+        data = task_io.load_task(path)
+    except FileNotFoundError:
+        show_message(title, f"Lipseste fisierul task-ului: {path.name}\n"
+                            "Trebuie sa fie in acelasi folder cu executabilul.")
+        return 1
+    except Exception as e:
+        show_message(title, f"Task-ul nu poate fi citit: {e}")
+        return 1
+
+    events = data['events']
+    if not len(events):
+        show_message(title, 'Acest executabil nu contine niciun eveniment de redat.')
+        return 1
+    schedule = data.get('schedule')
+    if schedule and schedule.get('enabled') and not Schedule(schedule).allows(datetime.now()):
+        show_message(title, 'Executia este programata pentru un alt interval.')
+        return 0
+
+    playback = data.get('playback') or {}
+    loop_count, run_until_stop = playback_loop_count(playback)
+    speed = float(playback.get('speed', 1.0))
+    timer_precision = playback.get('timer_precision', DEFAULT_TIMER_PRECISION)
+    if timer_precision not in TIMER_PRECISIONS:
+        timer_precision = DEFAULT_TIMER_PRECISION
+
+    # Import întârziat: backend-ul de input e încărcat doar dacă task-ul rulează
+    from pynput.keyboard import Key
+    from hotkeys import get_hotkey_service
+    from player import TaskPlayer
+
+    player = TaskPlayer()
+    plan = compile_events(events, player.backend)
+    show_message(title, 'Task-ul va incepe in 3 secunde. Inchide acest mesaj pentru a continua.')
+    time.sleep(START_DELAY)
+
+    # ESC/F9 opresc redarea, ca în GUI
+    hotkeys = get_hotkey_service()
+    for key in (Key.f9, Key.esc):
+        hotkeys.register(key, player.stop)
+    try:
+        player.play_events(plan, speed=speed, loop_count=loop_count,
+                           run_until_stop=run_until_stop, timer_precision=timer_precision)
+    finally:
+        hotkeys.stop()
+    show_message(title, 'Task finalizat.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
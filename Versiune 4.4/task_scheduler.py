@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Multi-task scheduler
+Mai multe task-uri programate în același proces (și deci cu un singur set
+de hook-uri): task-urile din biblioteca de task-uri care au 'schedule',
+plus task-ul încărcat în GUI. Un singur task poate controla mouse-ul și
+tastatura la un moment dat; ce se întâmplă când o programare se declanșează
+în timpul altei redări decide politica 'overlap' din schedule:
+
+    skip     nu rulează acum; reîncercat când player-ul devine liber, cât
+             timp fereastra programării permite (comportamentul vechi)
+    queue    intră în coadă (ordonată după prioritate) și rulează după
+             redarea curentă, chiar dacă fereastra s-a închis între timp
+    replace  oprește redarea curentă dacă aceasta are prioritate mai mică
+             sau egală (altfel ca 'queue'); o redare pornită manual nu e
+             niciodată întreruptă
+
+Planurile de execuție sunt compilate din timp (PREWARM_LEAD înainte de
+rulare) și păstrate într-un PlanCache, deci declanșarea injectează imediat.
+
+Cu un ScheduleStore, ultima rulare și istoricul rulărilor supraviețuiesc
+repornirii; ferestrele ratate cât timp procesul nu a rulat sunt tratate
+după 'catch_up' din schedule:
+
+    skip      ignorate (comportamentul vechi)
+    run_once  o singură rulare la pornire, oricâte ferestre au fost ratate
+    run_all   câte o rulare pentru fiecare fereastră ratată (cel mult
+              MAX_CATCH_UP_RUNS), prin coadă
+"""
+
+import heapq
+import itertools
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import task_io
+from plan import compile_events
+from scheduler import Scheduler, MAX_WAIT
+from schedule_store import OUTCOME_COMPLETED, OUTCOME_STOPPED, OUTCOME_FAILED
+
+
+OVERLAP_POLICIES = ('skip', 'queue', 'replace')
+DEFAULT_OVERLAP = 'skip'
+DEFAULT_PRIORITY = 0
+CATCH_UP_POLICIES = ('skip', 'run_once', 'run_all')
+DEFAULT_CATCH_UP = 'skip'
+MAX_CATCH_UP_RUNS = 10
+
+PREWARM_LEAD = 120.0    # Secunde înainte de rulare la care planul e compilat
+PLAN_CACHE_SIZE = 4     # Planuri păstrate (task-urile care urmează)
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_priority(config):
+    try:
+        return int((config or {}).get('priority', DEFAULT_PRIORITY))
+    except (TypeError, ValueError):
+        return DEFAULT_PRIORITY
+
+
+def schedule_overlap(config):
+    overlap = (config or {}).get('overlap', DEFAULT_OVERLAP)
+    return overlap if overlap in OVERLAP_POLICIES else DEFAULT_OVERLAP
+
+
+def schedule_catch_up(config):
+    catch_up = (config or {}).get('catch_up', DEFAULT_CATCH_UP)
+    return catch_up if catch_up in CATCH_UP_POLICIES else DEFAULT_CATCH_UP
+
+
+def playback_loop_count(playback):
+    """(loop_count, run_until_stop) din setările de redare, ca la rularea programată din GUI"""
+    playback = playback or {}
+    run_until_stop = bool(playback.get('run_until_stop', False))
+    if run_until_stop:
+        return 999999, True     # Rulează până la stop (ESC/F9 sau comanda stop)
+    if playback.get('loop', False):
+        return int(playback.get('loop_count', 1)), False
+    return 1, False
+
+
+class ScheduledTask:
+    """
+    Un task programat.
+
+    Args:
+        key: Identificator unic (numele fișierului pentru task-urile din bibliotecă)
+        name: Numele afișat
+        schedule: Configurația 'schedule' a task-ului (include 'priority',
+            'overlap' și 'catch_up')
+        load_events: Funcție fără argumente -> evenimentele task-ului
+        version: Funcție fără argumente -> valoare care se schimbă când se
+            schimbă evenimentele (invalidează planul din cache)
+        playback: Setările de redare salvate în task ('speed', 'timer_precision', ...)
+    """
+
+    def __init__(self, key, name, schedule, load_events, version, playback=None):
+        self.key = key
+        self.name = name
+        self.schedule = schedule
+        self.load_events = load_events
+        self.version = version
+        self.playback = dict(playback or {})
+        # Loop / Run Continuously salvate la programare au prioritate
+        self.playback.update((schedule or {}).get('playback') or {})
+        self.priority = schedule_priority(schedule)
+        self.overlap = schedule_overlap(schedule)
+        self.catch_up = schedule_catch_up(schedule)
+        self.from_library = False   # Sincronizat de sync_library()
+
+    @classmethod
+    def from_library_entry(cls, entry):
+        """Task din TaskLibrary.list_tasks(); evenimentele sunt citite abia la compilare"""
+        path = entry['path']
+        version = (entry['mtime_ns'], entry['size'])
+
+        def load_events():
+            return task_io.load_task(path)['events']
+        task = cls(path.name, entry['name'], entry['schedule'], load_events,
+                   lambda: version, entry.get('playback'))
+        task.from_library = True
+        return task
+
+
+class PlanCache:
+    """
+    LRU de ExecutionPlan-uri per task, invalidat când se schimbă versiunea task-ului.
+
+    Citirea și compilarea se fac în afara lock-ului; un al doilea apel pentru
+    aceeași versiune (ex: precompilare + declanșare) așteaptă compilarea în curs.
+    """
+
+    def __init__(self, backend, size=PLAN_CACHE_SIZE):
+        self.backend = backend
+        self.size = size
+        self._plans = OrderedDict()     # key -> (versiune, plan)
+        self._loading = {}              # (key, versiune) -> Event, compilări în curs
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, task):
+        """Planul task-ului, compilat acum dacă nu e în cache"""
+        version = task.version()
+        loading_key = (task.key, version)
+        while True:
+            with self._lock:
+                cached = self._plans.get(task.key)
+                if cached is not None and cached[0] == version:
+                    self._plans.move_to_end(task.key)
+                    self.hits += 1
+                    return cached[1]
+                loading = self._loading.get(loading_key)
+                if loading is None:
+                    self.misses += 1
+                    self._loading[loading_key] = threading.Event()
+                    break
+            # Altcineva compilează aceeași versiune; dacă eșuează, se reîncearcă aici
+            loading.wait()
+        try:
+            plan = compile_events(task.load_events(), self.backend)
+            with self._lock:
+                self._plans[task.key] = (version, plan)
+                self._plans.move_to_end(task.key)
+                while len(self._plans) > self.size:
+                    self._plans.popitem(last=False)
+            return plan
+        finally:
+            with self._lock:
+                self._loading.pop(loading_key).set()
+
+    def contains(self, task):
+        version = task.version()
+        with self._lock:
+            cached = self._plans.get(task.key)
+        return cached is not None and cached[0] == version
+
+    def discard(self, key):
+        with self._lock:
+            self._plans.pop(key, None)
+
+
+class TaskScheduler:
+    """
+    Programările mai multor task-uri peste un Scheduler comun.
+
+    Args:
+        player: TaskPlayer-ul folosit (player.playing = dispozitivele sunt ocupate)
+        start_playback: Funcție (task, plan, playback) care pornește redarea
+            fără să blocheze; gazda (GUI/daemon) apelează playback_finished()
+            la final
+        scheduler: Scheduler existent (ex: cel al GUI-ului), altfel unul nou
+        store: ScheduleStore pentru starea persistentă și istoric (opțional)
+    """
+
+    def __init__(self, player, start_playback, scheduler=None, now=datetime.now, store=None):
+        self.player = player
+        self.start_playback = start_playback
+        self.scheduler = scheduler or Scheduler(now=now)
+        self._now = now
+        self.plans = PlanCache(player.backend)
+        self._tasks = {}
+        self._lock = threading.RLock()
+        self._pending = []              # heap (-prioritate, secvență, task, planificat, catch_up)
+        self._sequence = itertools.count()
+        self._running = None            # Task-ul pornit de scheduler care rulează acum
+        self.store = store
+        self._run_id = None             # Rândul din istoric al rulării curente
+        self._restored = set()          # Chei a căror stare salvată a fost deja citită
+        self._prewarm_cond = threading.Condition()
+        self._prewarm_thread = None
+        self._prewarm_failed = set()    # (cheie, versiune) care nu au putut fi compilate
+        self._stopped = False
+
+    # === Task-uri ===
+
+    def set_task(self, task):
+        """Adaugă sau înlocuiește un task programat"""
+        last_fire = last_seen = None
+        if self.store is not None and task.key not in self._restored:
+            # Prima programare a cheii în acest proces: starea de dinainte de repornire
+            self._restored.add(task.key)
+            last_fire, last_seen = self._store_call(self.store.job_state, task.key) or (None, None)
+        with self._lock:
+            self._tasks[task.key] = task
+        job = self.scheduler.add(task.key, task.schedule, self._on_fire, task.priority,
+                                 last_fire=last_fire)
+        if self.store is not None:
+            self._store_call(self.store.touch, [task.key])
+        if last_seen is not None:
+            self._catch_up(task, job.schedule.missed_windows(last_seen, self._now(), last_fire))
+        self._notify_prewarm()
+
+    def remove_task(self, key):
+        with self._lock:
+            self._tasks.pop(key, None)
+            self._pending = [entry for entry in self._pending if entry[2].key != key]
+            heapq.heapify(self._pending)
+        self.scheduler.remove(key)
+        self.plans.discard(key)
+        if self.store is not None:
+            self._restored.discard(key)
+            self._store_call(self.store.forget, key)
+
+    def _catch_up(self, task, missed):
+        """Ferestrele ratate cât timp procesul nu a rulat, după politica 'catch_up'"""
+        if not missed:
+            return
+        if task.catch_up == 'skip':
+            logger.info(f"Scheduled task {task.name!r}: {len(missed)} missed window(s) skipped")
+            return
+        runs = missed[-1:] if task.catch_up == 'run_once' else missed[-MAX_CATCH_UP_RUNS:]
+        logger.info(f"Scheduled task {task.name!r}: {len(missed)} missed window(s), "
+                    f"catching up with {len(runs)} run(s)")
+        with self._lock:
+            for planned in runs:
+                heapq.heappush(self._pending, (-task.priority, next(self._sequence), task, planned, True))
+        if self.scheduler.running:
+            self._start_next()
+
+    def get_task(self, key):
+        return self._tasks.get(key)
+
+    def tasks(self):
+        """(task, următoarea rulare) în ordinea rulărilor"""
+        result = []
+        for job in self.scheduler.jobs():
+            task = self._tasks.get(job.key)
+            if task is not None:
+                result.append((task, job.next_fire))
+        return result
+
+    def sync_library(self, library, exclude=()):
+        """
+        Programează task-urile din bibliotecă care au 'schedule' (cu excepția
+        cheilor din `exclude`, ex: task-ul încărcat în GUI); returnează numărul lor.
+        """
+        entries = {}
+        for entry in library.list_tasks():
+            key = entry['path'].name
+            if entry.get('schedule') and not entry.get('error') and key not in exclude:
+                entries[key] = entry
+        with self._lock:
+            stale = [key for key, task in self._tasks.items()
+                     if task.from_library and key not in entries]
+        for key in stale:
+            self.remove_task(key)
+        for key, entry in entries.items():
+            current = self._tasks.get(key)
+            version = (entry['mtime_ns'], entry['size'])
+            if current is not None and current.from_library and current.version() == version:
+                continue
+            self.set_task(ScheduledTask.from_library_entry(entry))
+        return len(entries)
+
+    # === Declanșare (thread-ul Scheduler-ului) ===
+
+    def _on_fire(self, job):
+        task = self._tasks.get(job.key)
+        if task is None:
+            return False
+        planned = job.next_fire     # Încă momentul planificat (actualizat după callback)
+        with self._lock:
+            start = self._claim(task)
+            if not start:
+                running = self._running
+                if task.overlap == 'skip':
+                    logger.info(f"Scheduled task {task.name!r} skipped: player busy")
+                    return False
+                self._enqueue(task, planned)
+                if task.overlap == 'replace' and running is not None and running.priority <= task.priority:
+                    logger.info(f"Scheduled task {task.name!r} replaces {running.name!r}")
+                    self.player.stop()
+                else:
+                    logger.info(f"Scheduled task {task.name!r} queued ({len(self._pending)} waiting)")
+                return True
+        if not self._launch(task, planned):
+            self._start_next()
+        return True
+
+    def enqueue(self, task):
+        """Rulează `task` acum dacă player-ul e liber, altfel după redarea curentă (coada)"""
+        with self._lock:
+            if not self._claim(task):
+                return 'queued' if self._enqueue(task) else 'already queued'
+        if self._start(task):
+            return 'started'
+        self._start_next()
+        return 'failed'
+
+    def _claim(self, task):
+        """Rezervă player-ul pentru `task` dacă e liber (sub lock); până la pornire restul așteaptă în coadă"""
+        if self.player.playing or self._running is not None:
+            return False
+        self._running = task
+        return True
+
+    def _enqueue(self, task, planned=None):
+        if any(entry[2].key == task.key and not entry[4] for entry in self._pending):
+            return False
+        heapq.heappush(self._pending, (-task.priority, next(self._sequence), task, planned, False))
+        return True
+
+    def _start(self, task, planned=None, catch_up=False):
+        """Pornește un task rezervat cu _claim (fără lock); dacă nu poate porni, eliberează player-ul"""
+        try:
+            plan = self.plans.get(task)
+        except Exception as e:
+            self._release(task)
+            logger.error(f"Scheduled task {task.name!r} could not be loaded: {e}")
+            if self.store is not None:
+                run_id = self._store_call(self.store.record_start, task.key, task.name,
+                                          planned, self._now(), catch_up)
+                if run_id is not None:
+                    self._store_call(self.store.record_finish, run_id, OUTCOME_FAILED, str(e))
+            return False
+        if not len(plan):
+            self._release(task)
+            logger.warning(f"Scheduled task {task.name!r} has no events")
+            return False
+        if self.store is not None:
+            self._run_id = self._store_call(self.store.record_start, task.key, task.name,
+                                            planned, self._now(), catch_up)
+        logger.info(f"Starting scheduled task {task.name!r} (priority {task.priority}"
+                    f"{', catch-up' if catch_up else ''})")
+        try:
+            self.start_playback(task, plan, task.playback)
+        except Exception as e:
+            logger.error(f"Scheduled task {task.name!r} could not be started: {e}")
+            with self._lock:
+                run_id, self._run_id = self._run_id, None
+            if run_id is not None:
+                self._store_call(self.store.record_finish, run_id, OUTCOME_FAILED, str(e))
+            self._release(task)
+            return False
+        return True
+
+    def _launch(self, task, planned=None, catch_up=False):
+        """
+        Pornește un task rezervat cu _claim. Un plan care nu e în cache (nu a
+        fost precompilat) e citit și compilat într-un thread separat, fără
+        lock: scheduler-ul și gazda (ex: thread-ul Tk) nu așteaptă după el.
+        """
+        if self.plans.contains(task):
+            return self._start(task, planned, catch_up)
+
+        def load_and_start():
+            if not self._start(task, planned, catch_up):
+                self._start_next()
+
+        threading.Thread(target=load_and_start, name="bebe-plan-load", daemon=True).start()
+        return True
+
+    def _release(self, task):
+        with self._lock:
+            if self._running is task:
+                self._running = None
+
+    def _start_next(self):
+        """Pornește următorul task din coadă dacă player-ul e liber (apelat fără lock)"""
+        while True:
+            with self._lock:
+                if not self._pending or not self._claim(self._pending[0][2]):
+                    return
+                _, _, task, planned, catch_up = heapq.heappop(self._pending)
+            if self._launch(task, planned, catch_up):
+                return
+
+    def playback_finished(self):
+        """Apelat de gazdă când redarea s-a terminat: pornește următorul task din coadă"""
+        with self._lock:
+            if self._run_id is not None:
+                outcome = OUTCOME_STOPPED if self.player.stop_requested else OUTCOME_COMPLETED
+                self._store_call(self.store.record_finish, self._run_id, outcome,
+                                 self.player.progress.error)
+                self._run_id = None
+            self._running = None
+        self._start_next()
+        self.scheduler.wake()
+        self._notify_prewarm()
+
+    def history(self, limit=20):
+        """Ultimele rulări din ScheduleStore (listă goală fără store)"""
+        if self.store is None:
+            return []
+        return self._store_call(self.store.recent_runs, limit) or []
+
+    def _store_call(self, method, *args):
+        # Starea persistentă nu trebuie să oprească redarea (ex: fișier blocat)
+        try:
+            return method(*args)
+        except sqlite3.Error as e:
+            logger.warning(f"Scheduler state not saved: {e}")
+            return None
+
+    def pending(self):
+        """Task-urile din coadă, în ordinea în care vor rula"""
+        with self._lock:
+            return [entry[2] for entry in sorted(self._pending)]
+
+    def clear_pending(self):
+        with self._lock:
+            self._pending = []
+
+    @property
+    def running_task(self):
+        return self._running
+
+    # === Pornire / oprire și precompilare ===
+
+    def start(self):
+        self._stopped = False
+        self.scheduler.start()
+        self._start_next()  # Rulările de recuperare adăugate înainte de pornire
+        if self._prewarm_thread is None:
+            self._prewarm_thread = threading.Thread(target=self._prewarm_loop,
+                                                    name="bebe-plan-prewarm", daemon=True)
+            self._prewarm_thread.start()
+
+    def stop(self):
+        self._stopped = True
+        self._notify_prewarm()
+        self.scheduler.stop()
+        self._prewarm_thread = None
+        self._heartbeat()
+
+    def _heartbeat(self):
+        """Programările active acum (pentru ferestrele ratate după o oprire)"""
+        if self.store is None:
+            return
+        with self._lock:
+            keys = list(self._tasks)
+        if keys:
+            self._store_call(self.store.touch, keys)
+
+    def _notify_prewarm(self):
+        with self._prewarm_cond:
+            self._prewarm_cond.notify()
+
+    def _prewarm_loop(self):
+        """Compilează planurile task-urilor care rulează în următoarele PREWARM_LEAD secunde"""
+        while not self._stopped:
+            self._heartbeat()   # Cel puțin o dată la MAX_WAIT
+            wait = MAX_WAIT
+            horizon = self._now() + timedelta(seconds=PREWARM_LEAD)
+            for task, next_fire in self.tasks():
+                if next_fire is None:
+                    continue
+                if next_fire <= horizon:
+                    failed_key = (task.key, task.version())
+                    if not self.plans.contains(task) and failed_key not in self._prewarm_failed:
+                        try:
+                            self.plans.get(task)
+                            logger.info(f"Plan ready for scheduled task {task.name!r} (runs {next_fire:%H:%M})")
+                        except Exception as e:
+                            self._prewarm_failed.add(failed_key)
+                            logger.error(f"Prewarm failed for {task.name!r}: {e}")
+                else:
+                    wait = min(wait, (next_fire - horizon).total_seconds())
+                    break   # tasks() e sortat după următoarea rulare
+            with self._prewarm_cond:
+                if not self._stopped:
+                    self._prewarm_cond.wait(max(wait, 1.0))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: CaptureRing (ordine după wraparound, overflow, high-water mark) și
+CaptureConsumer (ordine cronologică între ring-uri, inclusiv când o
+înregistrare mai veche ajunge după o golire).
+
+Rulare:  python -m unittest test_capture   (sau pytest)
+"""
+
+import unittest
+
+from capture import CaptureRing, CaptureConsumer, REC_MOUSE_MOVE, REC_KEY_PRESS
+
+
+def move(timestamp):
+    return (REC_MOUSE_MOVE, timestamp, 1, 2, None, None)
+
+
+def key(timestamp):
+    return (REC_KEY_PRESS, timestamp, 'a', None, None, None)
+
+
+class CaptureRingTest(unittest.TestCase):
+
+    def test_capacity_must_be_power_of_two(self):
+        with self.assertRaises(ValueError):
+            CaptureRing(12)
+
+    def test_wraparound_keeps_order(self):
+        ring = CaptureRing(8)
+        drained = []
+        for value in range(100):
+            ring.push(value)
+            if value % 5 == 4:
+                ring.drain(drained)
+        ring.drain(drained)
+        self.assertEqual(drained, list(range(100)))
+        self.assertEqual(ring.captured, 100)
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(ring.overflow, 0)
+        self.assertEqual(ring.high_water, 5)
+        self.assertEqual(ring._slots, [None] * 8)   # Golirea nu ține referințe
+
+    def test_overflow_drops_newest(self):
+        ring = CaptureRing(8)
+        results = [ring.push(value) for value in range(11)]
+        self.assertEqual(results, [True] * 8 + [False] * 3)
+        self.assertEqual(ring.overflow, 3)
+        self.assertEqual(ring.high_water, 8)
+        self.assertEqual(ring.drain([]), list(range(8)))
+        # După golire se poate scrie din nou, peste granița indexului
+        self.assertTrue(ring.push(99))
+        self.assertEqual(ring.drain([]), [99])
+        self.assertEqual(ring.overflow, 3)
+        self.assertEqual(ring.captured, 9)
+
+    def test_high_water_is_max_depth(self):
+        ring = CaptureRing(16)
+        for depth in (3, 7, 2):
+            for value in range(depth):
+                ring.push(value)
+            ring.drain([])
+        self.assertEqual(ring.high_water, 7)
+
+
+class CaptureConsumerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 10.0
+        self.handled = []
+        self.mouse = CaptureRing(8)
+        self.keyboard = CaptureRing(8)
+        self.consumer = CaptureConsumer([self.mouse, self.keyboard], self.handled.append,
+                                        holdback=0.02, clock=lambda: self.now)
+
+    def timestamps(self):
+        return [record[1] for record in self.handled]
+
+    def test_merges_rings_chronologically(self):
+        for timestamp in (9.0, 9.2, 9.4):
+            self.mouse.push(move(timestamp))
+        for timestamp in (9.1, 9.3):
+            self.keyboard.push(key(timestamp))
+        self.assertEqual(self.consumer.drain(), 5)
+        self.assertEqual(self.timestamps(), [9.0, 9.1, 9.2, 9.3, 9.4])
+
+    def test_late_record_is_not_reordered(self):
+        # Tasta (10.0) e deja în ring, mișcarea (9.995) e împinsă după prima golire
+        self.keyboard.push(key(10.0))
+        self.mouse.push(move(9.95))
+        self.assertEqual(self.consumer.drain(), 1)
+        self.assertEqual(self.timestamps(), [9.95])
+        self.mouse.push(move(9.995))
+        self.now = 10.03
+        self.assertEqual(self.consumer.drain(), 2)
+        self.assertEqual(self.timestamps(), [9.95, 9.995, 10.0])
+
+    def test_stop_flushes_held_records(self):
+        self.keyboard.push(key(10.0))
+        self.mouse.push(move(9.999))
+        self.assertEqual(self.consumer.drain(), 0)
+        self.consumer.stop()
+        self.assertEqual(self.timestamps(), [9.999, 10.0])
+
+    def test_single_ring_is_not_held_back(self):
+        consumer = CaptureConsumer([self.mouse], self.handled.append, clock=lambda: self.now)
+        self.mouse.push(move(self.now))
+        self.assertEqual(consumer.drain(), 1)
+
+    def test_stats(self):
+        for value in range(10):
+            self.mouse.push(move(value))
+        self.keyboard.push(key(0.5))
+        self.consumer.stop()
+        self.assertEqual(self.consumer.stats(),
+                         {'capacity': 16, 'captured': 9, 'high_water': 8, 'overflow': 2})
+        self.assertEqual(len(self.handled), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: find_daemon ignoră fișierul de stare rămas de la un daemon oprit brusc
+(pid mort sau API care nu răspunde), ca GUI-ul să nu-i predea programările.
+
+Rulare:  python -m unittest test_daemon   (sau pytest)
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from bebe_daemon import STATE_FILENAME, find_daemon
+
+
+def dead_pid():
+    """Pid-ul unui proces deja terminat"""
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def free_port():
+    """Un port local pe care nu ascultă nimeni"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class FindDaemonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def write_state(self, **state):
+        with open(self.dir / STATE_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+    def test_no_state_file(self):
+        self.assertIsNone(find_daemon(self.dir))
+
+    def test_invalid_state_file(self):
+        self.write_state(port=1)
+        self.assertIsNone(find_daemon(self.dir))
+
+    def test_dead_pid(self):
+        self.write_state(host='127.0.0.1', port=free_port(), pid=dead_pid(), token='t')
+        self.assertIsNone(find_daemon(self.dir))
+
+    def test_api_not_answering(self):
+        # Pid refolosit de un proces în viață, dar nimic nu ascultă pe port
+        self.write_state(host='127.0.0.1', port=free_port(), pid=os.getpid(), token='t')
+        self.assertIsNone(find_daemon(self.dir, timeout=0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
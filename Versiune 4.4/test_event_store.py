@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: EventStore / EventView se comportă ca o listă de dict-uri - citire,
+set_field (inclusiv mutarea rândului în `extras` la o editare ne-canonică),
+ștergeri - iar EventRope (delete / set_fields) dă același rezultat ca
+aceleași editări aplicate pe o listă obișnuită.
+
+Rulare:  python -m unittest test_event_store   (sau pytest)
+"""
+
+import random
+import unittest
+
+from event_store import EventStore, EventView, TYPE_OTHER, T_MOVE, T_CLICK, as_event_dicts
+from event_history import EventRope
+
+EVENTS = [
+    {'type': 'mouse_move', 'x': -10, 'y': 20, 'timestamp': 0.5},
+    {'type': 'mouse_click', 'x': 1, 'y': 2, 'button': 'left', 'pressed': True, 'timestamp': 1.0},
+    {'type': 'mouse_scroll', 'x': 3, 'y': 4, 'dx': 0, 'dy': -1, 'timestamp': 1.5},
+    {'type': 'key_press', 'key': 'a', 'modifiers': ['ctrl'], 'timestamp': 2.0},
+    {'type': 'key_release', 'key': 'a', 'timestamp': 2.5},
+    {'type': 'note', 'text': 'ne-canonic', 'timestamp': 3.0},
+]
+
+
+def random_event(rng, timestamp):
+    kind = rng.randrange(6)
+    if kind == 0:
+        return {'type': 'mouse_move', 'x': rng.randint(-3000, 3000), 'y': rng.randint(-3000, 3000),
+                'timestamp': timestamp}
+    if kind == 1:
+        return {'type': 'mouse_click', 'x': 5, 'y': 6, 'button': rng.choice(('left', 'right')),
+                'pressed': rng.random() < 0.5, 'timestamp': timestamp}
+    if kind == 2:
+        return {'type': 'mouse_scroll', 'x': 0, 'y': 0, 'dx': 0, 'dy': rng.choice((-1, 1)),
+                'timestamp': timestamp}
+    if kind == 3:
+        return {'type': 'key_press', 'key': rng.choice('abc'), 'modifiers': [], 'timestamp': timestamp}
+    if kind == 4:
+        return {'type': 'key_release', 'key': rng.choice('abc'), 'timestamp': timestamp}
+    return {'type': 'note', 'text': str(timestamp), 'timestamp': timestamp}
+
+
+def random_change(rng):
+    """(câmp, valoare): fie o editare care rămâne pe coloane, fie una ne-canonică"""
+    return rng.choice((
+        ('x', rng.randint(-5000, 5000)),
+        ('y', rng.randint(-5000, 5000)),
+        ('timestamp', rng.random() * 100),
+        ('x', 1.5),
+        ('y', 2 ** 33),
+        ('button', 'middle'),
+        ('key', 'z'),
+        ('comment', 'editat'),
+    ))
+
+
+class EventStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = EventStore.from_dicts(EVENTS)
+
+    def test_rows_match_dicts(self):
+        self.assertEqual(len(self.store), len(EVENTS))
+        self.assertEqual(self.store.to_dicts(), EVENTS)
+        self.assertEqual(list(self.store.extras), [5])
+        self.assertEqual(self.store[-1], EVENTS[-1])
+        self.assertEqual(self.store[1:3], EVENTS[1:3])
+        with self.assertRaises(IndexError):
+            self.store[len(EVENTS)]
+
+    def test_event_view(self):
+        view = self.store[3]
+        self.assertIsInstance(view, EventView)
+        self.assertEqual(view['key'], 'a')
+        self.assertEqual(view['modifiers'], ['ctrl'])
+        self.assertEqual(view.get('x', 'none'), 'none')
+        with self.assertRaises(KeyError):
+            view['x']
+        self.assertEqual(list(view), ['type', 'key', 'modifiers', 'timestamp'])
+        self.assertIn('key', view)
+        self.assertNotIn('button', view)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(dict(view.items()), EVENTS[3])
+        self.assertEqual(view, self.store[3])
+        self.assertEqual(repr(view), repr(EVENTS[3]))
+
+    def test_canonical_edits_stay_in_columns(self):
+        self.store[0]['x'] = -2 ** 31
+        self.store[0]['timestamp'] = 7
+        self.store.set_field(-1, 'timestamp', 9.0)
+        self.assertEqual(self.store.types[0], T_MOVE)
+        self.assertEqual(self.store[0], {'type': 'mouse_move', 'x': -2 ** 31, 'y': 20, 'timestamp': 7.0})
+        self.assertEqual(self.store.timestamps[5], 9.0)
+        self.assertEqual(list(self.store.extras), [5])
+
+    def test_non_canonical_edit_moves_row_to_extras(self):
+        for key, value in (('x', 2 ** 31), ('x', 1.5), ('button', 'right'), ('note', 'x'), ('pressed', 1)):
+            with self.subTest(key=key, value=value):
+                store = EventStore.from_dicts(EVENTS)
+                store[1][key] = value
+                self.assertEqual(store.types[1], TYPE_OTHER)
+                self.assertEqual(store[1], dict(EVENTS[1], **{key: value}))
+                self.assertEqual(store.to_dicts()[2:], EVENTS[2:])
+                # Rândul rămâne editabil, timestamp-ul se ține și în coloană
+                store[1]['timestamp'] = 4.0
+                self.assertEqual(store.timestamps[1], 4.0)
+                self.assertEqual(store[1]['timestamp'], 4.0)
+        self.assertEqual(self.store.types[1], T_CLICK)
+
+    def test_delitem(self):
+        expected = list(EVENTS)
+        del self.store[1]
+        del expected[1]
+        self.assertEqual(self.store.to_dicts(), expected)
+        self.assertEqual(list(self.store.extras), [4])
+        del self.store[-2]
+        del expected[-2]
+        self.assertEqual(self.store.to_dicts(), expected)
+        with self.assertRaises(IndexError):
+            del self.store[10]
+
+    def test_delitem_slices(self):
+        for index in (slice(1, 4), slice(0, 6, 2), slice(None, None, -2), slice(4, 2), slice(-2, None)):
+            with self.subTest(index=index):
+                store = EventStore.from_dicts(EVENTS)
+                expected = list(EVENTS)
+                del store[index]
+                del expected[index]
+                self.assertEqual(store.to_dicts(), expected)
+                self.assertEqual(sorted(store.extras), [i for i, event in enumerate(expected)
+                                                        if event['type'] == 'note'])
+
+    def test_pop_and_clear(self):
+        self.assertEqual(self.store.pop(), EVENTS[-1])
+        self.assertEqual(self.store.pop(0), EVENTS[0])
+        self.assertEqual(self.store.extras, {})
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.to_dicts(), [])
+
+    def test_random_edits_match_list(self):
+        rng = random.Random(7)
+        expected = [random_event(rng, i * 0.01) for i in range(500)]
+        store = EventStore.from_dicts(expected)
+        expected = [dict(event) for event in expected]
+        for step in range(2000):
+            if rng.random() < 0.3 and expected:
+                index = rng.randrange(-len(expected), len(expected))
+                del store[index]
+                del expected[index]
+            elif rng.random() < 0.05:
+                start = rng.randrange(len(expected) + 1)
+                stop = start + rng.randrange(5)
+                del store[start:stop]
+                del expected[start:stop]
+            elif expected:
+                index = rng.randrange(len(expected))
+                key, value = random_change(rng)
+                store[index][key] = value
+                expected[index][key] = value
+            if step % 100 == 0:
+                self.assertEqual(store.to_dicts(), expected, step)
+        self.assertEqual(store.to_dicts(), expected)
+        self.assertEqual(as_event_dicts(EventStore.from_dicts(store.to_dicts())), expected)
+
+
+class EventRopeTest(unittest.TestCase):
+
+    def test_random_edits_match_list(self):
+        rng = random.Random(18)
+        expected = [random_event(rng, i * 0.01) for i in range(3000)]
+        rope = EventRope.from_events(expected, chunk_size=256)
+        expected = [dict(event) for event in expected]
+        versions = [(rope, [dict(event) for event in expected])]
+        for step in range(200):
+            if rng.random() < 0.5 and expected:
+                start = rng.randrange(len(expected))
+                indices = {min(start + rng.randrange(300), len(expected) - 1) for _ in range(rng.randrange(1, 40))}
+                rope = rope.delete(indices)
+                expected = [event for index, event in enumerate(expected) if index not in indices]
+            elif expected:
+                changes = {}
+                for _ in range(rng.randrange(1, 20)):
+                    key, value = random_change(rng)
+                    changes.setdefault(rng.randrange(len(expected)), {})[key] = value
+                rope = rope.set_fields(changes)
+                expected = [dict(event, **changes.get(index, {})) for index, event in enumerate(expected)]
+            self.assertEqual(len(rope), len(expected))
+            if step % 20 == 0:
+                self.assertEqual(rope.to_dicts(), expected, step)
+                versions.append((rope, [dict(event) for event in expected]))
+        self.assertEqual(rope.to_dicts(), expected)
+        # Versiunile vechi (pentru undo) nu sunt modificate de editările ulterioare
+        for version, events in versions:
+            self.assertEqual(version.to_dicts(), events)
+
+
+if __name__ == '__main__':
+    unittest.main()
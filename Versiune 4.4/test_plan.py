@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: compilarea în ExecutionPlan tolerează evenimentele invalide - ele devin
+NOOP la momentul evenimentului anterior, iar restul task-ului se compilează.
+
+Rulare:  python -m unittest test_plan   (sau pytest)
+"""
+
+import logging
+import unittest
+
+from backends import NullBackend
+from plan import compile_events, iter_compiled, OP_NOOP, OP_MOVE, OP_KEY_PRESS
+
+
+class IterCompiledTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger('plan').setLevel(logging.ERROR)
+
+    def test_invalid_events_become_noop(self):
+        events = [
+            {'type': 'mouse_move', 'x': 1, 'y': 2, 'timestamp': 0.5},
+            {'type': 'key_press', 'key': None, 'timestamp': 1.0},
+            {'type': 'key_press', 'key': ['a'], 'timestamp': 1.5},
+            {'type': 'key_release', 'key': 7, 'timestamp': 2.0},
+            {'type': 'mouse_move', 'x': 3, 'y': 4, 'timestamp': 'abc'},
+            {'type': 'key_press', 'key': 'a', 'timestamp': None},
+            {'type': 'mouse_move', 'x': 5, 'y': 6, 'timestamp': 3.0},
+        ]
+        compiled = list(iter_compiled(events, NullBackend()))
+        self.assertEqual(len(compiled), len(events))
+        self.assertEqual(compiled[0][0][0], OP_MOVE)
+        for op, timestamp in compiled[1:6]:
+            self.assertEqual(op, (OP_NOOP,))
+            self.assertEqual(timestamp, 0.5)
+        self.assertEqual(compiled[6][1], 3.0)
+        self.assertEqual(compiled[6][0][0], OP_MOVE)
+
+    def test_invalid_first_event_uses_zero(self):
+        plan = compile_events([{'type': 'key_press', 'key': None, 'timestamp': 4.0},
+                               {'type': 'key_press', 'key': 'a', 'timestamp': 5.0}],
+                              NullBackend())
+        self.assertEqual(plan.ops[0], (OP_NOOP,))
+        self.assertEqual(plan.ops[1][0], OP_KEY_PRESS)
+        self.assertEqual(list(plan.timestamps), [0.0, 5.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: stop()/pause() întrerup redarea în mai puțin de LIMIT_MS, și la
+mijlocul unei pauze lungi dintre evenimente, și în timpul combinațiilor
+de taste. Folosește NullBackend (nu mișcă mouse-ul, nu apasă taste).
+
+Rulare:  python -m unittest test_player_latency   (sau pytest)
+"""
+
+import logging
+import threading
+import time
+import unittest
+
+from player import TaskPlayer
+from backends import NullBackend
+from plan import compile_events
+from timing import TIMER_PRECISIONS, DEFAULT_TIMER_PRECISION
+
+LIMIT_MS = 5.0
+GAP_SECONDS = 300.0
+GAP_EVENTS = [
+    {'type': 'mouse_move', 'x': 10, 'y': 10, 'timestamp': 0.0},
+    {'type': 'mouse_move', 'x': 20, 'y': 20, 'timestamp': GAP_SECONDS},
+]
+COMBO_EVENTS = [{'type': 'key_press', 'key': 'ctrl+a', 'timestamp': 0.0}] * 100
+
+
+class ComboBackend(NullBackend):
+    """Semnalează flush()-ul dinaintea pauzei în care tastele combinației sunt ținute apăsate"""
+
+    def __init__(self):
+        super().__init__()
+        self.holding = threading.Event()
+
+    def flush(self):
+        super().flush()
+        self.holding.set()
+
+
+class PlayerLatencyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger('player').setLevel(logging.ERROR)
+
+    def start_player(self, events, precision, min_count):
+        player = TaskPlayer(backend=NullBackend())
+        plan = compile_events(events, player.backend)
+        thread = threading.Thread(target=player.play_events, args=(plan,),
+                                  kwargs={'speed': 1.0, 'timer_precision': precision}, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 2.0
+        while player.backend.count < min_count:
+            self.assertLess(time.monotonic(), deadline, "Redarea nu a pornit")
+            time.sleep(0.001)
+        time.sleep(0.05)
+        return player, thread
+
+    def assert_stops(self, player, thread):
+        player.stop()
+        thread.join(1.0)
+        self.assertFalse(thread.is_alive(), "Player-ul nu s-a oprit")
+        self.assertIsNotNone(player.stop_latency_ms)
+        self.assertLess(player.stop_latency_ms, LIMIT_MS)
+
+    def test_stop_during_long_gap(self):
+        for precision in TIMER_PRECISIONS:
+            with self.subTest(precision=precision):
+                player, thread = self.start_player(GAP_EVENTS, precision, 1)
+                self.assert_stops(player, thread)
+                self.assertEqual(player.backend.count, 1)
+
+    def test_pause_during_long_gap(self):
+        for precision in TIMER_PRECISIONS:
+            with self.subTest(precision=precision):
+                player, thread = self.start_player(GAP_EVENTS, precision, 1)
+                player.pause()
+                deadline = time.monotonic() + 1.0
+                while player.pause_latency_ms is None and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                latency = player.pause_latency_ms
+                player.stop()
+                thread.join(1.0)
+                self.assertIsNotNone(latency, "Player-ul nu a intrat în pauză")
+                self.assertLess(latency, LIMIT_MS)
+
+    def test_stop_during_key_combo(self):
+        player = TaskPlayer(backend=ComboBackend())
+        plan = compile_events(COMBO_EVENTS, player.backend)
+        thread = threading.Thread(target=player.play_events, args=(plan,),
+                                  kwargs={'speed': 1.0, 'timer_precision': DEFAULT_TIMER_PRECISION},
+                                  daemon=True)
+        thread.start()
+        self.assertTrue(player.backend.holding.wait(2.0), "Combinația nu a fost redată")
+        self.assert_stops(player, thread)
+        # Combinația întreruptă își eliberează tastele
+        self.assertEqual(player.backend.count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: ScheduleStore - rulările rămase 'running' devin 'interrupted' doar dacă
+procesul care le-a pornit nu mai există, forget() nu șterge starea unei
+programări a altui proces în viață, iar un fișier din versiunea 1 e migrat.
+
+Rulare:  python -m unittest test_schedule_store   (sau pytest)
+"""
+
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from schedule_store import (ScheduleStore, process_alive, OUTCOME_RUNNING, OUTCOME_INTERRUPTED,
+                            OUTCOME_COMPLETED)
+
+NOW = datetime(2026, 3, 2, 12, 0)
+
+
+def dead_pid():
+    """Pid-ul unui proces deja terminat"""
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+class ScheduleStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def open_store(self):
+        store = ScheduleStore(self.dir, now=lambda: NOW)
+        self.addCleanup(store.close)
+        return store
+
+    def set_owner(self, store, table, column, value, owner):
+        store._conn.execute(f"UPDATE {table} SET owner = ? WHERE {column} = ?", (owner, value))
+        store._conn.commit()
+
+    def outcome(self, store, run_id):
+        return store._conn.execute("SELECT outcome FROM runs WHERE id = ?", (run_id,)).fetchone()[0]
+
+    def test_process_alive(self):
+        self.assertTrue(process_alive(os.getpid()))
+        self.assertFalse(process_alive(dead_pid()))
+        self.assertFalse(process_alive(0))
+        self.assertFalse(process_alive(None))
+
+    def test_only_dead_owners_runs_are_interrupted(self):
+        store = self.open_store()
+        live = store.record_start('live', 'live', NOW, NOW)
+        dead = store.record_start('dead', 'dead', NOW, NOW)
+        orphan = store.record_start('orphan', 'orphan', NOW, NOW)
+        finished = store.record_start('done', 'done', NOW, NOW)
+        store.record_finish(finished, OUTCOME_COMPLETED)
+        self.set_owner(store, 'runs', 'id', live, f"{os.getppid()}:other")  # Ex: daemon-ul
+        self.set_owner(store, 'runs', 'id', dead, f"{dead_pid()}:gone")
+        self.set_owner(store, 'runs', 'id', orphan, None)                   # Rând din versiunea 1
+        own = store.record_start('own', 'own', NOW, NOW)
+        # Al doilea proces (ex: GUI-ul pornit cât daemon-ul rulează)
+        other = self.open_store()
+        self.assertEqual(self.outcome(other, live), OUTCOME_RUNNING)
+        self.assertEqual(self.outcome(other, dead), OUTCOME_INTERRUPTED)
+        self.assertEqual(self.outcome(other, orphan), OUTCOME_INTERRUPTED)
+        self.assertEqual(self.outcome(other, finished), OUTCOME_COMPLETED)
+        # Aceeași sesiune: rularea proprie din `store` e încă în curs
+        self.assertTrue(store.owner_alive(store.owner))
+        # Același pid, altă sesiune: pid refolosit al unui proces vechi
+        self.assertEqual(self.outcome(other, own), OUTCOME_INTERRUPTED)
+
+    def test_forget_keeps_keys_of_live_processes(self):
+        store = self.open_store()
+        store.touch(['own', 'live', 'dead'], NOW)
+        self.set_owner(store, 'job_state', 'key', 'live', f"{os.getppid()}:other")
+        self.set_owner(store, 'job_state', 'key', 'dead', f"{dead_pid()}:gone")
+        self.assertTrue(store.forget('own'))
+        self.assertFalse(store.forget('live'))
+        self.assertTrue(store.forget('dead'))
+        self.assertTrue(store.forget('missing'))
+        self.assertEqual(store.job_state('own'), (None, None))
+        self.assertEqual(store.job_state('live'), (None, NOW))
+        self.assertEqual(store.job_state('dead'), (None, None))
+
+    def test_touch_keeps_creator(self):
+        first = self.open_store()
+        second = self.open_store()
+        first.touch(['a'], NOW)
+        second.touch(['a'], NOW + timedelta(minutes=1))
+        second.record_start('a', 'a', NOW, NOW + timedelta(minutes=2))
+        owner = first._conn.execute("SELECT owner FROM job_state WHERE key = 'a'").fetchone()[0]
+        self.assertEqual(owner, first.owner)
+        self.assertEqual(first.job_state('a'), (NOW + timedelta(minutes=2), NOW + timedelta(minutes=2)))
+
+    def test_migrates_version_1(self):
+        conn = sqlite3.connect(str(self.dir / '.bebe_scheduler.sqlite'))
+        conn.executescript("""
+            CREATE TABLE job_state (key TEXT PRIMARY KEY, last_fire TEXT, last_seen TEXT NOT NULL);
+            CREATE TABLE runs (id INTEGER PRIMARY KEY, key TEXT NOT NULL, name TEXT NOT NULL,
+                planned TEXT, started TEXT NOT NULL, latency_ms REAL, finished TEXT,
+                outcome TEXT NOT NULL, catch_up INTEGER NOT NULL DEFAULT 0, error TEXT);
+            PRAGMA user_version = 1;
+        """)
+        conn.execute("INSERT INTO job_state VALUES ('a', NULL, ?)", (NOW.isoformat(),))
+        conn.execute("INSERT INTO runs (key, name, started, outcome) VALUES ('a', 'a', ?, 'running')",
+                     (NOW.isoformat(),))
+        conn.commit()
+        conn.close()
+        store = self.open_store()
+        self.assertEqual(store._conn.execute("PRAGMA user_version").fetchone()[0], 2)
+        self.assertEqual(store.recent_runs()[0]['outcome'], OUTCOME_INTERRUPTED)
+        self.assertEqual(store.job_state('a'), (None, NOW))
+        self.assertTrue(store.forget('a'))
+        run_id = store.record_start('b', 'b', NOW, NOW)
+        self.assertEqual(store.recent_runs(1)[0]['id'], run_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: un task salvat ca .json, .jsonl sau .bebt se citește înapoi identic -
+inclusiv evenimentele ne-canonice (păstrate în `extras`) și coordonatele
+negative (monitoare din stânga/deasupra celui principal) - iar header-ul și
+intervalele de evenimente se pot citi fără a încărca tot task-ul.
+La .bebz timestamp-urile revin la 1 µs, restul câmpurilor identic, și peste
+granița dintre blocuri, cu ambele codec-uri.
+
+Rulare:  python -m unittest test_task_formats   (sau pytest)
+"""
+
+import json
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from event_store import EventStore, TYPE_OTHER, as_event_dicts
+from task_io import CHUNK_SIZE, load_task, save_task, read_task_header, read_event_range
+from task_jsonl import convert_json_to_jsonl
+from task_packed import BLOCK_SIZE, CODECS, PackedTask, write_packed_task
+
+FORMATS = ('.json', '.jsonl', '.bebt')
+EVENT_COUNT = 2 * CHUNK_SIZE + 300
+
+# Evenimente pe care EventStore nu le poate pune pe coloane
+NON_CANONICAL = [
+    {'type': 'mouse_move', 'x': 10.5, 'y': -3, 'timestamp': 0.0},
+    {'type': 'mouse_move', 'x': 1, 'y': 2, 'window': 'Notepad', 'timestamp': 0.0},
+    {'type': 'mouse_move', 'x': 2 ** 40, 'y': 0, 'timestamp': 0.0},
+    {'type': 'key_press', 'key': 'a', 'timestamp': 0.0},
+    {'type': 'key_press', 'key': 'a', 'modifiers': ['ctrl,alt'], 'timestamp': 0.0},
+    {'type': 'gamepad', 'button': 3, 'timestamp': 0.0},
+]
+
+
+def make_events(count):
+    """Evenimente variate; la fiecare 97 unul ne-canonic"""
+    events = []
+    for i in range(count):
+        timestamp = i * 0.013 + 0.0004
+        kind = i % 6
+        if i % 97 == 0:
+            event = dict(NON_CANONICAL[(i // 97) % len(NON_CANONICAL)])
+        elif kind == 0:
+            event = {'type': 'mouse_move', 'x': -1920 + i % 400, 'y': -(i % 37), 'timestamp': 0.0}
+        elif kind == 1:
+            event = {'type': 'mouse_click', 'x': -5, 'y': 600, 'button': 'left',
+                     'pressed': i % 2 == 0, 'timestamp': 0.0}
+        elif kind == 2:
+            event = {'type': 'mouse_scroll', 'x': 3, 'y': -4, 'dx': 0, 'dy': -2, 'timestamp': 0.0}
+        elif kind == 3:
+            event = {'type': 'key_press', 'key': 'ă', 'modifiers': ['ctrl', 'shift'], 'timestamp': 0.0}
+        elif kind == 4:
+            event = {'type': 'key_press', 'key': 'Key.enter', 'modifiers': [], 'timestamp': 0.0}
+        else:
+            event = {'type': 'key_release', 'key': 'Key.enter', 'timestamp': 0.0}
+        event['timestamp'] = timestamp
+        events.append(event)
+    return events
+
+
+def make_task(events):
+    return {
+        'name': 'roundtrip',
+        'created': '2026-01-02T03:04:05',
+        'schedule': {'enabled': True, 'start_time': '08:00', 'end_time': '17:00'},
+        'playback': {'loop': True, 'loop_count': 3, 'speed': 1.5},
+        'events': events,
+    }
+
+
+class TaskFormatsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.events = make_events(EVENT_COUNT)
+        cls.task = make_task(cls.events)
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def save(self, suffix, task=None):
+        path = self.dir / f"task{suffix}"
+        save_task(path, task or self.task)
+        return path
+
+    def test_events_go_to_extras(self):
+        store = EventStore.from_dicts(NON_CANONICAL)
+        self.assertEqual(list(store.types), [TYPE_OTHER] * len(NON_CANONICAL))
+        self.assertEqual(as_event_dicts(store), NON_CANONICAL)
+
+    def test_round_trip(self):
+        for suffix in FORMATS:
+            with self.subTest(format=suffix):
+                data = load_task(self.save(suffix))
+                self.assertEqual(as_event_dicts(data['events']), self.events)
+                for key in ('name', 'created', 'schedule', 'playback'):
+                    self.assertEqual(data[key], self.task[key])
+
+    def test_round_trip_from_store(self):
+        store = EventStore.from_dicts(self.events)
+        self.assertEqual(len(store.extras), len(range(0, EVENT_COUNT, 97)))
+        for suffix in FORMATS:
+            with self.subTest(format=suffix):
+                data = load_task(self.save(suffix, make_task(store)))
+                self.assertEqual(as_event_dicts(data['events']), self.events)
+
+    def test_json_stays_valid(self):
+        with open(self.save('.json'), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['events'], self.events)
+
+    def test_read_task_header(self):
+        for suffix in FORMATS:
+            with self.subTest(format=suffix):
+                header = read_task_header(self.save(suffix))
+                self.assertNotIn('events', header)
+                self.assertEqual(header['event_count'], EVENT_COUNT)
+                self.assertEqual(header['schedule'], self.task['schedule'])
+                summary = header['summary']
+                self.assertAlmostEqual(summary['duration'], self.events[-1]['timestamp'] - self.events[0]['timestamp'])
+                self.assertEqual(sum(summary['type_counts'].values()), EVENT_COUNT)
+                self.assertEqual(summary['bbox'][:2], [-1920, -36])
+                self.assertEqual(summary['loop'], {'loop': True, 'loop_count': 3})
+        self.assertEqual(read_task_header(self.dir / 'task.json')['chunks']['size'], CHUNK_SIZE)
+
+    def test_read_event_range(self):
+        ranges = [(0, 10), (CHUNK_SIZE - 3, CHUNK_SIZE + 3), (2 * CHUNK_SIZE, 2 * CHUNK_SIZE + 1),
+                  (EVENT_COUNT - 5, EVENT_COUNT + 50), (7, 7), (EVENT_COUNT + 1, EVENT_COUNT + 9)]
+        for suffix in FORMATS:
+            path = self.save(suffix)
+            for start, stop in ranges:
+                with self.subTest(format=suffix, start=start, stop=stop):
+                    self.assertEqual(read_event_range(path, start, stop), self.events[start:stop])
+            with self.assertRaises(ValueError):
+                read_event_range(path, 5, 4)
+
+    def test_read_event_range_legacy_json(self):
+        # JSON indentat salvat de versiunile vechi: fără tabela 'chunks'
+        path = self.dir / 'legacy.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.task, f, indent=2, ensure_ascii=False)
+        self.assertEqual(read_event_range(path, CHUNK_SIZE - 2, CHUNK_SIZE + 2),
+                         self.events[CHUNK_SIZE - 2:CHUNK_SIZE + 2])
+        self.assertEqual(read_task_header(path)['event_count'], EVENT_COUNT)
+
+    def test_convert_json_to_jsonl(self):
+        target = self.dir / 'converted.jsonl'
+        self.assertEqual(convert_json_to_jsonl(self.save('.json'), target), EVENT_COUNT)
+        self.assertEqual(as_event_dicts(load_task(target)['events']), self.events)
+        header = read_task_header(target)
+        self.assertNotIn('chunks', header)
+        self.assertEqual(header['summary'], read_task_header(self.save('.jsonl'))['summary'])
+
+    def test_failed_convert_keeps_target(self):
+        source = self.dir / 'broken.json'
+        source.write_text('{"name": "b", "events": [{"type": "mouse_move", "x": 1, "y": 2, '
+                          '"timestamp": 0.0}, {broken', encoding='utf-8')
+        target = self.dir / 'old.jsonl'
+        target.write_text('previous', encoding='utf-8')
+        with self.assertRaises(ValueError):
+            convert_json_to_jsonl(source, target)
+        self.assertEqual(target.read_text(encoding='utf-8'), 'previous')
+        self.assertEqual(sorted(path.name for path in self.dir.iterdir()), ['broken.json', 'old.jsonl'])
+
+
+def make_packed_events(count):
+    """Evenimente cu timestamp-uri neregulate, salturi mari de poziție și pauze de ore"""
+    rng = random.Random(15)
+    events = make_events(count)
+    timestamp = 0.0
+    for i, event in enumerate(events):
+        timestamp += rng.random() * 0.05
+        if i % 5000 == 4999:
+            timestamp += 3 * 3600.0     # Diferență peste 32 de biți în microsecunde
+        event['timestamp'] = timestamp
+        if event['type'] == 'mouse_move' and i % 11 == 0:
+            event['x'] = rng.randint(-2 ** 31, 2 ** 31 - 1)
+            event['y'] = rng.choice((-1080, 0, 2159))
+    # Granița dintre blocuri: ne-canonic la ultimul rând, tastatură la primul rând al blocului 2
+    events[BLOCK_SIZE - 1] = {'type': 'gamepad', 'button': 1, 'timestamp': events[BLOCK_SIZE - 1]['timestamp']}
+    events[BLOCK_SIZE] = {'type': 'key_release', 'key': 'q', 'timestamp': events[BLOCK_SIZE]['timestamp']}
+    events[BLOCK_SIZE + 1] = {'type': 'mouse_move', 'x': -7, 'y': -9, 'timestamp': events[BLOCK_SIZE + 1]['timestamp']}
+    return events
+
+
+class PackedTaskTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.events = make_packed_events(BLOCK_SIZE + 300)
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def assert_events_match(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for index, (got, event) in enumerate(zip(actual, expected)):
+            got = dict(got)
+            timestamp = got.pop('timestamp')
+            event = dict(event)
+            self.assertLessEqual(abs(timestamp - event.pop('timestamp')), 1e-6, index)
+            self.assertEqual(got, event, index)
+
+    def test_round_trip_codecs(self):
+        for codec in CODECS:
+            for count in (BLOCK_SIZE - 1, BLOCK_SIZE, BLOCK_SIZE + 300):
+                with self.subTest(codec=codec, count=count):
+                    path = self.dir / f"{codec}-{count}.bebz"
+                    events = self.events[:count]
+                    write_packed_task(path, make_task(events), codec=codec)
+                    with PackedTask(path) as task:
+                        self.assertEqual(task.codec, codec)
+                        self.assertEqual(len(task), count)
+                        self.assertEqual([start for start, _ in task.iter_blocks()],
+                                         list(range(0, count, BLOCK_SIZE)))
+                        self.assert_events_match(list(task.iter_dicts()), events)
+                    data = load_task(path)
+                    self.assertEqual(data['playback'], make_task(events)['playback'])
+                    self.assert_events_match(as_event_dicts(data['events']), events)
+
+    def test_header_and_range(self):
+        path = self.dir / 'task.bebz'
+        save_task(path, make_task(self.events))
+        header = read_task_header(path)
+        self.assertNotIn('events', header)
+        self.assertEqual(header['event_count'], len(self.events))
+        self.assert_events_match(read_event_range(path, BLOCK_SIZE - 3, BLOCK_SIZE + 3),
+                                 self.events[BLOCK_SIZE - 3:BLOCK_SIZE + 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: TaskScheduler - politicile 'overlap' (skip / queue / replace), ordinea
+după prioritate a cozii, predarea player-ului între task-uri și eșecurile la
+încărcare sau pornire. Redarea e simulată (NullBackend + start_playback fals),
+iar declanșările sunt apelate direct, fără thread-ul Scheduler-ului.
+Cu un ScheduleStore temporar și `now` injectat: ferestrele ratate (inclusiv
+peste miezul nopții), politicile 'catch_up' și regula de cel mult o rulare
+pe minut după o repornire.
+
+Rulare:  python -m unittest test_task_scheduler   (sau pytest)
+"""
+
+import logging
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from backends import NullBackend
+from player import TaskPlayer
+from scheduler import DAY_KEYS, MAX_MISSED_DAYS, Schedule
+from schedule_store import ScheduleStore
+from task_scheduler import TaskScheduler, ScheduledTask
+
+NOW = datetime(2026, 3, 2, 12, 0)   # Luni
+EVENTS = [{'type': 'mouse_move', 'x': 1, 'y': 2, 'timestamp': 0.0}]
+
+
+def make_task(key, priority=0, overlap='queue', load_events=None, **schedule):
+    schedule = dict({'days': list(DAY_KEYS), 'priority': priority, 'overlap': overlap}, **schedule)
+    return ScheduledTask(key, key, schedule, load_events or (lambda: EVENTS), lambda: 1)
+
+
+class FakeHost:
+    """Gazda (GUI/daemon): pornește redarea fără să blocheze și raportează sfârșitul ei"""
+
+    def __init__(self):
+        self.player = TaskPlayer(backend=NullBackend())
+        self.started = []
+        self.failing = set()
+        self.start_event = threading.Event()
+
+    def start_playback(self, task, plan, playback):
+        if task.key in self.failing:
+            raise RuntimeError("playback could not start")
+        self.player.playing = True
+        self.player.stop_requested = False
+        self.started.append(task.key)
+        self.start_event.set()
+
+    def finish(self, task_scheduler):
+        self.player.playing = False
+        task_scheduler.playback_finished()
+
+
+class TaskSchedulerOverlapTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger('task_scheduler').setLevel(logging.CRITICAL)
+        logging.getLogger('scheduler').setLevel(logging.CRITICAL)
+
+    def setUp(self):
+        self.host = FakeHost()
+        self.scheduler = TaskScheduler(self.host.player, self.host.start_playback, now=lambda: NOW)
+
+    def add(self, key, priority=0, overlap='queue', load_events=None, prewarm=True):
+        task = make_task(key, priority, overlap, load_events)
+        self.scheduler.set_task(task)
+        if prewarm:
+            self.scheduler.plans.get(task)  # Plan în cache: pornirea se face pe loc
+        return task
+
+    def fire(self, key):
+        return self.scheduler._on_fire(SimpleNamespace(key=key, next_fire=NOW))
+
+    def pending_keys(self):
+        return [task.key for task in self.scheduler.pending()]
+
+    def test_starts_when_player_is_free(self):
+        task = self.add('a')
+        self.assertTrue(self.fire('a'))
+        self.assertEqual(self.host.started, ['a'])
+        self.assertIs(self.scheduler.running_task, task)
+        self.host.finish(self.scheduler)
+        self.assertIsNone(self.scheduler.running_task)
+
+    def test_skip_when_busy(self):
+        self.add('a')
+        self.add('b', overlap='skip')
+        self.fire('a')
+        self.assertFalse(self.fire('b'))
+        self.assertEqual(self.pending_keys(), [])
+        self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['a'])
+
+    def test_queue_runs_after_current(self):
+        self.add('a')
+        self.add('b', overlap='queue')
+        self.fire('a')
+        self.assertTrue(self.fire('b'))
+        self.assertTrue(self.fire('b'))     # Aceeași programare nu intră de două ori
+        self.assertEqual(self.pending_keys(), ['b'])
+        self.assertFalse(self.host.player.stop_requested)
+        self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['a', 'b'])
+        self.assertEqual(self.scheduler.running_task.key, 'b')
+
+    def test_replace_stops_lower_or_equal_priority(self):
+        for running_priority in (0, 3):
+            with self.subTest(running_priority=running_priority):
+                self.setUp()
+                self.add('a', priority=running_priority)
+                self.add('b', priority=3, overlap='replace')
+                self.fire('a')
+                self.fire('b')
+                self.assertTrue(self.host.player.stop_requested)
+                self.assertEqual(self.pending_keys(), ['b'])
+                self.host.finish(self.scheduler)
+                self.assertEqual(self.host.started, ['a', 'b'])
+
+    def test_replace_queues_behind_higher_priority(self):
+        self.add('a', priority=5)
+        self.add('b', priority=1, overlap='replace')
+        self.fire('a')
+        self.fire('b')
+        self.assertFalse(self.host.player.stop_requested)
+        self.assertEqual(self.pending_keys(), ['b'])
+
+    def test_replace_never_stops_manual_playback(self):
+        self.add('b', priority=100, overlap='replace')
+        self.host.player.playing = True     # Redare pornită din GUI
+        self.assertTrue(self.fire('b'))
+        self.assertFalse(self.host.player.stop_requested)
+        self.assertIsNone(self.scheduler.running_task)
+        self.assertEqual(self.pending_keys(), ['b'])
+        self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['b'])
+
+    def test_queue_is_ordered_by_priority(self):
+        self.add('a')
+        for key, priority in (('low', 1), ('high', 5), ('high2', 5), ('mid', 3)):
+            self.add(key, priority=priority)
+        self.fire('a')
+        for key in ('low', 'high', 'high2', 'mid'):
+            self.fire(key)
+        self.assertEqual(self.pending_keys(), ['high', 'high2', 'mid', 'low'])
+        for _ in range(4):
+            self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['a', 'high', 'high2', 'mid', 'low'])
+
+    def test_claim_holds_player_while_plan_loads(self):
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_events():
+            loading.set()
+            release.wait(5.0)
+            return EVENTS
+        self.add('a', load_events=slow_events, prewarm=False)
+        self.add('b')
+        self.assertTrue(self.fire('a'))     # Revine imediat, planul se încarcă în alt thread
+        self.assertTrue(loading.wait(5.0))
+        self.assertEqual(self.scheduler.running_task.key, 'a')
+        # Player-ul e încă liber, dar rezervat: 'b' așteaptă, la fel și o rulare cerută explicit
+        self.assertFalse(self.host.player.playing)
+        self.fire('b')
+        self.assertEqual(self.scheduler.enqueue(make_task('c')), 'queued')
+        self.assertEqual(self.host.started, [])
+        release.set()
+        self.assertTrue(self.host.start_event.wait(5.0))
+        self.assertEqual(self.host.started, ['a'])
+        self.host.finish(self.scheduler)
+        self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['a', 'b', 'c'])
+
+    def test_load_failure_hands_off_to_queue(self):
+        def broken_events():
+            raise OSError("file is gone")
+        self.add('a')
+        self.add('broken', load_events=broken_events, prewarm=False)
+        self.add('b')
+        self.fire('a')
+        self.fire('broken')
+        self.fire('b')
+        self.host.start_event.clear()
+        self.host.finish(self.scheduler)
+        self.assertTrue(self.host.start_event.wait(5.0))
+        self.assertEqual(self.host.started, ['a', 'b'])
+        self.assertEqual(self.scheduler.running_task.key, 'b')
+
+    def test_start_failure_releases_player(self):
+        self.add('a')
+        self.add('b')
+        self.host.failing.add('a')
+        self.assertTrue(self.fire('a'))
+        self.assertIsNone(self.scheduler.running_task)
+        self.fire('b')
+        self.assertEqual(self.host.started, ['b'])
+        # În coadă: un task care nu pornește nu blochează restul
+        self.host.failing.add('c')
+        self.add('c')
+        self.add('d')
+        self.fire('c')
+        self.fire('d')
+        self.host.finish(self.scheduler)
+        self.assertEqual(self.host.started, ['b', 'd'])
+        self.assertEqual(self.scheduler.running_task.key, 'd')
+
+    def test_enqueue_results(self):
+        task = self.add('a')
+        self.assertEqual(self.scheduler.enqueue(task), 'started')
+        self.assertEqual(self.scheduler.enqueue(task), 'queued')
+        self.assertEqual(self.scheduler.enqueue(task), 'already queued')
+        self.host.finish(self.scheduler)
+        self.host.finish(self.scheduler)
+        self.host.failing.add('a')
+        self.assertEqual(self.scheduler.enqueue(task), 'failed')
+        self.assertIsNone(self.scheduler.running_task)
+
+
+def at(day, hour, minute=0, second=0):
+    """Momentul din ziua `day` a săptămânii care începe cu NOW (0 = luni)"""
+    return NOW.replace(hour=hour, minute=minute, second=second) + timedelta(days=day)
+
+
+OVERNIGHT = {'days': ['monday', 'tuesday'], 'time_interval_enabled': True,
+             'time_from': '22:00', 'time_to': '06:00'}
+MORNING = {'time_interval_enabled': True, 'time_from': '09:00', 'time_to': '10:00'}
+
+
+class MissedWindowsTest(unittest.TestCase):
+
+    def test_overnight_windows(self):
+        schedule = Schedule(OVERNIGHT)
+        # Fereastra de luni seara se termină marți dimineață; cea de marți, miercuri
+        self.assertEqual(schedule.missed_windows(at(0, 20), at(3, 12)), [at(0, 22), at(1, 22)])
+        # O rulare în fereastra de luni o acoperă doar pe aceasta
+        self.assertEqual(schedule.missed_windows(at(0, 20), at(3, 12), last_fire=at(0, 23)), [at(1, 22)])
+
+    def test_overnight_window_in_progress(self):
+        schedule = Schedule(OVERNIGHT)
+        # Oprit la 02:00 în fereastra de luni-marți: ratată de la 02:00
+        self.assertEqual(schedule.missed_windows(at(1, 2), at(1, 12)), [at(1, 2)])
+        # Fereastra încă deschisă (marți 23:00) nu e ratată, rulează normal
+        self.assertEqual(schedule.missed_windows(at(1, 12), at(1, 23)), [])
+
+    def test_morning_part_needs_its_own_day(self):
+        # Ca în bucla veche: partea de după miezul nopții ține de ziua în care cade
+        sunday = Schedule(dict(OVERNIGHT, days=['sunday']))
+        self.assertEqual(sunday.missed_windows(at(-1, 12), at(0, 12)), [at(-1, 22)])
+        self.assertEqual(sunday.missed_windows(at(0, 0, 30), at(0, 12)), [])
+        weekend = Schedule(dict(OVERNIGHT, days=['sunday', 'monday']))
+        self.assertEqual(weekend.missed_windows(at(0, 0, 30), at(0, 12)), [at(0, 0, 30)])
+
+    def test_limited_to_max_missed_days(self):
+        schedule = Schedule(dict(MORNING, days=list(DAY_KEYS)))
+        missed = schedule.missed_windows(at(-30, 12), at(0, 12))
+        self.assertEqual(len(missed), MAX_MISSED_DAYS)
+        self.assertEqual(missed[0], at(-MAX_MISSED_DAYS + 1, 9))
+        self.assertEqual(missed[-1], at(0, 9))
+
+
+class CatchUpTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger('task_scheduler').setLevel(logging.CRITICAL)
+        logging.getLogger('scheduler').setLevel(logging.CRITICAL)
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.host = FakeHost()
+
+    def open_store(self, now):
+        store = ScheduleStore(self.dir, now=lambda: now)
+        self.addCleanup(store.close)
+        return store
+
+    def restart(self, now):
+        """Un proces nou: store-ul și TaskScheduler-ul citesc starea salvată"""
+        store = self.open_store(now)
+        task_scheduler = TaskScheduler(self.host.player, self.host.start_playback,
+                                       now=lambda: now, store=store)
+        self.addCleanup(task_scheduler.scheduler.stop)
+        return task_scheduler, store
+
+    def pending_planned(self, task_scheduler):
+        return [entry[3] for entry in sorted(task_scheduler._pending)]
+
+    def schedule_daily(self, catch_up, last_seen, now):
+        task_scheduler, store = self.restart(last_seen)
+        task_scheduler.set_task(make_task('daily', catch_up=catch_up, **MORNING))
+        task_scheduler.stop()   # Heartbeat: programarea era activă la last_seen
+        task_scheduler, store = self.restart(now)
+        task = make_task('daily', catch_up=catch_up, **MORNING)
+        task_scheduler.set_task(task)
+        return task_scheduler, store, task
+
+    def test_skip_ignores_missed_windows(self):
+        task_scheduler, _, _ = self.schedule_daily('skip', at(-3, 12), at(0, 12))
+        self.assertEqual(task_scheduler.pending(), [])
+
+    def test_run_once(self):
+        task_scheduler, store, task = self.schedule_daily('run_once', at(-3, 12), at(0, 12))
+        self.assertEqual(self.pending_planned(task_scheduler), [at(0, 9)])
+        task_scheduler.plans.get(task)
+        task_scheduler._start_next()
+        self.assertEqual(self.host.started, ['daily'])
+        run = store.recent_runs(1)[0]
+        self.assertTrue(run['catch_up'])
+        self.assertEqual(run['planned'], at(0, 9).isoformat())
+        self.assertEqual(run['latency_ms'], 3 * 3600 * 1000)
+
+    def test_run_all(self):
+        task_scheduler, _, task = self.schedule_daily('run_all', at(-3, 12), at(0, 12))
+        self.assertEqual(self.pending_planned(task_scheduler), [at(-2, 9), at(-1, 9), at(0, 9)])
+        task_scheduler.plans.get(task)
+        task_scheduler._start_next()
+        for _ in range(3):
+            self.host.finish(task_scheduler)
+        self.assertEqual(self.host.started, ['daily'] * 3)
+        self.assertIsNone(task_scheduler.running_task)
+
+    def test_run_all_is_capped(self):
+        with mock.patch('task_scheduler.MAX_CATCH_UP_RUNS', 2):
+            task_scheduler, _, _ = self.schedule_daily('run_all', at(-6, 12), at(0, 12))
+        # Cele mai recente ferestre
+        self.assertEqual(self.pending_planned(task_scheduler), [at(-1, 9), at(0, 9)])
+
+    def test_restart_keeps_one_run_per_minute(self):
+        task_scheduler, store = self.restart(at(0, 12, 0, 10))
+        task = make_task('minute')
+        task_scheduler.set_task(task)
+        task_scheduler.plans.get(task)
+        task_scheduler._on_fire(SimpleNamespace(key='minute', next_fire=at(0, 12)))
+        self.assertEqual(self.host.started, ['minute'])
+        # Repornit în același minut: următoarea rulare e abia în minutul următor
+        task_scheduler, store = self.restart(at(0, 12, 0, 40))
+        task_scheduler.set_task(make_task('minute'))
+        self.assertEqual(task_scheduler.tasks()[0][1], at(0, 12, 1))
+        self.assertEqual(task_scheduler.pending(), [])
+        # Fără starea salvată ar rula imediat
+        task_scheduler.remove_task('minute')
+        task_scheduler.set_task(make_task('minute'))
+        self.assertEqual(task_scheduler.tasks()[0][1], at(0, 12, 0, 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BEBE Task Recorder - Timing
+Ceas de redare cu deadline-uri absolute (fără drift cumulativ) și
+sleep hibrid sleep/spin calibrat la pornire
+"""
+
+import threading
+import time
+
+
+NS_PER_SEC = 1_000_000_000
+
+# Compromis CPU/precizie pentru așteptări:
+#   low      - doar time.sleep (CPU minim, depășiri de 1-15 ms)
+#   balanced - sleep până la marja calibrată, apoi spin cu cedare (time.sleep(0))
+#   high     - marjă dublă și spin pur (precizie sub-milisecundă, un core ocupat)
+TIMER_PRECISIONS = ('low', 'balanced', 'high')
+DEFAULT_TIMER_PRECISION = 'balanced'
+
+CALIBRATION_SAMPLES = 20
+MIN_SPIN_MARGIN_NS = 500_000        # 0.5 ms
+MAX_SPIN_MARGIN_NS = 20_000_000     # 20 ms (timer Windows implicit ~15.6 ms)
+
+_calibration_lock = threading.Lock()
+_calibrated_overshoot_ns = None
+
+
+def calibrate(samples=CALIBRATION_SAMPLES):
+    """
+    Măsoară cât depășește time.sleep() pe acest host.
+
+    Returnează depășirea (percentila ~90) în nanosecunde; rezultatul e păstrat
+    la nivel de modul, deci calibrarea se face o singură dată per proces.
+    """
+    global _calibrated_overshoot_ns
+    with _calibration_lock:
+        if _calibrated_overshoot_ns is not None:
+            return _calibrated_overshoot_ns
+        overshoots = []
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            time.sleep(0.001)
+            overshoots.append(time.perf_counter_ns() - start - 1_000_000)
+        overshoots.sort()
+        overshoot = overshoots[min(len(overshoots) - 1, int(len(overshoots) * 0.9))]
+        _calibrated_overshoot_ns = max(0, overshoot)
+        return _calibrated_overshoot_ns
+
+
+def calibrate_in_background():
+    """Pornește calibrarea într-un thread daemon (pentru startup-ul GUI)"""
+    thread = threading.Thread(target=calibrate, daemon=True)
+    thread.start()
+    return thread
+
+
+class HybridSleeper:
+    """Sleep grosier până la o marjă calibrată, apoi spin-wait până la deadline"""
+
+    def __init__(self, precision=DEFAULT_TIMER_PRECISION, overshoot_ns=None):
+        if precision not in TIMER_PRECISIONS:
+            precision = DEFAULT_TIMER_PRECISION
+        self.precision = precision
+        if overshoot_ns is None:
+            overshoot_ns = 0 if precision == 'low' else calibrate()
+        self.overshoot_ns = overshoot_ns
+        if precision == 'low':
+            self.spin_margin_ns = 0
+        else:
+            margin = overshoot_ns * (2 if precision == 'high' else 1)
+            self.spin_margin_ns = max(MIN_SPIN_MARGIN_NS, min(MAX_SPIN_MARGIN_NS, margin))
+
+    def sleep_until(self, deadline_ns, wake=None):
+        """
+        Așteaptă până la deadline (perf_counter_ns).
+
+        Dacă `wake` (threading.Event) e setat între timp, așteptarea se
+        întrerupe imediat și se returnează False; altfel True.
+        """
+        remaining = deadline_ns - time.perf_counter_ns()
+        if remaining <= 0:
+            return True
+        coarse = remaining - self.spin_margin_ns
+        if coarse > 0:
+            if wake is None:
+                time.sleep(coarse / NS_PER_SEC)
+            elif wake.wait(coarse / NS_PER_SEC):
+                return False
+        if self.precision == 'low':
+            return True
+        if wake is None:
+            if self.precision == 'high':
+                while time.perf_counter_ns() < deadline_ns:
+                    pass
+            else:
+                while time.perf_counter_ns() < deadline_ns:
+                    time.sleep(0)
+            return True
+        is_set = wake.is_set
+        if self.precision == 'high':
+            while time.perf_counter_ns() < deadline_ns:
+                if is_set():
+                    return False
+        else:
+            while time.perf_counter_ns() < deadline_ns:
+                if is_set():
+                    return False
+                time.sleep(0)
+        return True
+
+    def sleep(self, seconds):
+        """Înlocuitor pentru time.sleep() cu precizia configurată"""
+        self.sleep_until(time.perf_counter_ns() + int(seconds * NS_PER_SEC))
+
+
+_sleepers = {}
+
+
+def get_sleeper(precision=DEFAULT_TIMER_PRECISION):
+    """Sleeper partajat per nivel de precizie (calibrat la prima folosire)"""
+    if precision not in TIMER_PRECISIONS:
+        precision = DEFAULT_TIMER_PRECISION
+    sleeper = _sleepers.get(precision)
+    if sleeper is None:
+        sleeper = _sleepers[precision] = HybridSleeper(precision)
+    return sleeper
+
+
+class PlaybackClock:
+    """
+    Ceas monoton pentru redare.
+
+    Fiecare eveniment primește un deadline absolut calculat dintr-o origine
+    perf_counter_ns, nu un delay relativ față de evenimentul anterior. Timpul
+    pierdut la injectarea unui eveniment (sau depășirea unui sleep) nu se mai
+    adună: următorul deadline rămâne același, deci așteptarea se scurtează.
+    """
+
+    def __init__(self, speed=1.0, sleeper=None):
+        self.speed = speed
+        self.sleeper = sleeper
+        self._anchor_ns = None      # Momentul (perf_counter_ns) programat pentru ancoră
+        self._anchor_ts = 0.0       # Timestamp-ul (din task) al ancorei
+        self._last_deadline_ns = None
+        self._paused_at_ns = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Resetează statisticile de drift"""
+        self.events_timed = 0
+        self.drift_ns = 0           # Întârzierea ultimului eveniment față de deadline
+        self.max_drift_ns = 0
+        self.total_drift_ns = 0     # Suma întârzierilor (pentru medie)
+        self.paused_ns = 0          # Timp total petrecut în pauză
+
+    @staticmethod
+    def now_ns():
+        return time.perf_counter_ns()
+
+    def start(self, first_timestamp):
+        """Pornește ceasul: primul eveniment are deadline-ul acum"""
+        self._anchor_ns = self.now_ns()
+        self._anchor_ts = first_timestamp
+        self._last_deadline_ns = self._anchor_ns
+        self._paused_at_ns = None
+
+    def rebase(self, timestamp):
+        """
+        Reancorează ceasul la începutul unui nou loop.
+
+        Ancora este deadline-ul ultimului eveniment (nu momentul curent), astfel
+        încât întârzierile dintr-un loop nu se propagă în următorul.
+        """
+        if self._last_deadline_ns is None:
+            self.start(timestamp)
+            return
+        self._anchor_ns = self._last_deadline_ns
+        self._anchor_ts = timestamp
+
+    def deadline_ns(self, timestamp):
+        """Deadline absolut (perf_counter_ns) pentru un timestamp din task"""
+        offset = (timestamp - self._anchor_ts) / self.speed
+        deadline = self._anchor_ns + int(offset * NS_PER_SEC)
+        # Timestamp-uri editate pot fi ne-monotone - nu programăm în trecut
+        if self._last_deadline_ns is not None and deadline < self._last_deadline_ns:
+            deadline = self._last_deadline_ns
+        return deadline
+
+    def remaining_ns(self, deadline):
+        return deadline - self.now_ns()
+
+    def wait_until(self, deadline, wake=None):
+        """
+        Așteaptă până la deadline (fără efect dacă deadline-ul a trecut deja).
+
+        Returnează False dacă așteptarea a fost întreruptă de `wake`.
+        """
+        if self.sleeper is not None:
+            return self.sleeper.sleep_until(deadline, wake)
+        remaining = deadline - self.now_ns()
+        if remaining > 0:
+            if wake is None:
+                time.sleep(remaining / NS_PER_SEC)
+            elif wake.wait(remaining / NS_PER_SEC):
+                return False
+        return True
+
+    def mark(self, deadline):
+        """Înregistrează momentul real al execuției față de deadline"""
+        late = self.now_ns() - deadline
+        if late < 0:
+            late = 0
+        self._last_deadline_ns = deadline
+        self.events_timed += 1
+        self.drift_ns = late
+        self.total_drift_ns += late
+        if late > self.max_drift_ns:
+            self.max_drift_ns = late
+        return late
+
+    def pause(self):
+        """Marchează începutul pauzei"""
+        if self._paused_at_ns is None:
+            self._paused_at_ns = self.now_ns()
+
+    def resume(self):
+        """Mută originea cu durata pauzei, ca programul rămas să nu fie comprimat"""
+        if self._paused_at_ns is None:
+            return
+        paused = self.now_ns() - self._paused_at_ns
+        self._paused_at_ns = None
+        self.paused_ns += paused
+        if self._anchor_ns is not None:
+            self._anchor_ns += paused
+        if self._last_deadline_ns is not None:
+            self._last_deadline_ns += paused
+
+    def stats(self):
+        """Statistici de drift în milisecunde"""
+        mean = self.total_drift_ns / self.events_timed if self.events_timed else 0
+        return {
+            'events': self.events_timed,
+            'drift_ms': self.drift_ns / 1e6,
+            'max_drift_ms': self.max_drift_ns / 1e6,
+            'mean_drift_ms': mean / 1e6,
+            'paused_ms': self.paused_ns / 1e6,
+        }